@@ -0,0 +1 @@
+"""Benchmarks of the migration engine run against synthetic schemas, see README.md"""
@@ -0,0 +1,57 @@
+# Run with `python -m benchmarks.compare BASELINE.json CURRENT.json` from the root of the repository.
+
+from __future__ import annotations
+import json
+from pathlib import Path
+from typing import Any
+
+import typer
+
+app = typer.Typer(help="Compare two benchmark results files.")
+
+type Key = tuple[str, int, int, str]
+
+
+def load_results(path: Path) -> dict[Key, dict[str, Any]]:
+    """Map (provider, tables, columns, phase) to the measurement"""
+    report = json.loads(path.read_text())
+    return {
+        (r["provider"], r["tables"], r["columns"], r["phase"]): r
+        for r in report["results"]
+    }
+
+
+@app.command()
+def compare(
+    baseline: Path,
+    current: Path,
+    threshold: float = typer.Option(
+        1.25, help="Ratio of wall times above which a phase counts as a regression"
+    ),
+):
+    """
+    Print the ratio of wall time, queries and peak memory of every phase measured
+    in both files. Exits with code 1 when some wall time regressed over the threshold.
+    """
+
+    baseline_results = load_results(baseline)
+    current_results = load_results(current)
+    regressions = 0
+    for key in sorted(baseline_results.keys() & current_results.keys()):
+        old, new = baseline_results[key], current_results[key]
+        ratio = new["wall_time_s"] / max(old["wall_time_s"], 1e-9)
+        regressed = ratio > threshold
+        regressions += regressed
+        provider, tables, _, phase = key
+        typer.echo(
+            f"{provider:>8} {tables:>6} tables {phase:>10}:"
+            f" time x{ratio:6.2f}, queries {old['queries']:>6} -> {new['queries']:<6}"
+            f" memory x{new['peak_memory_bytes'] / max(old['peak_memory_bytes'], 1):6.2f}"
+            + ("  REGRESSION" if regressed else "")
+        )
+    if regressions:
+        raise typer.Exit(code=1)
+
+
+if __name__ == "__main__":
+    app()
@@ -0,0 +1,306 @@
+from __future__ import annotations
+from abc import ABC, abstractmethod
+from contextlib import contextmanager
+from dataclasses import dataclass
+import os
+from pathlib import Path
+import shutil
+import socket
+import sqlite3
+import subprocess
+import tempfile
+import threading
+import time
+import tracemalloc
+from typing import Any, Callable, Iterator
+
+import psycopg2
+import psycopg2.extensions
+
+from skibidi_orm.migration_engine.db_config.base_config import BaseDbConfig
+from skibidi_orm.migration_engine.db_config.postgres_config import PostgresConfig
+from skibidi_orm.migration_engine.db_config.sqlite3_config import SQLite3Config
+from skibidi_orm.migration_engine.db_inspectors.base_inspector import BaseDbInspector
+from skibidi_orm.migration_engine.db_inspectors.postgres_inspector import (
+    PostgresInspector,
+)
+from skibidi_orm.migration_engine.db_inspectors.sqlite.sqlite3_inspector import (
+    SQLite3Inspector,
+)
+from skibidi_orm.migration_engine.sql_executor.sqlite3_executor import SQLite3Executor
+
+
+@dataclass(frozen=True)
+class Measurement:
+    """Result of a single benchmarked phase"""
+
+    provider: str
+    tables: int
+    columns: int
+    phase: str
+    wall_time_s: float
+    queries: int
+    peak_memory_bytes: int
+
+
+class QueryCounter:
+    """
+    Counts the statements sent to the databases while active. SQLite3 connections
+    report every executed statement through a trace callback (statements run
+    internally, e.g. by the pragma functions, are skipped), psycopg2 connections
+    are created with a counting cursor class. The connections are pooled by the
+    database configs, so they have to be opened within instrumented().
+    """
+
+    current: QueryCounter | None = None
+
+    def __init__(self) -> None:
+        self.count = 0
+        self._lock = threading.Lock()
+
+    def increment(self, *_: Any) -> None:
+        with self._lock:
+            self.count += 1
+
+    @staticmethod
+    def increment_current(*_: Any) -> None:
+        if QueryCounter.current is not None:
+            QueryCounter.current.increment()
+
+    @staticmethod
+    def trace_sqlite3_statement(statement: str) -> None:
+        if not statement.startswith("--"):
+            QueryCounter.increment_current()
+
+    @contextmanager
+    def active(self) -> Iterator[None]:
+        """Count the statements of the instrumented connections executed in this block"""
+        QueryCounter.current = self
+        try:
+            yield
+        finally:
+            QueryCounter.current = None
+
+    @staticmethod
+    @contextmanager
+    def instrumented() -> Iterator[None]:
+        """Instrument all of the connections opened in this block"""
+        original_sqlite3_connect = sqlite3.connect
+        original_psycopg2_connect = psycopg2.connect
+
+        class CountingCursor(psycopg2.extensions.cursor):
+            def execute(self, query: Any, vars: Any = None) -> None:
+                QueryCounter.increment_current()
+                return super().execute(query, vars)
+
+            def executemany(self, query: Any, vars_list: Any) -> None:
+                QueryCounter.increment_current()
+                return super().executemany(query, vars_list)
+
+        def sqlite3_connect(*args: Any, **kwargs: Any) -> sqlite3.Connection:
+            connection = original_sqlite3_connect(*args, **kwargs)
+            connection.set_trace_callback(QueryCounter.trace_sqlite3_statement)
+            return connection
+
+        def psycopg2_connect(*args: Any, **kwargs: Any) -> Any:
+            return original_psycopg2_connect(
+                *args, cursor_factory=CountingCursor, **kwargs
+            )
+
+        sqlite3.connect = sqlite3_connect
+        psycopg2.connect = psycopg2_connect
+        try:
+            yield
+        finally:
+            sqlite3.connect = original_sqlite3_connect
+            psycopg2.connect = original_psycopg2_connect
+
+
+def measure[T](
+    provider: str,
+    tables: int,
+    columns: int,
+    phase: str,
+    action: Callable[[], T],
+    setup: Callable[[], None] = lambda: None,
+    repeat: int = 1,
+) -> tuple[Measurement, T]:
+    """
+    Benchmark the action, calling setup (not measured) before each run.
+    The best wall time and its query count come from runs without memory tracing,
+    the peak memory from one more run traced with tracemalloc.
+    """
+
+    best_time = float("inf")
+    queries = 0
+    result: Any = None
+    for _ in range(max(repeat, 1)):
+        setup()
+        counter = QueryCounter()
+        with counter.active():
+            start = time.perf_counter()
+            result = action()
+            wall_time = time.perf_counter() - start
+        if wall_time < best_time:
+            best_time, queries = wall_time, counter.count
+
+    setup()
+    tracemalloc.start()
+    try:
+        action()
+        _, peak_memory = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+
+    return (
+        Measurement(provider, tables, columns, phase, best_time, queries, peak_memory),
+        result,
+    )
+
+
+def reset_config() -> None:
+    """Allow instantiating the database config singleton again"""
+    setattr(BaseDbConfig, "_BaseDbConfig__instance", None)
+
+
+class BenchmarkDatabase(ABC):
+    """A throwaway database the benchmarks are run against"""
+
+    provider: str
+
+    @abstractmethod
+    def configure(self) -> None:
+        """Instantiate the database config of the migration engine"""
+        pass
+
+    @abstractmethod
+    def clear(self) -> None:
+        """Remove all tables from the database"""
+        pass
+
+    @abstractmethod
+    def execute(self, ddl: list[str]) -> None:
+        """Execute the statements creating the schema"""
+        pass
+
+    @abstractmethod
+    def create_inspector(self) -> BaseDbInspector:
+        pass
+
+
+class SQLite3BenchmarkDatabase(BenchmarkDatabase):
+    provider = "sqlite3"
+
+    def __init__(self, directory: Path) -> None:
+        self.db_path = directory.joinpath("benchmark.db")
+
+    def configure(self) -> None:
+        reset_config()
+        SQLite3Config(str(self.db_path))
+
+    def clear(self) -> None:
+        self.db_path.unlink(missing_ok=True)
+        self.db_path.touch()
+        self.configure()  # the pooled connections still use the removed file
+
+    def execute(self, ddl: list[str]) -> None:
+        SQLite3Executor.execute_sql("\n".join(ddl))
+
+    def create_inspector(self) -> BaseDbInspector:
+        return SQLite3Inspector()
+
+
+class PostgresBenchmarkDatabase(BenchmarkDatabase):
+    provider = "postgres"
+
+    def __init__(self, connection_parameters: dict[str, Any]) -> None:
+        self.connection_parameters = connection_parameters
+
+    def configure(self) -> None:
+        reset_config()
+        PostgresConfig(
+            db_name=self.connection_parameters["database"],
+            db_user=self.connection_parameters["user"],
+            db_password=self.connection_parameters["password"],
+            db_host=self.connection_parameters["host"],
+            db_port=self.connection_parameters["port"],
+        )
+
+    def clear(self) -> None:
+        self.execute(["DROP SCHEMA public CASCADE;", "CREATE SCHEMA public;"])
+
+    def execute(self, ddl: list[str]) -> None:
+        connection = PostgresConfig.get_instance().connection
+        with connection.cursor() as cursor:
+            for statement in ddl:
+                cursor.execute(statement)
+        connection.commit()
+
+    def create_inspector(self) -> BaseDbInspector:
+        return PostgresInspector()
+
+
+@contextmanager
+def throwaway_postgres(bin_dir: str | None = None) -> Iterator[dict[str, Any]]:
+    """
+    Start a temporary Postgres server using initdb and pg_ctl found in bin_dir
+    (or on the PATH), yields the parameters for connecting to it. The server and
+    its data directory are removed afterwards.
+    """
+
+    def binary(name: str) -> str:
+        path = shutil.which(name, path=bin_dir)
+        if path is None:
+            raise FileNotFoundError(
+                f"{name} not found, install Postgres or pass its bin directory"
+            )
+        return path
+
+    with tempfile.TemporaryDirectory(prefix="skibidi-bench-pg-") as directory:
+        data_dir = os.path.join(directory, "data")
+        with socket.socket() as s:
+            s.bind(("127.0.0.1", 0))
+            port = s.getsockname()[1]
+
+        subprocess.run(
+            [binary("initdb"), "-D", data_dir, "-U", "bench", "--auth=trust"],
+            check=True,
+            capture_output=True,
+        )
+        # durability is pointless for a throwaway server, creating thousands
+        # of tables in one transaction needs plenty of lock slots
+        options = (
+            f"-p {port} -h 127.0.0.1 -k {directory} -c fsync=off"
+            " -c synchronous_commit=off -c full_page_writes=off"
+            " -c max_locks_per_transaction=4096"
+        )
+        pg_ctl = binary("pg_ctl")
+        subprocess.run(
+            [
+                pg_ctl,
+                "-D",
+                data_dir,
+                "-o",
+                options,
+                "-l",
+                f"{directory}/log",
+                "-w",
+                "start",
+            ],
+            check=True,
+            capture_output=True,
+        )
+        try:
+            yield {
+                "user": "bench",
+                "password": "",
+                "host": "127.0.0.1",
+                "port": port,
+                "database": "postgres",
+            }
+        finally:
+            subprocess.run(
+                [pg_ctl, "-D", data_dir, "-m", "immediate", "-w", "stop"],
+                check=False,
+                capture_output=True,
+            )
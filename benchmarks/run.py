@@ -0,0 +1,236 @@
+# Run with `python -m benchmarks.run --help` from the root of the repository.
+
+from __future__ import annotations
+from dataclasses import asdict, replace
+from datetime import datetime, timezone
+import json
+import os
+from pathlib import Path
+import platform
+import sqlite3
+import subprocess
+import sys
+import tempfile
+from typing import Any, Optional
+
+import typer
+
+from benchmarks.harness import (
+    BenchmarkDatabase,
+    Measurement,
+    PostgresBenchmarkDatabase,
+    QueryCounter,
+    SQLite3BenchmarkDatabase,
+    measure,
+    reset_config,
+    throwaway_postgres,
+)
+from benchmarks.schema_generator import Table, changed_schema, generate_schema
+from skibidi_orm.migration_engine.adapters.database_objects.constraints import (
+    ConstraintType,
+)
+from skibidi_orm.migration_engine.converters.base.interfaces import SQLConverter
+from skibidi_orm.migration_engine.converters.postgres.all import PostgresConverter
+from skibidi_orm.migration_engine.converters.sqlite3.all import SQLite3Converter
+from skibidi_orm.migration_engine.operations.table_operations import (
+    CreateTableOperation,
+)
+from skibidi_orm.migration_engine.state_manager.state_manager import StateManager
+from skibidi_orm.migration_engine.state_manager.sharded_state_manager import (
+    ShardedStateManager,
+)
+from skibidi_orm.migration_engine.state_manager.operation_planner import (
+    OperationPlanner,
+)
+from skibidi_orm.migration_engine.state_manager.operation_optimizer import (
+    OperationOptimizer,
+)
+
+RESULTS_DIR = Path(__file__).parent.joinpath("results")
+CONVERTERS: dict[str, type[SQLConverter]] = {
+    "sqlite3": SQLite3Converter,
+    "postgres": PostgresConverter,
+}
+
+app = typer.Typer(help="Benchmarks of the migration engine on synthetic schemas.")
+
+
+def convert_tables(tables: list[Table], converter: type[SQLConverter]) -> list[str]:
+    """Convert the creation of the tables to SQL"""
+    table_converter = converter.get_table_operation_converter()
+    return [
+        table_converter.convert_table_operation_to_SQL(CreateTableOperation(table))
+        for table in tables
+    ]
+
+
+def without_defaults(tables: list[Table]) -> list[Table]:
+    """The converters do not support DEFAULT constraints yet, leave them out"""
+    return [
+        replace(
+            table,
+            columns=[
+                replace(
+                    column,
+                    column_constraints=[
+                        constraint
+                        for constraint in column.column_constraints
+                        if constraint.constraint_type != ConstraintType.DEFAULT
+                    ],
+                )
+                for column in table.columns
+            ],
+        )
+        for table in tables
+    ]
+
+
+def run_benchmarks(
+    database: BenchmarkDatabase,
+    sizes: list[int],
+    columns: int,
+    repeat: int,
+    seed: int,
+    diff_workers: int = 1,
+) -> list[Measurement]:
+    """Benchmark every phase of a migration for every schema size"""
+    with QueryCounter.instrumented():
+        database.configure()
+        results: list[Measurement] = []
+        for size in sizes:
+            schema = generate_schema(size, columns, seed)
+            target_tables = changed_schema(schema.tables, seed)
+            convertible_tables = without_defaults(schema.tables)
+
+            def phase(name: str, action: Any, setup: Any = lambda: None) -> Any:
+                measurement, result = measure(
+                    database.provider, size, columns, name, action, setup, repeat
+                )
+                results.append(measurement)
+                typer.echo(
+                    f"{database.provider:>8} {size:>6} tables {name:>10}:"
+                    f" {measurement.wall_time_s:9.4f} s, {measurement.queries:>6} queries,"
+                    f" {measurement.peak_memory_bytes / 2**20:8.2f} MiB"
+                )
+                return result
+
+            phase(
+                "conversion",
+                lambda: convert_tables(
+                    convertible_tables, CONVERTERS[database.provider]
+                ),
+            )
+            phase("execution", lambda: database.execute(schema.ddl), database.clear)
+            db_tables = phase(
+                "inspection", lambda: database.create_inspector().get_tables()
+            )
+            phase(
+                "diffing",
+                lambda: OperationPlanner.plan(
+                    OperationOptimizer.optimize(
+                        StateManager(
+                            db_tables=db_tables, schema_tables=target_tables
+                        ).get_operations_transforming_database_schema_into_class_hierarchy_schema()
+                    )
+                ),
+            )
+            if diff_workers > 1:
+                phase(
+                    "sharded",
+                    lambda: OperationPlanner.plan(
+                        OperationOptimizer.optimize(
+                            ShardedStateManager(
+                                db_tables=db_tables,
+                                schema_tables=target_tables,
+                                workers=diff_workers,
+                            ).get_operations_transforming_database_schema_into_class_hierarchy_schema()
+                        )
+                    ),
+                )
+    reset_config()
+    return results
+
+
+def get_commit() -> str:
+    """Hash of the benchmarked commit, 'unknown' outside of a git repository"""
+    try:
+        return subprocess.run(
+            ["git", "rev-parse", "HEAD"],
+            capture_output=True,
+            check=True,
+            text=True,
+            cwd=Path(__file__).parent,
+        ).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return "unknown"
+
+
+@app.command()
+def run(
+    sizes: list[int] = typer.Option(
+        [10, 100, 1000, 10000], "--size", "-n", help="Numbers of tables to benchmark"
+    ),
+    columns: int = typer.Option(10, "--columns", "-m", help="Columns per table"),
+    providers: list[str] = typer.Option(
+        ["sqlite3"], "--provider", "-p", help="sqlite3 and/or postgres"
+    ),
+    repeat: int = typer.Option(1, help="Runs per phase, the best time is reported"),
+    seed: int = typer.Option(0, help="Seed of the schema generator"),
+    diff_workers: int = typer.Option(
+        1, help="Also measure the sharded diff with this many worker processes"
+    ),
+    postgres_bin_dir: Optional[str] = typer.Option(
+        None, help="Directory with initdb and pg_ctl, PATH is searched by default"
+    ),
+    output: Optional[Path] = typer.Option(
+        None, "--output", "-o", help="Defaults to benchmarks/results/<commit>.json"
+    ),
+):
+    """
+    Generate synthetic schemas and measure wall time, query count and peak memory
+    of SQL conversion, execution, inspection and diffing. Postgres is benchmarked
+    on a throwaway server started for the run.
+    """
+
+    commit = get_commit()
+    results: list[Measurement] = []
+    with tempfile.TemporaryDirectory(prefix="skibidi-bench-") as directory:
+        # keep the persisted inspection cache out of the user's cache directory
+        os.environ["__SKIBIDI_INSPECTION_CACHE_DIR"] = os.path.join(directory, "cache")
+        for provider in providers:
+            if provider == "sqlite3":
+                database = SQLite3BenchmarkDatabase(Path(directory))
+                results += run_benchmarks(
+                    database, sizes, columns, repeat, seed, diff_workers
+                )
+            elif provider == "postgres":
+                with throwaway_postgres(postgres_bin_dir) as parameters:
+                    database = PostgresBenchmarkDatabase(parameters)
+                    results += run_benchmarks(
+                        database, sizes, columns, repeat, seed, diff_workers
+                    )
+            else:
+                raise typer.BadParameter(f"Unknown provider {provider}")
+
+    report: dict[str, Any] = {
+        "commit": commit,
+        "created_at": datetime.now(timezone.utc).isoformat(),
+        "python": sys.version.split()[0],
+        "sqlite": sqlite3.sqlite_version,
+        "platform": platform.platform(),
+        "parameters": {
+            "columns": columns,
+            "repeat": repeat,
+            "seed": seed,
+            "diff_workers": diff_workers,
+        },
+        "results": [asdict(result) for result in results],
+    }
+    output = output or RESULTS_DIR.joinpath(f"{commit[:12]}.json")
+    output.parent.mkdir(parents=True, exist_ok=True)
+    output.write_text(json.dumps(report, indent=2))
+    typer.echo(f"Results saved to {output}")
+
+
+if __name__ == "__main__":
+    app()
@@ -0,0 +1,144 @@
+from __future__ import annotations
+from dataclasses import dataclass
+import random
+from typing import Any, cast
+
+from skibidi_orm.migration_engine.adapters.base_adapter import BaseColumn, BaseTable
+import skibidi_orm.migration_engine.adapters.database_objects.constraints as c
+
+type Table = BaseTable[BaseColumn[Any]]
+
+# kinds of the generic columns, cycled through so every table gets a similar mix
+COLUMN_KINDS = ("unique", "not_null_default", "check", "default", "plain")
+
+
+@dataclass(frozen=True)
+class GeneratedSchema:
+    """Tables of a synthetic schema along with the DDL creating them"""
+
+    tables: list[Table]
+    ddl: list[str]
+
+
+def generate_schema(
+    tables_count: int, columns_count: int, seed: int = 0
+) -> GeneratedSchema:
+    """
+    Generate tables_count tables with columns_count columns each (at least two - the
+    primary key and a NOT NULL "code" column) plus foreign key columns.
+    Every table can be referenced through its primary key or, with a composite
+    foreign key, through its (id, code) pair. Foreign keys always reference tables
+    created earlier, so the DDL can be executed in order.
+    """
+
+    rng = random.Random(seed)
+    tables: list[Table] = []
+    ddl: list[str] = []
+    for i in range(tables_count):
+        table, statement = _generate_table(i, max(columns_count, 2), rng)
+        tables.append(table)
+        ddl.append(statement)
+    return GeneratedSchema(tables, ddl)
+
+
+def table_name(index: int) -> str:
+    return f"t{index:05d}"
+
+
+def _generate_table(
+    index: int, columns_count: int, rng: random.Random
+) -> tuple[Table, str]:
+    """Generate a single table, returns its model and its CREATE TABLE statement"""
+    name = table_name(index)
+    columns: list[BaseColumn[Any]] = [
+        BaseColumn("id", "INTEGER", [c.PrimaryKeyConstraint(name, "id")]),
+        BaseColumn("code", "INTEGER", [c.NotNullConstraint(name, "code")]),
+    ]
+    definitions = ["id INTEGER PRIMARY KEY", "code INTEGER NOT NULL"]
+    table_constraints: set[c.TableWideConstraint] = set()
+    table_definitions = ["UNIQUE (id, code)"]
+
+    for j in range(columns_count - 2):
+        column_name = f"c{j}"
+        kind = COLUMN_KINDS[j % len(COLUMN_KINDS)]
+        if kind == "unique":
+            columns.append(
+                BaseColumn(column_name, "TEXT", [c.UniqueConstraint(name, column_name)])
+            )
+            definitions.append(f"{column_name} TEXT UNIQUE")
+        elif kind == "not_null_default":
+            columns.append(
+                BaseColumn(
+                    column_name,
+                    "INTEGER",
+                    [
+                        c.NotNullConstraint(name, column_name),
+                        c.DefaultConstraint(name, column_name, "0"),
+                    ],
+                )
+            )
+            definitions.append(f"{column_name} INTEGER NOT NULL DEFAULT 0")
+        elif kind == "check":
+            condition = f"{column_name} >= 0"
+            columns.append(BaseColumn(column_name, "REAL", []))
+            table_constraints.add(c.CheckConstraint(name, condition))
+            definitions.append(f"{column_name} REAL CHECK ({condition})")
+        elif kind == "default":
+            columns.append(
+                BaseColumn(
+                    column_name,
+                    "TEXT",
+                    [c.DefaultConstraint(name, column_name, "'unknown'")],
+                )
+            )
+            definitions.append(f"{column_name} TEXT DEFAULT 'unknown'")
+        else:
+            columns.append(BaseColumn(column_name, "INTEGER", []))
+            definitions.append(f"{column_name} INTEGER")
+
+    if index > 0:
+        referenced_table = table_name(rng.randrange(index))
+        if index % 4 == 0:
+            column_mapping = {"ref_id": "id", "ref_code": "code"}
+        else:
+            column_mapping = {"ref_id": "id"}
+        for column_name in column_mapping:
+            columns.append(BaseColumn(column_name, "INTEGER", []))
+            definitions.append(f"{column_name} INTEGER")
+        table_constraints.add(
+            c.ForeignKeyConstraint(name, referenced_table, column_mapping)
+        )
+        table_definitions.append(
+            f"FOREIGN KEY ({', '.join(column_mapping.keys())}) REFERENCES"
+            f" {referenced_table} ({', '.join(column_mapping.values())})"
+        )
+
+    table = BaseTable(name, columns, table_constraints)
+    statement = f"CREATE TABLE {name} ({', '.join(definitions + table_definitions)});"
+    return cast(Table, table), statement
+
+
+def changed_schema(tables: list[Table], seed: int = 0) -> list[Table]:
+    """
+    Derive the schema the generated database should be migrated to: every tenth
+    table is dropped, every seventh gains a column and one new table is added per ten.
+    """
+
+    rng = random.Random(seed)
+    changed: list[Table] = []
+    for i, table in enumerate(tables):
+        if i % 10 == 9:
+            continue
+        columns = list(table.columns)
+        if i % 7 == 6:
+            columns.append(BaseColumn(f"added_{rng.randrange(1000)}", "TEXT", []))
+        changed.append(BaseTable(table.name, columns, set(table.table_constraints)))
+    for i in range(len(tables) // 10):
+        name = f"new_{i:05d}"
+        changed.append(
+            BaseTable(
+                name,
+                [BaseColumn("id", "INTEGER", [c.PrimaryKeyConstraint(name, "id")])],
+            )
+        )
+    return changed
@@ -12,13 +12,25 @@ import os
 # import shutil
 import sys
 from skibidi_orm.cli.migration_file_creator import create_migration_file
-from skibidi_orm.cli.utils import find_schema_file, load_schema_from_path
+from skibidi_orm.cli.utils import (
+    find_schema_file,
+    get_loaded_schema_path,
+    load_schema_from_path,
+)
 from skibidi_orm.exceptions.cli_exceptions import MultipleSchemaFilesError
+from skibidi_orm.exceptions.migration_plan_exceptions import (
+    InvalidMigrationPlanError,
+    StaleMigrationPlanError,
+)
 from skibidi_orm.migration_engine.adapters.base_adapter import BaseTable
 from skibidi_orm.migration_engine.adapters.database_objects.migration_element import (
     MigrationElement,
 )
 from skibidi_orm.migration_engine.db_config.base_config import BaseDbConfig
+from skibidi_orm.migration_engine.migration_plan import (
+    MigrationPlan,
+    get_database_inspector,
+)
 from skibidi_orm.migration_engine.revisions.manager import RevisionManager
 from skibidi_orm.migration_engine.revisions.revision import Revision
 from skibidi_orm.migration_engine.studio.server import run_server
@@ -88,22 +100,40 @@ def migrate(
         "-d",
         help="Use --direct to run the migration directly. Without the flag, it will create a python migration file.",
     ),
+    stream: bool = typer.Option(
+        False,
+        "--stream",
+        help="Use with --direct to execute the operations table by table, while the rest of the database is still being inspected.",
+    ),
+    plan: Union[None, Path] = typer.Option(
+        None,
+        "--plan",
+        help="Execute the migration plan saved by preview-migration --plan. Refuses to run if the database or the schema file changed since.",
+        show_default=False,
+    ),
 ):
     """
     Used to run migration for current schema file. Can accept an optional message as a description of the migration.
     """
+    if plan is not None:
+        try:
+            migration_plan = MigrationPlan.load(str(plan))
+            migration_plan.execute(get_loaded_schema_path())
+        except (InvalidMigrationPlanError, StaleMigrationPlanError) as e:
+            print(Fore.RED + f"{e} Aborting.")
+            raise typer.Exit(code=1)
+        save_revision(message, migration_plan.tables)
+        print("\nMigration complete. \n")
+        return
+
     m = MigrationElement()
     if direct:
-        m.migrate(preview=False)
-        tables: list[BaseTable[Any]] = m.adapter.tables  # type: ignore todo
-        manager = RevisionManager()
-        revision = Revision(
-            "No message provided" if message is None else message,  # type: ignore
-            "",  # this field is deprecated and to be removed in future versions
-            BaseDbConfig.get_instance().database_provider,
-            tables,  # type: ignore todo
-        )
-        manager.save_revision(revision)
+        if stream:
+            for i, operation in enumerate(m.stream_migration(preview=False)):
+                print(f"\t{i+1}) {operation}")
+        else:
+            m.migrate(preview=False)
+        save_revision(message, m.adapter.tables)  # type: ignore todo
         print("\nMigration complete. \n")
     else:
         create_migration_file(m)
@@ -111,22 +141,70 @@ def migrate(
     pass
 
 
+def save_revision(message: Union[str, None], tables: list[BaseTable[Any]]) -> None:
+    """
+    Save a revision of the given schema tables after a migration.
+    """
+    manager = RevisionManager()
+    revision = Revision(
+        "No message provided" if message is None else message,
+        "",  # this field is deprecated and to be removed in future versions
+        BaseDbConfig.get_instance().database_provider,
+        tables,  # type: ignore todo
+    )
+    manager.save_revision(revision)
+
+
 @app.command(name="preview-migration")
-def preview_migration():
+def preview_migration(
+    stream: bool = typer.Option(
+        False,
+        "--stream",
+        help="Print the operations table by table, while the rest of the database is still being inspected.",
+    ),
+    plan: Union[None, Path] = typer.Option(
+        None,
+        "--plan",
+        help="Save the previewed operations to a plan file, to be executed by migrate --plan.",
+        show_default=False,
+    ),
+):
     """
     Preview the migration that will be executed.
     """
 
-    m = MigrationElement()
-    m.migrate(preview=True)
+    # taken before the inspection, so changes made during it make the plan stale
+    fingerprint = get_database_inspector().get_schema_fingerprint() if plan else ""
 
-    if not m.operations:
-        print("No changes to be made.")
+    m = MigrationElement()
+    if stream:
+        operations: list[Any] = []
+        for operation in m.stream_migration(preview=True):
+            if not operations:
+                print("Migration preview:")
+            operations.append(operation)
+            print(f"\t{len(operations)}) {operation}")
+        if not operations:
+            print("No changes to be made.")
     else:
-        print("Migration preview:")
-        for i, operation in enumerate(m.operations):
-            print(f"\t{i+1}) {operation}")
-    pass
+        m.migrate(preview=True)
+        operations = m.operations
+
+        if not operations:
+            print("No changes to be made.")
+        else:
+            print("Migration preview:")
+            for i, operation in enumerate(operations):
+                print(f"\t{i+1}) {operation}")
+
+    if plan is not None:
+        MigrationPlan.create(
+            fingerprint,
+            get_loaded_schema_path(),
+            operations,
+            m.adapter.tables,  # type: ignore todo
+        ).save(str(plan))
+        print(f"\nMigration plan saved to {plan}.")
 
 
 @app.command(name="log")
@@ -21,6 +21,13 @@ def find_schema_file():
     return files.pop()
 
 
+def get_loaded_schema_path() -> str:
+    """
+    Get the path of the schema file loaded into the workspace.
+    """
+    return os.path.abspath(sys.modules["schema"].__file__)  # type: ignore
+
+
 def find_schema_file_with_a_given_path(path: str):
     """
     Find the schema file under the given path and return it in a .
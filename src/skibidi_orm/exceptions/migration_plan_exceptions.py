@@ -0,0 +1,6 @@
+class InvalidMigrationPlanError(ValueError):
+    """Raised when a migration plan file cannot be read or was written by another version."""
+
+
+class StaleMigrationPlanError(RuntimeError):
+    """Raised when the database or the schema file changed since the migration plan was computed."""
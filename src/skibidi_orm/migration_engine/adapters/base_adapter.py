@@ -2,7 +2,7 @@ from __future__ import annotations
 from abc import ABC, abstractmethod
 from dataclasses import dataclass, field
 from functools import total_ordering
-from typing import Any
+from typing import Any, Iterator
 
 from skibidi_orm.migration_engine.adapters.database_objects.constraints import (
     ColumnWideConstraint,
@@ -60,3 +60,8 @@ class BaseAdapter(ABC):
     def execute_migration(self, preview: bool = False):
         """Execute the migration"""
         pass
+
+    @abstractmethod
+    def stream_migration(self, preview: bool = False) -> Iterator[Any]:
+        """Execute the migration table by table, yielding the operations"""
+        pass
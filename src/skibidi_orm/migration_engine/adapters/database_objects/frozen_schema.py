@@ -0,0 +1,208 @@
+from __future__ import annotations
+import sys
+from typing import Any, Iterable, NoReturn
+from weakref import WeakValueDictionary
+
+from skibidi_orm.migration_engine.adapters.base_adapter import BaseColumn, BaseTable
+from skibidi_orm.migration_engine.adapters.database_objects.constraints import (
+    CheckConstraint,
+    ColumnWideConstraint,
+    Constraint,
+    DefaultConstraint,
+    ForeignKeyConstraint,
+    TableWideConstraint,
+)
+
+type ConstraintSortKey = tuple[str, ...]
+type ColumnKey = tuple[str, Any, tuple[ColumnWideConstraint, ...]]
+type TableKey = tuple[str, tuple[FrozenColumn, ...], tuple[TableWideConstraint, ...]]
+
+
+def intern_name(name: Any) -> Any:
+    """Intern the given name (or data type) if it's a string"""
+    return sys.intern(name) if isinstance(name, str) else name
+
+
+def constraint_sort_key(constraint: Constraint) -> ConstraintSortKey:
+    """Key ordering the constraints of a frozen object deterministically"""
+    details: tuple[str, ...] = ()
+    if isinstance(constraint, ForeignKeyConstraint):
+        details = (
+            constraint.referenced_table,
+            *(f"{k}:{v}" for k, v in sorted(constraint.column_mapping.items())),
+        )
+    elif isinstance(constraint, CheckConstraint):
+        details = (constraint.condition,)
+    elif isinstance(constraint, DefaultConstraint):
+        details = (constraint.value,)
+    return (
+        getattr(constraint, "column_name", ""),
+        constraint.constraint_type.value,
+        constraint.table_name,
+        *details,
+    )
+
+
+class FrozenColumn:
+    """
+    Immutable, interned counterpart of BaseColumn. Equal columns are the same object,
+    so comparing them is an identity check. The hash, covering the constraints too,
+    is computed once, and the fields share the tuple the column is interned under.
+    """
+
+    __slots__ = ("_key", "_hash", "__weakref__")
+    __interned: WeakValueDictionary[ColumnKey, FrozenColumn] = WeakValueDictionary()
+
+    _key: ColumnKey
+    _hash: int
+
+    def __new__(
+        cls,
+        name: str,
+        data_type: Any,
+        constraints: Iterable[ColumnWideConstraint] = (),
+    ) -> FrozenColumn:
+        key = (
+            intern_name(name),
+            intern_name(data_type),
+            tuple(sorted(set(constraints), key=constraint_sort_key)),
+        )
+        column = cls.__interned.get(key)
+        if column is None:
+            column = object.__new__(cls)
+            object.__setattr__(column, "_key", key)
+            object.__setattr__(column, "_hash", hash(key))
+            cls.__interned[key] = column
+        return column
+
+    @classmethod
+    def from_column(cls, column: BaseColumn[Any]) -> FrozenColumn:
+        """Freeze the given column"""
+        return cls(column.name, column.data_type, column.column_constraints)
+
+    def to_column(self) -> BaseColumn[Any]:
+        """Mutable copy of the column"""
+        return BaseColumn(self.name, self.data_type, list(self.constraints))
+
+    @property
+    def name(self) -> str:
+        return self._key[0]
+
+    @property
+    def data_type(self) -> Any:
+        return self._key[1]
+
+    @property
+    def constraints(self) -> tuple[ColumnWideConstraint, ...]:
+        return self._key[2]
+
+    def __setattr__(self, name: str, value: Any) -> NoReturn:
+        raise AttributeError(f"{self.__class__.__name__} is immutable")
+
+    def __delattr__(self, name: str) -> NoReturn:
+        raise AttributeError(f"{self.__class__.__name__} is immutable")
+
+    def __hash__(self) -> int:
+        return self._hash
+
+    def __eq__(self, other: object) -> bool:
+        # interning makes equal columns identical
+        return self is other
+
+    def __lt__(self, other: FrozenColumn) -> bool:
+        # ordered by name like BaseColumn, the interned name being the sort key
+        return self._key[0] < other._key[0]
+
+    def __reduce__(self) -> tuple[Any, ...]:
+        return (self.__class__, self._key)
+
+    def __repr__(self) -> str:
+        return f"{self.__class__.__name__}{self._key!r}"
+
+
+class FrozenTable:
+    """
+    Immutable, interned counterpart of BaseTable, backed by a tuple of frozen columns
+    and a sorted tuple of table constraints. Equal tables are the same object.
+    """
+
+    __slots__ = ("_key", "_hash", "__weakref__")
+    __interned: WeakValueDictionary[TableKey, FrozenTable] = WeakValueDictionary()
+
+    _key: TableKey
+    _hash: int
+
+    def __new__(
+        cls,
+        name: str,
+        columns: Iterable[FrozenColumn] = (),
+        constraints: Iterable[TableWideConstraint] = (),
+    ) -> FrozenTable:
+        key = (
+            intern_name(name),
+            tuple(columns),
+            tuple(sorted(set(constraints), key=constraint_sort_key)),
+        )
+        table = cls.__interned.get(key)
+        if table is None:
+            table = object.__new__(cls)
+            object.__setattr__(table, "_key", key)
+            object.__setattr__(table, "_hash", hash(key))
+            cls.__interned[key] = table
+        return table
+
+    @classmethod
+    def from_table(cls, table: BaseTable[Any]) -> FrozenTable:
+        """Freeze the given table"""
+        return cls(
+            table.name,
+            (FrozenColumn.from_column(c) for c in table.columns),
+            table.table_constraints,
+        )
+
+    def to_table(self) -> BaseTable[BaseColumn[Any]]:
+        """Mutable copy of the table"""
+        return BaseTable(
+            self.name,
+            [column.to_column() for column in self.columns],
+            set(self.constraints),
+        )
+
+    @property
+    def name(self) -> str:
+        return self._key[0]
+
+    @property
+    def columns(self) -> tuple[FrozenColumn, ...]:
+        return self._key[1]
+
+    @property
+    def constraints(self) -> tuple[TableWideConstraint, ...]:
+        return self._key[2]
+
+    def __setattr__(self, name: str, value: Any) -> NoReturn:
+        raise AttributeError(f"{self.__class__.__name__} is immutable")
+
+    def __delattr__(self, name: str) -> NoReturn:
+        raise AttributeError(f"{self.__class__.__name__} is immutable")
+
+    def __hash__(self) -> int:
+        return self._hash
+
+    def __eq__(self, other: object) -> bool:
+        # interning makes equal tables identical
+        return self is other
+
+    def __lt__(self, other: FrozenTable) -> bool:
+        return self._key[0] < other._key[0]
+
+    def __reduce__(self) -> tuple[Any, ...]:
+        return (self.__class__, self._key)
+
+    def __repr__(self) -> str:
+        return f"{self.__class__.__name__}{self._key!r}"
+
+
+def freeze_tables(tables: Iterable[BaseTable[Any]]) -> tuple[FrozenTable, ...]:
+    """Freeze the given tables"""
+    return tuple(FrozenTable.from_table(table) for table in tables)
@@ -1,3 +1,4 @@
+from typing import Iterator
 from skibidi_orm.migration_engine.adapters.base_adapter import BaseAdapter
 
 from skibidi_orm.migration_engine.operations.column_operations import ColumnOperation
@@ -24,3 +25,18 @@ class MigrationElement:
         for cls in table:
             table_instance = cls()
             table_instance.adapter.execute_migration(preview)
+
+    def stream_migration(
+        self, preview: bool = False
+    ) -> Iterator[ColumnOperation | TableOperation]:
+        """
+        Execute the migration for all the migration elements table by table, yielding
+        the operations as they are executed (or just computed, when previewing).
+        Unlike migrate, the operations are not collected in MigrationElement.operations.
+        """
+        table = MigrationElement.__subclasses__()
+        self.adapter = table[0]().adapter
+
+        for cls in table:
+            table_instance = cls()
+            yield from table_instance.adapter.stream_migration(preview)
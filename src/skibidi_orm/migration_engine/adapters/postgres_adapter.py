@@ -1,4 +1,5 @@
 from __future__ import annotations
+from typing import Iterator
 from skibidi_orm.migration_engine.adapters.base_adapter import BaseAdapter
 from skibidi_orm.migration_engine.adapters.database_objects.migration_element import (
     MigrationElement,
@@ -7,7 +8,24 @@ from skibidi_orm.migration_engine.adapters.postgres_typing import PostgresTyping
 from skibidi_orm.migration_engine.db_inspectors.postgres_inspector import (
     PostgresInspector,
 )
+from skibidi_orm.migration_engine.db_inspectors.inspection_cache import InspectionCache
+from skibidi_orm.migration_engine.state_manager.i_state_manager import IStateManager
 from skibidi_orm.migration_engine.state_manager.state_manager import StateManager
+from skibidi_orm.migration_engine.state_manager.sharded_state_manager import (
+    ShardedStateManager,
+)
+from skibidi_orm.migration_engine.state_manager.operation_planner import (
+    OperationPlanner,
+)
+from skibidi_orm.migration_engine.state_manager.operation_optimizer import (
+    OperationOptimizer,
+)
+from skibidi_orm.migration_engine.state_manager.operation_stream import (
+    OperationStream,
+)
+from skibidi_orm.migration_engine.operations.column_operations import ColumnOperation
+from skibidi_orm.migration_engine.sql_executor.postgres_executor import PostgresExecutor
+from skibidi_orm.migration_engine.operations.table_operations import TableOperation
 
 
 class PostgresAdapter(BaseAdapter):
@@ -27,16 +45,59 @@ class PostgresAdapter(BaseAdapter):
 
         self.inspector = PostgresInspector()
 
-        db_tables = self.inspector.get_tables()
-
-        state_manager = StateManager[PostgresTyping.Table](
-            db_tables=db_tables,
-            schema_tables=self.tables,
+        db_tables: list[PostgresTyping.Table] = InspectionCache().get_tables(
+            self.inspector
         )
 
-        MigrationElement.operations = (
-            state_manager.get_operations_transforming_database_schema_into_class_hierarchy_schema()
+        schema_tables = [
+            table
+            for table in self.tables
+            if self.inspector.config.table_filter.matches(table.name)
+        ]
+        state_manager: IStateManager
+        if self.inspector.config.diff_workers > 1:
+            state_manager = ShardedStateManager[PostgresTyping.Table](
+                db_tables=db_tables,
+                schema_tables=schema_tables,
+                rename_detector=self.inspector.config.rename_detector,
+                workers=self.inspector.config.diff_workers,
+            )
+        else:
+            state_manager = StateManager[PostgresTyping.Table](
+                db_tables=db_tables,
+                schema_tables=schema_tables,
+                rename_detector=self.inspector.config.rename_detector,
+            )
+
+        MigrationElement.operations = OperationPlanner.plan(
+            OperationOptimizer.optimize(
+                state_manager.get_operations_transforming_database_schema_into_class_hierarchy_schema()
+            )
         )
 
-        # if not preview:
-        #     SQLite3Executor.execute_operations(MigrationElement.operations)
+        if not preview:
+            PostgresExecutor.execute_operations(MigrationElement.operations)
+
+    def stream_migration(
+        self, preview: bool = False
+    ) -> Iterator[TableOperation | ColumnOperation]:
+        """
+        Execute the migration process table by table, yielding the operations
+        as soon as they are known (and, unless previewing, executed).
+        The database is inspected in chunks, bypassing the inspection cache.
+        """
+
+        self.inspector = PostgresInspector()
+
+        for batch in OperationStream.batches(
+            self.inspector.iter_tables(),
+            [
+                table
+                for table in self.tables
+                if self.inspector.config.table_filter.matches(table.name)
+            ],
+            rename_detector=self.inspector.config.rename_detector,
+        ):
+            if not preview:
+                PostgresExecutor.execute_operations(batch)
+            yield from batch
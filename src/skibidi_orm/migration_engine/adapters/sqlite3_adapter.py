@@ -1,4 +1,5 @@
 from __future__ import annotations
+from typing import Iterator
 from skibidi_orm.migration_engine.adapters.base_adapter import BaseAdapter
 from skibidi_orm.migration_engine.adapters.database_objects.migration_element import (
     MigrationElement,
@@ -9,7 +10,19 @@ from skibidi_orm.migration_engine.adapters.sqlite3_typing import (
 from skibidi_orm.migration_engine.db_inspectors.sqlite.sqlite3_inspector import (
     SQLite3Inspector,
 )
+from skibidi_orm.migration_engine.db_inspectors.inspection_cache import InspectionCache
 from skibidi_orm.migration_engine.state_manager.state_manager import StateManager
+from skibidi_orm.migration_engine.state_manager.operation_planner import (
+    OperationPlanner,
+)
+from skibidi_orm.migration_engine.state_manager.operation_optimizer import (
+    OperationOptimizer,
+)
+from skibidi_orm.migration_engine.state_manager.operation_stream import (
+    OperationStream,
+)
+from skibidi_orm.migration_engine.operations.column_operations import ColumnOperation
+from skibidi_orm.migration_engine.operations.table_operations import TableOperation
 
 from skibidi_orm.migration_engine.sql_executor.sqlite3_executor import SQLite3Executor
 
@@ -34,16 +47,49 @@ class SQLite3Adapter(BaseAdapter):
 
         self.inspector = SQLite3Inspector()
 
-        db_tables = self.inspector.get_tables()
+        db_tables: list[SQLite3Typing.Table] = InspectionCache().get_tables(
+            self.inspector
+        )
 
         state_manager = StateManager[SQLite3Typing.Table](
             db_tables=db_tables,
-            schema_tables=self.tables,
+            schema_tables=[
+                table
+                for table in self.tables
+                if self.inspector.config.table_filter.matches(table.name)
+            ],
+            rename_detector=self.inspector.config.rename_detector,
         )
 
-        MigrationElement.operations = (
-            state_manager.get_operations_transforming_database_schema_into_class_hierarchy_schema()
+        MigrationElement.operations = OperationPlanner.plan(
+            OperationOptimizer.optimize(
+                state_manager.get_operations_transforming_database_schema_into_class_hierarchy_schema()
+            )
         )
 
         if not preview:
             SQLite3Executor.execute_operations(MigrationElement.operations)
+
+    def stream_migration(
+        self, preview: bool = False
+    ) -> Iterator[TableOperation | ColumnOperation]:
+        """
+        Execute the migration process table by table, yielding the operations
+        as soon as they are known (and, unless previewing, executed).
+        The database is inspected in chunks, bypassing the inspection cache.
+        """
+
+        self.inspector = SQLite3Inspector()
+
+        for batch in OperationStream.batches(
+            self.inspector.iter_tables(),
+            [
+                table
+                for table in self.tables
+                if self.inspector.config.table_filter.matches(table.name)
+            ],
+            rename_detector=self.inspector.config.rename_detector,
+        ):
+            if not preview:
+                SQLite3Executor.execute_operations(batch)
+            yield from batch
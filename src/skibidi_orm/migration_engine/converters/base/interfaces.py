@@ -121,3 +121,49 @@ class SQLQueryConverter(ABC):
     def get_table_clearing_query() -> str:
         """Return the SQL string which clears the table of all data
         except the revision table"""
+
+    @staticmethod
+    @abstractmethod
+    def get_backfill_table_creation_query() -> str:
+        """Return the SQL string which creates the internal table used to checkpoint
+        column backfills, unless it exists"""
+
+    @staticmethod
+    @abstractmethod
+    def get_backfill_data_query() -> str:
+        """Return the SQL string which selects the pending backfills: the names of their
+        table and column, their serialized operation and their last populated key"""
+
+    @staticmethod
+    @abstractmethod
+    def get_backfill_insertion_query() -> str:
+        """Return the SQL string which records a started backfill, taking the names
+        of its table and column and its serialized operation as the parameters"""
+
+    @staticmethod
+    @abstractmethod
+    def get_backfill_checkpoint_query() -> str:
+        """Return the SQL string which records the last populated key of a backfill,
+        taking the key and the names of its table and column as the parameters"""
+
+    @staticmethod
+    @abstractmethod
+    def get_backfill_deletion_query() -> str:
+        """Return the SQL string which removes a finished backfill, taking
+        the names of its table and column as the parameters"""
+
+    @staticmethod
+    @abstractmethod
+    def get_backfill_chunk_end_query(table_name: str, key: str, resumed: bool) -> str:
+        """Return the SQL string which selects the last key of the next chunk of rows,
+        taking the chunk size (preceded by the last key of the previous chunk
+        if resumed) as the parameters"""
+
+    @staticmethod
+    @abstractmethod
+    def get_backfill_chunk_query(
+        table_name: str, column_name: str, key: str, value: str, resumed: bool
+    ) -> str:
+        """Return the SQL string which populates the column in a chunk of rows, taking
+        the last key of the chunk (preceded by the last key of the previous chunk
+        if resumed) as the parameters"""
@@ -2,6 +2,7 @@ from skibidi_orm.migration_engine.converters.base.interfaces import (
     ColumnOperationSQLConverter,
     ConstraintSQLConverter,
     SQLConverter,
+    SQLQueryConverter,
     TableOperationSQLConverter,
 )
 from skibidi_orm.migration_engine.converters.postgres.columns import (
@@ -10,9 +11,15 @@ from skibidi_orm.migration_engine.converters.postgres.columns import (
 from skibidi_orm.migration_engine.converters.postgres.constraints import (
     PostgresConstraintConverter,
 )
+from skibidi_orm.migration_engine.converters.postgres.queries import (
+    PostgresQueryConverter,
+)
 from skibidi_orm.migration_engine.converters.postgres.tables import (
     PostgresTableOperationConverter,
 )
+from skibidi_orm.migration_engine.revisions.constants import (
+    get_revision_table_name,
+)
 
 
 class PostgresConverter(SQLConverter):
@@ -30,3 +37,12 @@ class PostgresConverter(SQLConverter):
     @staticmethod
     def get_column_operation_converter() -> type[ColumnOperationSQLConverter]:
         return PostgresColumnOperationConverter
+
+    @staticmethod
+    def get_query_converter() -> type[SQLQueryConverter]:
+        return PostgresQueryConverter
+
+    @classmethod
+    def get_revision_insertion_query(cls) -> str:
+        revision_table_name = get_revision_table_name()
+        return f"INSERT INTO {revision_table_name} (rev) VALUES (%s);"
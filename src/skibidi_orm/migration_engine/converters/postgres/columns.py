@@ -7,12 +7,19 @@ from skibidi_orm.migration_engine.converters.postgres.constraints import (
 )
 from skibidi_orm.migration_engine.operations.column_operations import (
     AddColumnOperation,
+    AddConstraintOperation,
+    ChangeDataTypeOperation,
     ColumnOperation,
     DeleteColumnOperation,
+    DeleteConstraintOperation,
     RenameColumnOperation,
 )
 from skibidi_orm.migration_engine.adapters.database_objects.constraints import (
+    CheckConstraint,
     ColumnWideConstraint,
+    ConstraintType,
+    DefaultConstraint,
+    ForeignKeyConstraint,
 )
 from skibidi_orm.migration_engine.operations.operation_type import OperationType
 from skibidi_orm.exceptions.operations import UnsupportedOperationError
@@ -41,6 +48,18 @@ class PostgresColumnOperationConverter(ColumnOperationSQLConverter):
                     cast(RenameColumnOperation, operation)
                 )
             )
+        elif operation.operation_type == OperationType.DTYPE_CHANGE:
+            return PostgresColumnOperationConverter.convert_change_data_type_operation_to_SQL(
+                cast(ChangeDataTypeOperation, operation)
+            )
+        elif isinstance(operation, AddConstraintOperation):
+            return PostgresColumnOperationConverter.convert_add_constraint_operation_to_SQL(
+                operation
+            )
+        elif isinstance(operation, DeleteConstraintOperation):
+            return PostgresColumnOperationConverter.convert_delete_constraint_operation_to_SQL(
+                operation
+            )
         raise UnsupportedOperationError(
             "The given operation is not supported in Postgres."
         )
@@ -82,6 +101,125 @@ class PostgresColumnOperationConverter(ColumnOperationSQLConverter):
         """Convert a given rename column operation to a Postgres SQL string"""
         return f"ALTER TABLE {operation.table.name} RENAME COLUMN {operation.column.name} TO {operation.new_name};"
 
+    @staticmethod
+    def convert_change_data_type_operation_to_SQL(
+        operation: ChangeDataTypeOperation,
+    ) -> str:
+        """Convert a given change data type operation to a Postgres SQL string.
+        The existing values are cast to the new type in place."""
+        column_name = operation.column.name
+        return (
+            f"ALTER TABLE {operation.table.name} ALTER COLUMN {column_name} "
+            f"TYPE {operation.new_dtype} USING {column_name}::{operation.new_dtype};"
+        )
+
+    @staticmethod
+    def convert_add_constraint_operation_to_SQL(
+        operation: AddConstraintOperation,
+    ) -> str:
+        """Convert a given add constraint operation to a Postgres SQL string"""
+        table_name = operation.table.name
+        column_name = operation.column.name
+        constraint = operation.constraint
+        if constraint.constraint_type == ConstraintType.NOT_NULL:
+            return f"ALTER TABLE {table_name} ALTER COLUMN {column_name} SET NOT NULL;"
+        elif constraint.constraint_type == ConstraintType.DEFAULT:
+            return (
+                f"ALTER TABLE {table_name} ALTER COLUMN {column_name} "
+                f"SET DEFAULT {cast(DefaultConstraint, constraint).value};"
+            )
+        elif constraint.constraint_type in (
+            ConstraintType.UNIQUE,
+            ConstraintType.PRIMARY_KEY,
+        ):
+            return f"ALTER TABLE {table_name} ADD {constraint.constraint_type.value} ({column_name});"
+        return f"ALTER TABLE {table_name} ADD {PostgresConstraintConverter.convert_constraint_to_SQL(constraint)};"
+
+    @staticmethod
+    def convert_delete_constraint_operation_to_SQL(
+        operation: DeleteConstraintOperation,
+    ) -> str:
+        """Convert a given delete constraint operation to a Postgres SQL string.
+        Named constraints are looked up in pg_constraint by what they constrain,
+        as their names may differ from the default ones (e.g. when given explicitly,
+        truncated to the maximum identifier length or kept through a table rename)."""
+        table_name = operation.table.name
+        column_name = operation.column.name
+        constraint = operation.constraint
+        if constraint.constraint_type == ConstraintType.NOT_NULL:
+            return f"ALTER TABLE {table_name} ALTER COLUMN {column_name} DROP NOT NULL;"
+        elif constraint.constraint_type == ConstraintType.DEFAULT:
+            return f"ALTER TABLE {table_name} ALTER COLUMN {column_name} DROP DEFAULT;"
+        elif constraint.constraint_type == ConstraintType.UNIQUE:
+            condition = PostgresColumnOperationConverter._constrained_columns_condition(
+                table_name, [column_name]
+            )
+            return PostgresColumnOperationConverter.convert_constraint_drop_to_SQL(
+                table_name, "u", condition
+            )
+        elif constraint.constraint_type == ConstraintType.PRIMARY_KEY:
+            return PostgresColumnOperationConverter.convert_constraint_drop_to_SQL(
+                table_name, "p", "TRUE"
+            )
+        elif constraint.constraint_type == ConstraintType.FOREIGN_KEY:
+            foreign_key = cast(ForeignKeyConstraint, constraint)
+            condition = PostgresColumnOperationConverter._constrained_columns_condition(
+                table_name, list(foreign_key.column_mapping)
+            )
+            return PostgresColumnOperationConverter.convert_constraint_drop_to_SQL(
+                table_name,
+                "f",
+                f"{condition} AND con.confrelid = '{foreign_key.referenced_table}'::regclass",
+            )
+        elif constraint.constraint_type == ConstraintType.CHECK:
+            # compared with the definition as deparsed by Postgres, which adds
+            # parentheses and may reformat whitespace
+            definition = f"CHECK ({cast(CheckConstraint, constraint).condition})"
+            return PostgresColumnOperationConverter.convert_constraint_drop_to_SQL(
+                table_name,
+                "c",
+                "regexp_replace(pg_get_constraintdef(con.oid), '[\\s()]', '', 'g') = "
+                f"regexp_replace('{definition.replace("'", "''")}', '[\\s()]', '', 'g')",
+            )
+        raise UnsupportedOperationError(
+            f"Deleting constraints of type {constraint.constraint_type} is not supported in Postgres."
+        )
+
+    @staticmethod
+    def convert_constraint_drop_to_SQL(
+        table_name: str, constraint_type: str, condition: str
+    ) -> str:
+        """Convert a drop of the constraints of the table with the given pg_constraint
+        type satisfying the condition (on the pg_constraint row aliased as con)
+        to a Postgres SQL string, failing if there are none"""
+        return f"""
+            DO $$
+            DECLARE
+                constraint_name name;
+            BEGIN
+                FOR constraint_name IN
+                    SELECT con.conname FROM pg_catalog.pg_constraint AS con
+                    WHERE con.conrelid = '{table_name}'::regclass
+                        AND con.contype = '{constraint_type}' AND {condition}
+                LOOP
+                    EXECUTE 'ALTER TABLE {table_name} DROP CONSTRAINT ' || quote_ident(constraint_name);
+                END LOOP;
+                IF NOT FOUND THEN
+                    RAISE EXCEPTION 'No such constraint of type {constraint_type} on table {table_name}';
+                END IF;
+            END $$;
+            """
+
+    @staticmethod
+    def _constrained_columns_condition(table_name: str, columns: list[str]) -> str:
+        """Condition selecting the constraints on exactly the given columns"""
+        names = ", ".join(f"'{column}'" for column in sorted(columns))
+        return (
+            "ARRAY(SELECT a.attname::text FROM pg_catalog.pg_attribute AS a"
+            " WHERE a.attrelid = con.conrelid AND a.attnum = ANY(con.conkey)"
+            f" ORDER BY a.attname) = ARRAY[{names}]::text[]"
+        )
+
     @staticmethod
     def convert_column_definition_to_SQL(
         column: PostgresTyping.Column, constraints: list[ColumnWideConstraint]
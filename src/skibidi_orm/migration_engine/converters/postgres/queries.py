@@ -0,0 +1,69 @@
+from skibidi_orm.migration_engine.converters.base.interfaces import SQLQueryConverter
+from skibidi_orm.migration_engine.revisions.constants import (
+    get_backfill_table_name,
+    get_revision_table_name,
+)
+
+
+class PostgresQueryConverter(SQLQueryConverter):
+    """Class responsible for converting query objects to Postgres SQL strings"""
+
+    @staticmethod
+    def get_revision_data_query() -> str:
+        return f"SELECT id, rev FROM {get_revision_table_name()} ORDER BY id;"
+
+    @staticmethod
+    def get_table_clearing_query() -> str:
+        return f"""
+            DO $$
+            DECLARE
+                t RECORD;
+            BEGIN
+                FOR t IN SELECT tablename FROM pg_catalog.pg_tables
+                    WHERE schemaname = current_schema() AND tablename != '{get_revision_table_name()}'
+                LOOP
+                    EXECUTE 'DROP TABLE IF EXISTS ' || quote_ident(t.tablename) || ' CASCADE';
+                END LOOP;
+            END $$;
+            """
+
+    @staticmethod
+    def get_backfill_table_creation_query() -> str:
+        # keys are stored as text, compared with the key column as untyped literals
+        return f"""
+            CREATE TABLE IF NOT EXISTS {get_backfill_table_name()} (
+                table_name TEXT NOT NULL,
+                column_name TEXT NOT NULL,
+                operation BYTEA NOT NULL,
+                last_key TEXT,
+                PRIMARY KEY (table_name, column_name)
+            );
+            """
+
+    @staticmethod
+    def get_backfill_data_query() -> str:
+        return f"SELECT table_name, column_name, operation, last_key FROM {get_backfill_table_name()};"
+
+    @staticmethod
+    def get_backfill_insertion_query() -> str:
+        return f"INSERT INTO {get_backfill_table_name()} (table_name, column_name, operation) VALUES (%s, %s, %s);"
+
+    @staticmethod
+    def get_backfill_checkpoint_query() -> str:
+        return f"UPDATE {get_backfill_table_name()} SET last_key = %s WHERE table_name = %s AND column_name = %s;"
+
+    @staticmethod
+    def get_backfill_deletion_query() -> str:
+        return f"DELETE FROM {get_backfill_table_name()} WHERE table_name = %s AND column_name = %s;"
+
+    @staticmethod
+    def get_backfill_chunk_end_query(table_name: str, key: str, resumed: bool) -> str:
+        condition = f"WHERE {key} > %s " if resumed else ""
+        return f"SELECT MAX({key}) FROM (SELECT {key} FROM {table_name} {condition}ORDER BY {key} LIMIT %s) AS chunk;"
+
+    @staticmethod
+    def get_backfill_chunk_query(
+        table_name: str, column_name: str, key: str, value: str, resumed: bool
+    ) -> str:
+        condition = f"{key} > %s AND " if resumed else ""
+        return f"UPDATE {table_name} SET {column_name} = ({value}) WHERE {condition}{key} <= %s;"
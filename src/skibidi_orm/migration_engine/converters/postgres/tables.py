@@ -16,6 +16,7 @@ from skibidi_orm.migration_engine.operations.table_operations import (
     CreateTableOperation,
 )
 from skibidi_orm.exceptions.operations import UnsupportedOperationError
+from skibidi_orm.migration_engine.revisions.constants import get_revision_table_name
 from typing import cast
 from itertools import chain
 
@@ -47,6 +48,13 @@ class PostgresTableOperationConverter(TableOperationSQLConverter):
                 "The given operation is not supported in Postgres."
             )
 
+    @staticmethod
+    def get_revision_table_creation_query() -> str:
+        """Return the SQL string which creates a special internal table
+        used to hold revision data"""
+        table_name = get_revision_table_name()
+        return f"CREATE TABLE {table_name} (id SERIAL PRIMARY KEY, rev BYTEA NOT NULL);"
+
     @staticmethod
     def _convert_create_table_operation_to_SQL(operation: CreateTableOperation) -> str:
         """Convert a given create table operation to a Postgres SQL string"""
@@ -84,18 +92,9 @@ class PostgresTableOperationConverter(TableOperationSQLConverter):
 
     @staticmethod
     def _convert_rename_table_operation_to_SQL(operation: RenameTableOperation) -> str:
-        """Convert a given rename table operation to a Postgres SQL string. Since Postgres does not
-        support renaming a table directly, a new table with the same columns has to be instantiated after
-        deleting the original one."""
-        delete_op = DeleteTableOperation(operation.table)
-        create_op = CreateTableOperation(
-            PostgresTyping.Table(operation.new_name, operation.table.columns)
-        )
-        return (
-            PostgresTableOperationConverter.convert_table_operation_to_SQL(delete_op)
-            + " "
-            + PostgresTableOperationConverter.convert_table_operation_to_SQL(create_op)
-        )
+        """Convert a given rename table operation to a Postgres SQL string. The table is renamed
+        in place, keeping its data."""
+        return f"ALTER TABLE {operation.table.name} RENAME TO {operation.new_name};"
 
     @staticmethod
     def split_constraints(
@@ -7,16 +7,23 @@ from skibidi_orm.migration_engine.converters.sqlite3.constraints import (
 )
 from skibidi_orm.migration_engine.operations.column_operations import (
     AddColumnOperation,
+    AddConstraintOperation,
+    ChangeDataTypeOperation,
     ColumnOperation,
     DeleteColumnOperation,
+    DeleteConstraintOperation,
     RenameColumnOperation,
 )
 from skibidi_orm.migration_engine.adapters.database_objects.constraints import (
+    CheckConstraint,
     ColumnWideConstraint,
+    DefaultConstraint,
+    TableWideConstraint,
 )
 from skibidi_orm.migration_engine.operations.operation_type import OperationType
 from skibidi_orm.exceptions.operations import UnsupportedOperationError
-from typing import cast
+from dataclasses import replace
+from typing import Iterable, cast
 
 
 class SQLite3ColumnOperationConverter(ColumnOperationSQLConverter):
@@ -41,6 +48,15 @@ class SQLite3ColumnOperationConverter(ColumnOperationSQLConverter):
                     cast(RenameColumnOperation, operation)
                 )
             )
+        elif operation.operation_type in (
+            OperationType.DTYPE_CHANGE,
+            OperationType.CONSTRAINT_CHANGE,
+        ):
+            return (
+                SQLite3ColumnOperationConverter.convert_alter_column_operation_to_SQL(
+                    operation
+                )
+            )
         raise UnsupportedOperationError(
             "The given operation is not supported in SQLite3."
         )
@@ -82,13 +98,146 @@ class SQLite3ColumnOperationConverter(ColumnOperationSQLConverter):
         """Convert a given rename column operation to a SQLite3 SQL string"""
         return f"ALTER TABLE {operation.table.name} RENAME COLUMN {operation.column.name} TO {operation.new_name};"
 
+    @staticmethod
+    def convert_alter_column_operation_to_SQL(operation: ColumnOperation) -> str:
+        """Convert a given data type or constraint change operation to a SQLite3 SQL string.
+        SQLite3 cannot alter columns in place, so the table is rebuilt with the changed
+        column definition and its data is copied over."""
+        return SQLite3ColumnOperationConverter.convert_alter_column_operations_to_SQL(
+            [operation]
+        )
+
+    @staticmethod
+    def convert_alter_column_operations_to_SQL(
+        operations: list[ColumnOperation],
+        check_conditions: Iterable[str] = (),
+    ) -> str:
+        """Convert consecutive data type or constraint change operations on one table
+        to a SQLite3 SQL string rebuilding the table once, with all of the changes.
+        The CHECK constraints with the given conditions, found in the current definition
+        of the table, are kept unless one of the operations deletes them."""
+        table = operations[0].table
+        new_table = SQLite3ColumnOperationConverter.altered_table(operations[-1])
+        deleted_constraints = {
+            operation.constraint
+            for operation in operations
+            if isinstance(operation, DeleteConstraintOperation)
+        }
+        kept_checks = {
+            CheckConstraint(table.name, condition) for condition in check_conditions
+        } - deleted_constraints
+        return SQLite3ColumnOperationConverter.convert_table_rebuild_to_SQL(
+            table,
+            replace(
+                new_table, table_constraints=new_table.table_constraints | kept_checks
+            ),
+        )
+
+    @staticmethod
+    def is_alter_column_operation(operation: ColumnOperation) -> bool:
+        """Check whether the operation can only be done in SQLite3 by rebuilding the table"""
+        return operation.operation_type in (
+            OperationType.DTYPE_CHANGE,
+            OperationType.CONSTRAINT_CHANGE,
+        )
+
+    @staticmethod
+    def altered_table(operation: ColumnOperation) -> SQLite3Typing.Table:
+        """Return the table of a given data type or constraint change operation
+        as it is after the operation"""
+        table = operation.table
+        column = operation.column
+        table_constraints = set(table.table_constraints)
+
+        if isinstance(operation, ChangeDataTypeOperation):
+            column = replace(column, data_type=operation.new_dtype)
+        elif isinstance(operation, AddConstraintOperation):
+            if isinstance(operation.constraint, TableWideConstraint):
+                table_constraints.add(operation.constraint)
+            else:
+                column = replace(
+                    column,
+                    column_constraints=column.column_constraints
+                    + [cast(ColumnWideConstraint, operation.constraint)],
+                )
+        elif isinstance(operation, DeleteConstraintOperation):
+            if isinstance(operation.constraint, TableWideConstraint):
+                table_constraints.discard(operation.constraint)
+            else:
+                column = replace(
+                    column,
+                    column_constraints=[
+                        c
+                        for c in column.column_constraints
+                        if c != operation.constraint
+                    ],
+                )
+        else:
+            raise UnsupportedOperationError(
+                "The given operation is not supported in SQLite3."
+            )
+
+        if all(c.name != column.name for c in table.columns):
+            raise UnsupportedOperationError(
+                f"Column {column.name} does not belong to table {table.name}."
+            )
+        return replace(
+            table,
+            columns=[column if c.name == column.name else c for c in table.columns],
+            table_constraints=table_constraints,
+        )
+
+    @staticmethod
+    def convert_table_rebuild_to_SQL(
+        table: SQLite3Typing.Table, new_table: SQLite3Typing.Table
+    ) -> str:
+        """Convert the rebuild of a given table into its new definition to a SQLite3
+        SQL string. A shadow table is created with the new definition, the data of the
+        columns present in both definitions is copied into it in a single pass, and the
+        shadow table replaces the old one. Indexes and triggers of the old table are
+        dropped with it and have to be recreated afterwards."""
+        shadow_table = replace(new_table, name=f"skibidi_rebuild_{new_table.name}")
+        old_columns_names = {column.name for column in table.columns}
+        columns = ", ".join(
+            column.name
+            for column in new_table.columns
+            if column.name in old_columns_names
+        )
+        return (
+            f"{SQLite3ColumnOperationConverter.convert_table_definition_to_SQL(shadow_table)} "
+            f"INSERT INTO {shadow_table.name} ({columns}) SELECT {columns} FROM {table.name}; "
+            f"DROP TABLE {table.name}; "
+            f"ALTER TABLE {shadow_table.name} RENAME TO {new_table.name};"
+        )
+
+    @staticmethod
+    def convert_table_definition_to_SQL(table: SQLite3Typing.Table) -> str:
+        """Convert a given table definition to a SQLite3 CREATE TABLE string"""
+        definitions: list[str] = [
+            SQLite3ColumnOperationConverter.convert_column_definition_to_SQL(
+                column, column.column_constraints
+            )
+            for column in table.columns
+        ]
+        definitions += [
+            SQLite3ConstraintConverter.convert_constraint_to_SQL(key)
+            for key in table.table_constraints
+        ]
+        return f"CREATE TABLE {table.name} ({', '.join(definitions)});"
+
     @staticmethod
     def convert_column_definition_to_SQL(
         column: SQLite3Typing.Column, constraints: list[ColumnWideConstraint]
     ) -> str:
-        """Convert a given column definition to a SQLite3 SQL string"""
+        """Convert a given column definition to a SQLite3 SQL string. Defaults are only
+        supported here - SQLite3 cannot add them to an existing column."""
         return_value = f"{column.name} {column.data_type}"
         for constraint in constraints:
+            if isinstance(constraint, DefaultConstraint):
+                # parenthesized, so that any expression (e.g. 1+2, as reported
+                # by PRAGMA table_info) is a valid default
+                return_value += f" DEFAULT ({constraint.value})"
+                continue
             return_value += (
                 f" {SQLite3ConstraintConverter.convert_constraint_to_SQL(constraint)}"
             )
@@ -1,5 +1,8 @@
 from skibidi_orm.migration_engine.converters.base.interfaces import SQLQueryConverter
-from skibidi_orm.migration_engine.revisions.constants import get_revision_table_name
+from skibidi_orm.migration_engine.revisions.constants import (
+    get_backfill_table_name,
+    get_revision_table_name,
+)
 
 
 class SQLite3QueryConverter(SQLQueryConverter):
@@ -9,6 +12,19 @@ class SQLite3QueryConverter(SQLQueryConverter):
     def get_revision_data_query() -> str:
         return f"SELECT rowid, * FROM {get_revision_table_name()};"
 
+    @staticmethod
+    def get_table_definition_query() -> str:
+        """Return the SQL string which selects the CREATE TABLE statement
+        of the table given as the parameter"""
+        return "SELECT sql FROM sqlite_master WHERE type = 'table' AND name = ?;"
+
+    @staticmethod
+    def get_table_indexes_and_triggers_query() -> str:
+        """Return the SQL string which selects the definitions of the indexes and triggers
+        of the table given as the parameter, except the ones created for its constraints
+        """
+        return "SELECT sql FROM sqlite_master WHERE tbl_name = ? AND type IN ('index', 'trigger') AND sql IS NOT NULL;"
+
     @staticmethod
     def get_table_clearing_query() -> str:
         return f"""
@@ -19,3 +35,44 @@ class SQLite3QueryConverter(SQLQueryConverter):
             VACUUM;
             PRAGMA INTEGRITY_CHECK;
             """
+
+    @staticmethod
+    def get_backfill_table_creation_query() -> str:
+        # last_key has no type, so the keys are compared with their own type
+        return f"""
+            CREATE TABLE IF NOT EXISTS {get_backfill_table_name()} (
+                table_name TEXT NOT NULL,
+                column_name TEXT NOT NULL,
+                operation BLOB NOT NULL,
+                last_key,
+                PRIMARY KEY (table_name, column_name)
+            );
+            """
+
+    @staticmethod
+    def get_backfill_data_query() -> str:
+        return f"SELECT table_name, column_name, operation, last_key FROM {get_backfill_table_name()};"
+
+    @staticmethod
+    def get_backfill_insertion_query() -> str:
+        return f"INSERT INTO {get_backfill_table_name()} (table_name, column_name, operation) VALUES (?, ?, ?);"
+
+    @staticmethod
+    def get_backfill_checkpoint_query() -> str:
+        return f"UPDATE {get_backfill_table_name()} SET last_key = ? WHERE table_name = ? AND column_name = ?;"
+
+    @staticmethod
+    def get_backfill_deletion_query() -> str:
+        return f"DELETE FROM {get_backfill_table_name()} WHERE table_name = ? AND column_name = ?;"
+
+    @staticmethod
+    def get_backfill_chunk_end_query(table_name: str, key: str, resumed: bool) -> str:
+        condition = f"WHERE {key} > ? " if resumed else ""
+        return f"SELECT MAX({key}) FROM (SELECT {key} FROM {table_name} {condition}ORDER BY {key} LIMIT ?);"
+
+    @staticmethod
+    def get_backfill_chunk_query(
+        table_name: str, column_name: str, key: str, value: str, resumed: bool
+    ) -> str:
+        condition = f"{key} > ? AND " if resumed else ""
+        return f"UPDATE {table_name} SET {column_name} = ({value}) WHERE {condition}{key} <= ?;"
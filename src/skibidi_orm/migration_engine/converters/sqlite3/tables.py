@@ -1,13 +1,9 @@
-from skibidi_orm.migration_engine.adapters.sqlite3_typing import SQLite3Typing
 from skibidi_orm.migration_engine.converters.base.interfaces import (
     TableOperationSQLConverter,
 )
 from skibidi_orm.migration_engine.converters.sqlite3.columns import (
     SQLite3ColumnOperationConverter,
 )
-from skibidi_orm.migration_engine.converters.sqlite3.constraints import (
-    SQLite3ConstraintConverter,
-)
 from skibidi_orm.migration_engine.operations.operation_type import OperationType
 from skibidi_orm.migration_engine.operations.table_operations import (
     DeleteTableOperation,
@@ -58,19 +54,9 @@ class SQLite3TableOperationConverter(TableOperationSQLConverter):
     @staticmethod
     def _convert_create_table_operation_to_SQL(operation: CreateTableOperation) -> str:
         """Convert a given create table operation to a SQLite3 SQL string"""
-        definition_string = f"CREATE TABLE {operation.table.name} "
-
-        definition_string += "("
-        for column in operation.table.columns:
-            definition_string += f"{SQLite3ColumnOperationConverter.convert_column_definition_to_SQL(
-                    column, column.column_constraints)}, "
-
-        for key in operation.table.table_constraints:
-            definition_string += (
-                f"{SQLite3ConstraintConverter.convert_constraint_to_SQL(key)}, "
-            )
-
-        return definition_string.strip(", ") + ");"
+        return SQLite3ColumnOperationConverter.convert_table_definition_to_SQL(
+            operation.table
+        )
 
     @staticmethod
     def _convert_drop_table_operation_to_SQL(operation: DeleteTableOperation) -> str:
@@ -79,15 +65,6 @@ class SQLite3TableOperationConverter(TableOperationSQLConverter):
 
     @staticmethod
     def _convert_rename_table_operation_to_SQL(operation: RenameTableOperation) -> str:
-        """Convert a given rename table operation to a SQLite3 SQL string. Since SQLite3 does not
-        support renaming a table directly, a new table with the same columns has to be instantiated after
-        deleting the original one."""
-        delete_op = DeleteTableOperation(operation.table)
-        create_op = CreateTableOperation(
-            SQLite3Typing.Table(operation.new_name, operation.table.columns)
-        )
-        return (
-            SQLite3TableOperationConverter.convert_table_operation_to_SQL(delete_op)
-            + " "
-            + SQLite3TableOperationConverter.convert_table_operation_to_SQL(create_op)
-        )
+        """Convert a given rename table operation to a SQLite3 SQL string. The table is renamed
+        in place, keeping its data."""
+        return f"ALTER TABLE {operation.table.name} RENAME TO {operation.new_name};"
@@ -0,0 +1,58 @@
+from typing import Any
+
+from skibidi_orm.migration_engine.data_mutator.base_async_data_mutator import (
+    BaseAsyncDataMutator,
+)
+from skibidi_orm.migration_engine.data_mutator.base_data_mutator import (
+    DeleteRowPk,
+    InsertRowColumn,
+)
+from skibidi_orm.migration_engine.db_config.postgres_config import PostgresConfig
+from skibidi_orm.migration_engine.sql_executor.sql_splitter import (
+    split_sql_statements,
+)
+
+
+class AsyncPostgresDataMutator(BaseAsyncDataMutator):
+    """
+    Mutates data of Postgres database over asynchronous psycopg (3) connections
+    taken from the pool of the config.
+    """
+
+    def __init__(self) -> None:
+        self.config = PostgresConfig.get_instance()
+
+    async def insert_row(self, table_name: str, row: list[InsertRowColumn]) -> None:
+        """Insert a row in the table."""
+        raise NotImplementedError
+
+    async def delete_row(self, table_name: str, pks: list[DeleteRowPk]) -> None:
+        """Delete a row in the table. Row identified by primary key subset."""
+        raise NotImplementedError
+
+    async def raw_query(self, query: str) -> list[Any]:
+        """
+        Execute a raw sql query in the database. The query may consist of many
+        statements, the rows returned by the last one are returned.
+        """
+        return await self._postgres_execute(*split_sql_statements(query))
+
+    async def get_rows(
+        self, table_name: str, limit: int = 100, offset: int = 0
+    ) -> list[Any]:
+        """Get paginated rows from the table."""
+        return await self._postgres_execute(
+            f"SELECT * FROM {table_name} LIMIT {limit} OFFSET {offset}"
+        )
+
+    async def _postgres_execute(self, *queries: str) -> list[Any]:
+        """
+        Execute the queries over a pooled connection, returns the result of the last one
+        (empty if it does not return rows).
+        """
+        async with self.config.async_cursor() as cursor:
+            for query in queries:
+                await cursor.execute(query)
+            if cursor.description is None:
+                return []
+            return await cursor.fetchall()
@@ -0,0 +1,16 @@
+from skibidi_orm.migration_engine.data_mutator.base_async_data_mutator import (
+    ExecutorBackedDataMutator,
+)
+from skibidi_orm.migration_engine.data_mutator.sqlite3_data_mutatorr import (
+    SQLite3DataMutator,
+)
+
+
+class AsyncSQLite3DataMutator(ExecutorBackedDataMutator):
+    """
+    Mutates data of SQLite3 database without blocking the event loop.
+    Every call opens its connection in a worker thread of the executor.
+    """
+
+    def __init__(self) -> None:
+        super().__init__(SQLite3DataMutator())
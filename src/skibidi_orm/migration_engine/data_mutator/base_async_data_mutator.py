@@ -0,0 +1,73 @@
+from abc import ABC, abstractmethod
+import asyncio
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Callable
+
+from skibidi_orm.migration_engine.data_mutator.base_data_mutator import (
+    BaseDataMutator,
+    DeleteRowPk,
+    InsertRowColumn,
+)
+
+
+class BaseAsyncDataMutator(ABC):
+    """
+    Non-blocking counterpart of BaseDataMutator, used by the studio server.
+    """
+
+    @abstractmethod
+    async def insert_row(self, table_name: str, row: list[InsertRowColumn]) -> None:
+        """Insert a row in the table."""
+        pass
+
+    @abstractmethod
+    async def delete_row(self, table_name: str, pks: list[DeleteRowPk]) -> None:
+        """Delete a row in the table. Row identified by primary key subset."""
+        pass
+
+    @abstractmethod
+    async def raw_query(self, query: str) -> list[Any]:
+        """Execute a raw sql query in the database."""
+        pass
+
+    @abstractmethod
+    async def get_rows(
+        self, table_name: str, limit: int = 100, offset: int = 0
+    ) -> list[Any]:
+        """Get paginated rows from the table."""
+        pass
+
+
+class ExecutorBackedDataMutator(BaseAsyncDataMutator):
+    """
+    Runs the calls of a blocking data mutator in a thread pool, so that
+    awaiting them never blocks the event loop.
+    """
+
+    def __init__(
+        self, mutator: BaseDataMutator, executor: ThreadPoolExecutor | None = None
+    ) -> None:
+        self.mutator = mutator
+        self.executor = executor or ThreadPoolExecutor(
+            thread_name_prefix="skibidi-async-mutator"
+        )
+
+    async def insert_row(self, table_name: str, row: list[InsertRowColumn]) -> None:
+        await self._run(self.mutator.insert_row, table_name, row)
+
+    async def delete_row(self, table_name: str, pks: list[DeleteRowPk]) -> None:
+        await self._run(self.mutator.delete_row, table_name, pks)
+
+    async def raw_query(self, query: str) -> list[Any]:
+        return await self._run(self.mutator.raw_query, query)
+
+    async def get_rows(
+        self, table_name: str, limit: int = 100, offset: int = 0
+    ) -> list[Any]:
+        return await self._run(self.mutator.get_rows, table_name, limit, offset)
+
+    async def _run[T](self, function: Callable[..., T], *args: Any) -> T:
+        """Run the blocking function in the executor"""
+        return await asyncio.get_running_loop().run_in_executor(
+            self.executor, function, *args
+        )
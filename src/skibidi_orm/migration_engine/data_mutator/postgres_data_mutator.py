@@ -7,6 +7,9 @@ from skibidi_orm.migration_engine.data_mutator.base_data_mutator import (
     InsertRowColumn,
 )
 from skibidi_orm.migration_engine.db_config.postgres_config import PostgresConfig
+from skibidi_orm.migration_engine.sql_executor.sql_splitter import (
+    split_sql_statements,
+)
 
 
 class PostgresDataMutator(BaseDataMutator):
@@ -19,18 +22,25 @@ class PostgresDataMutator(BaseDataMutator):
         raise NotImplementedError
 
     def raw_query(self, query: str) -> list[Any]:
-        """Execute a raw sql query in the database."""
+        """
+        Execute a raw sql query in the database. The query may consist of many
+        statements, the rows returned by the last one are returned.
+        """
         config = PostgresConfig.get_instance()
-        with config.connection.cursor() as cursor:
-            cursor.execute(query)
-            try:
-                return cursor.fetchall()
-            except ProgrammingError:
-                return []
+        with config.connection_pool.connection() as connection:
+            with connection.cursor() as cursor:
+                for statement in split_sql_statements(query):
+                    cursor.execute(statement)
+                try:
+                    rows = cursor.fetchall()
+                except ProgrammingError:
+                    rows = []
+            connection.commit()
+        return rows
 
     def get_rows(self, table_name: str, limit: int = 100, offset: int = 0) -> list[Any]:
         """Get paginated rows from the table."""
         config = PostgresConfig.get_instance()
-        with config.connection.cursor() as cursor:
+        with config.cursor() as cursor:
             cursor.execute(f"SELECT * FROM {table_name} LIMIT {limit} OFFSET {offset}")
             return cursor.fetchall()
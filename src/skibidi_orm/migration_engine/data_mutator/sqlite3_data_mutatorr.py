@@ -1,4 +1,3 @@
-import sqlite3
 from skibidi_orm.exceptions.db_mutator_exceptions import AmbigiousDeleteRowError
 from skibidi_orm.migration_engine.data_mutator.base_data_mutator import (
     BaseDataMutator,
@@ -6,6 +5,9 @@ from skibidi_orm.migration_engine.data_mutator.base_data_mutator import (
     InsertRowColumn,
 )
 from skibidi_orm.migration_engine.db_config.sqlite3_config import SQLite3Config
+from skibidi_orm.migration_engine.sql_executor.sql_splitter import (
+    split_sql_statements,
+)
 
 
 class SQLite3DataMutator(BaseDataMutator):
@@ -41,8 +43,7 @@ class SQLite3DataMutator(BaseDataMutator):
         Execute a query in the SQLite3 database, rutrns its result.
         """
 
-        db_path = self.config.db_path
-        with sqlite3.connect(db_path) as conn:
+        with self.config.connection_pool.connection() as conn:
             cursor = conn.cursor()
             cursor.execute(query, values)
             conn.commit()
@@ -51,8 +52,19 @@ class SQLite3DataMutator(BaseDataMutator):
         return data
 
     def raw_query(self, query: str):
-        """Execute a raw sql query in the database."""
-        return self._sqlite_execute(query, [])
+        """
+        Execute a raw sql query in the database. The query may consist of many
+        statements, the rows returned by the last one are returned.
+        """
+
+        with self.config.connection_pool.connection() as conn:
+            cursor = conn.cursor()
+            for statement in split_sql_statements(query):
+                cursor.execute(statement)
+            conn.commit()
+            data = cursor.fetchall()
+            cursor.close()
+        return data
 
     def get_rows(self, table_name: str, limit: int = 100, offset: int = 0):
         """Get paginated rows from the table."""
@@ -1,6 +1,8 @@
 from __future__ import annotations
 from typing import Any, Self
 from skibidi_orm.migration_engine.adapters.providers import DatabaseProvider
+from skibidi_orm.migration_engine.db_config.table_filter import TableFilter
+from skibidi_orm.migration_engine.state_manager.rename_detector import RenameDetector
 
 
 class BaseDbConfig:
@@ -18,6 +20,16 @@ class BaseDbConfig:
             raise ReferenceError("Instance does not exist")
         return BaseDbConfig.__instance
 
+    @property
+    def table_filter(self) -> TableFilter:
+        """Decides which tables are managed by the ORM, by default all of them"""
+        return TableFilter()
+
+    @property
+    def rename_detector(self) -> RenameDetector:
+        """Decides which dropped tables and columns were renamed, by default only tables with the same columns"""
+        return RenameDetector()
+
     def __init_subclass__(cls) -> None:
         """
         Ensures that only one instance of all subclasses of this class can be created.
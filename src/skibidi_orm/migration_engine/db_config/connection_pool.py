@@ -0,0 +1,359 @@
+from __future__ import annotations
+from collections import deque
+from contextlib import asynccontextmanager, contextmanager
+from dataclasses import dataclass
+from typing import Any, AsyncIterator, Awaitable, Callable, Iterator, Protocol
+import asyncio
+import threading
+import time
+import weakref
+
+from skibidi_orm.exceptions.config_exceptions import DbConnectionError
+
+
+class PoolableConnection(Protocol):
+    """Connection which can be kept in a pool, e.g. of sqlite3, psycopg2 or psycopg
+    (whose asynchronous connections return coroutines from these methods)"""
+
+    def rollback(self) -> Any: ...
+
+    def close(self) -> Any: ...
+
+
+@dataclass
+class PooledConnection[TConnection: PoolableConnection]:
+    """Connection kept by the pool, along with the times of its creation and last use"""
+
+    connection: TConnection
+    created_at: float
+    released_at: float
+
+
+class ConnectionPool[TConnection: PoolableConnection]:
+    """
+    Pool of connections to the database, owned by the database config.
+
+    Connections are opened lazily (apart from the warm-up ones) and at most size of them
+    are open at once; a thread asking for a connection when all of them are in use waits
+    for one to be released. A connection which was idle for at least health_check_interval
+    seconds is health checked before being handed out, and a connection older than max_age
+    seconds is recycled (closed and replaced with a new one). Released connections are
+    rolled back, so no transaction is left open in the pool.
+
+    Within a connection() block a thread is always given the same connection, so nested
+    blocks (e.g. a query run within a transaction) share it. A thread can also take
+    a connection for itself with thread_connection(), it is returned to the pool when
+    the thread ends.
+    """
+
+    def __init__(
+        self,
+        connect: Callable[[], TConnection],
+        is_healthy: Callable[[TConnection], bool],
+        size: int = 5,
+        warm_up: int = 0,
+        max_age: float | None = None,
+        health_check_interval: float = 30.0,
+        timeout: float = 30.0,
+    ) -> None:
+        self.connect = connect
+        self.is_healthy = is_healthy
+        self.size = max(1, size)
+        self.max_age = max_age
+        self.health_check_interval = health_check_interval
+        self.timeout = timeout
+
+        self._idle: deque[PooledConnection[TConnection]] = deque()
+        self._in_use: dict[int, PooledConnection[TConnection]] = {}
+        self._opening = 0  # connections being opened outside of the lock
+        self._condition = threading.Condition()
+        self._local = threading.local()
+        self._closed = False
+
+        self.warm_up(warm_up)
+
+    def warm_up(self, count: int) -> None:
+        """Open connections up front, so that the first queries do not wait for them"""
+        connections = [
+            self.acquire() for _ in range(min(count, self.size) - self.open_connections)
+        ]
+        for connection in connections:
+            self.release(connection)
+
+    @property
+    def open_connections(self) -> int:
+        """Number of connections opened by the pool, idle or in use"""
+        with self._condition:
+            return self._open_connections()
+
+    def _open_connections(self) -> int:
+        return len(self._idle) + len(self._in_use) + self._opening
+
+    def acquire(self) -> TConnection:
+        """
+        Take a connection from the pool, waiting for at most timeout seconds
+        if all of the connections are in use.
+        """
+        deadline = time.monotonic() + self.timeout
+        with self._condition:
+            if self._closed:
+                raise DbConnectionError("The connection pool is closed")
+            while not self._idle and self._open_connections() >= self.size:
+                remaining = deadline - time.monotonic()
+                if remaining <= 0 or not self._condition.wait(remaining):
+                    raise DbConnectionError(
+                        f"No connection was released within {self.timeout} seconds"
+                    )
+            if self._idle:
+                pooled = self._idle.pop()
+                self._in_use[id(pooled.connection)] = pooled
+            else:
+                pooled = None
+                self._opening += 1
+
+        if pooled is None:
+            return self._open().connection
+        try:
+            return self._checked(pooled).connection
+        except BaseException:
+            with self._condition:
+                del self._in_use[id(pooled.connection)]
+                self._condition.notify()
+            raise
+
+    def _open(self) -> PooledConnection[TConnection]:
+        """Open a new connection in the slot reserved for it by acquire"""
+        try:
+            now = time.monotonic()
+            pooled = PooledConnection(self.connect(), now, now)
+        except BaseException:
+            with self._condition:
+                self._opening -= 1
+                self._condition.notify()
+            raise
+        with self._condition:
+            self._opening -= 1
+            self._in_use[id(pooled.connection)] = pooled
+        return pooled
+
+    def _checked(
+        self, pooled: PooledConnection[TConnection]
+    ) -> PooledConnection[TConnection]:
+        """
+        Recycle the connection if it is too old or not healthy,
+        returns the connection to be handed out.
+        """
+        now = time.monotonic()
+        expired = self.max_age is not None and now - pooled.created_at >= self.max_age
+        if not expired and (
+            now - pooled.released_at < self.health_check_interval
+            or self.is_healthy(pooled.connection)
+        ):
+            return pooled
+
+        self._close(pooled.connection)
+        with self._condition:
+            del self._in_use[id(pooled.connection)]
+            self._opening += 1
+        return self._open()
+
+    def release(self, connection: TConnection) -> None:
+        """Return the connection to the pool, discarding it if it cannot be rolled back"""
+        try:
+            connection.rollback()
+            reusable = True
+        except Exception:
+            reusable = False
+
+        with self._condition:
+            pooled = self._in_use.pop(id(connection), None)
+            if pooled is None:
+                return
+            if reusable and not self._closed:
+                pooled.released_at = time.monotonic()
+                self._idle.append(pooled)
+            else:
+                self._close(connection)
+            self._condition.notify()
+
+    @contextmanager
+    def connection(self) -> Iterator[TConnection]:
+        """
+        Hand out a connection for the duration of the block, the connection
+        already held by the current thread if there is one.
+        """
+        held = getattr(self._local, "pinned", None) or getattr(
+            self._local, "connection", None
+        )
+        if held is not None:
+            yield held
+            return
+
+        connection = self.acquire()
+        self._local.connection = connection
+        try:
+            yield connection
+        finally:
+            self._local.connection = None
+            self.release(connection)
+
+    def thread_connection(self) -> TConnection:
+        """
+        The connection taken by the current thread for itself, returned to the pool
+        when the thread ends (or by release_thread_connection).
+        """
+        pinned = getattr(self._local, "pinned", None)
+        if pinned is None:
+            pinned = self._local.pinned = self.acquire()
+            self._local.finalizer = weakref.finalize(
+                threading.current_thread(), self.release, pinned
+            )
+        return pinned
+
+    def release_thread_connection(self) -> None:
+        """Return the connection taken by the current thread to the pool"""
+        finalizer = getattr(self._local, "finalizer", None)
+        if finalizer is not None:
+            self._local.pinned = None
+            self._local.finalizer = None
+            finalizer()
+
+    def close(self) -> None:
+        """Close the idle connections, the ones in use are closed when released"""
+        with self._condition:
+            self._closed = True
+            while self._idle:
+                self._close(self._idle.pop().connection)
+            self._condition.notify_all()
+
+    def _close(self, connection: TConnection) -> None:
+        try:
+            connection.close()
+        except Exception:
+            pass
+
+
+class AsyncConnectionPool[TConnection: PoolableConnection]:
+    """
+    Asynchronous counterpart of ConnectionPool, handing out asynchronous connections
+    (e.g. of psycopg) to the coroutines of an event loop.
+
+    At most size connections are open at once; a coroutine asking for a connection when
+    all of them are in use waits for one to be released. Idle connections are health
+    checked and old ones are recycled the same way as by ConnectionPool, and released
+    connections are rolled back.
+    """
+
+    def __init__(
+        self,
+        connect: Callable[[], Awaitable[TConnection]],
+        is_healthy: Callable[[TConnection], Awaitable[bool]],
+        size: int = 5,
+        max_age: float | None = None,
+        health_check_interval: float = 30.0,
+        timeout: float = 30.0,
+    ) -> None:
+        self.connect = connect
+        self.is_healthy = is_healthy
+        self.size = max(1, size)
+        self.max_age = max_age
+        self.health_check_interval = health_check_interval
+        self.timeout = timeout
+
+        self._idle: deque[PooledConnection[TConnection]] = deque()
+        self._in_use: dict[int, PooledConnection[TConnection]] = {}
+        # slots of the connections in use, bound to the event loop first waiting on it
+        self._slots = asyncio.Semaphore(self.size)
+        self._closed = False
+
+    @property
+    def open_connections(self) -> int:
+        """Number of connections opened by the pool, idle or in use"""
+        return len(self._idle) + len(self._in_use)
+
+    async def acquire(self) -> TConnection:
+        """
+        Take a connection from the pool, waiting for at most timeout seconds
+        if all of the connections are in use.
+        """
+        if self._closed:
+            raise DbConnectionError("The connection pool is closed")
+        try:
+            await asyncio.wait_for(self._slots.acquire(), self.timeout)
+        except TimeoutError:
+            raise DbConnectionError(
+                f"No connection was released within {self.timeout} seconds"
+            )
+
+        try:
+            if self._idle:
+                pooled = await self._checked(self._idle.pop())
+            else:
+                pooled = await self._open()
+        except BaseException:
+            self._slots.release()
+            raise
+        self._in_use[id(pooled.connection)] = pooled
+        return pooled.connection
+
+    async def _open(self) -> PooledConnection[TConnection]:
+        """Open a new connection in the slot taken by acquire"""
+        now = time.monotonic()
+        return PooledConnection(await self.connect(), now, now)
+
+    async def _checked(
+        self, pooled: PooledConnection[TConnection]
+    ) -> PooledConnection[TConnection]:
+        """
+        Recycle the connection if it is too old or not healthy,
+        returns the connection to be handed out.
+        """
+        now = time.monotonic()
+        expired = self.max_age is not None and now - pooled.created_at >= self.max_age
+        if not expired and (
+            now - pooled.released_at < self.health_check_interval
+            or await self.is_healthy(pooled.connection)
+        ):
+            return pooled
+
+        await self._close(pooled.connection)
+        return await self._open()
+
+    async def release(self, connection: TConnection) -> None:
+        """Return the connection to the pool, discarding it if it cannot be rolled back"""
+        pooled = self._in_use.pop(id(connection), None)
+        if pooled is None:
+            return
+        try:
+            await connection.rollback()
+            reusable = True
+        except Exception:
+            reusable = False
+
+        if reusable and not self._closed:
+            pooled.released_at = time.monotonic()
+            self._idle.append(pooled)
+        else:
+            await self._close(connection)
+        self._slots.release()
+
+    @asynccontextmanager
+    async def connection(self) -> AsyncIterator[TConnection]:
+        """Hand out a connection for the duration of the block"""
+        connection = await self.acquire()
+        try:
+            yield connection
+        finally:
+            await self.release(connection)
+
+    async def close(self) -> None:
+        """Close the idle connections, the ones in use are closed when released"""
+        self._closed = True
+        while self._idle:
+            await self._close(self._idle.pop().connection)
+
+    async def _close(self, connection: TConnection) -> None:
+        try:
+            await connection.close()
+        except Exception:
+            pass
@@ -0,0 +1,53 @@
+from __future__ import annotations
+from typing import Callable
+import random
+import time
+
+
+class LockRetry:
+    """
+    Retries the transactions which failed to get a lock held by another connection.
+
+    Each attempt waits for locks for at most lock_timeout seconds (less when the remaining
+    budget is shorter), so the connections queued behind a migration waiting for a lock
+    are not held up for longer. The attempts are separated by exponentially growing waits
+    with full jitter, starting from backoff seconds and capped at max_backoff seconds.
+    When the next attempt would start max_wait seconds after the first one, the error
+    of the last attempt is raised instead.
+    """
+
+    def __init__(
+        self,
+        is_lock_error: Callable[[Exception], bool],
+        lock_timeout: float = 5.0,
+        max_wait: float = 30.0,
+        backoff: float = 0.05,
+        max_backoff: float = 2.0,
+    ) -> None:
+        self.is_lock_error = is_lock_error
+        self.lock_timeout = lock_timeout
+        self.max_wait = max_wait
+        self.backoff = backoff
+        self.max_backoff = max_backoff
+
+    def delay(self, retry: int) -> float:
+        """Seconds waited before the given retry (counted from 0)"""
+        return random.uniform(0, min(self.max_backoff, self.backoff * 2**retry))
+
+    def run[T](self, attempt: Callable[[float], T]) -> T:
+        """
+        Run the attempt, given the number of seconds it may wait for a lock,
+        until it does not fail with a lock error or the budget runs out.
+        """
+        deadline = time.monotonic() + self.max_wait
+        retry = 0
+        while True:
+            lock_timeout = min(self.lock_timeout, deadline - time.monotonic())
+            try:
+                return attempt(max(lock_timeout, 0.001))
+            except Exception as e:
+                delay = self.delay(retry)
+                if not self.is_lock_error(e) or time.monotonic() + delay >= deadline:
+                    raise
+            time.sleep(delay)
+            retry += 1
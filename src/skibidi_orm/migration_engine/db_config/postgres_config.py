@@ -4,7 +4,25 @@ from skibidi_orm.migration_engine.adapters.providers import DatabaseProvider
 from skibidi_orm.migration_engine.db_config.base_config import (
     BaseDbConfig,
 )
-from psycopg2.extensions import connection as Connection
+from skibidi_orm.migration_engine.db_config.connection_pool import (
+    AsyncConnectionPool,
+    ConnectionPool,
+)
+from skibidi_orm.migration_engine.db_config.lock_retry import LockRetry
+from skibidi_orm.migration_engine.db_config.table_filter import (
+    TableFilter,
+    TablePattern,
+)
+from skibidi_orm.migration_engine.state_manager.rename_detector import RenameDetector
+from psycopg2.extensions import connection as Connection, cursor as Cursor
+from contextlib import asynccontextmanager, contextmanager
+from importlib.util import find_spec
+from typing import TYPE_CHECKING, Any, AsyncIterator, Iterable, Iterator
+
+# the optional psycopg (3) driver enables asynchronous connections
+PSYCOPG_SPEC = find_spec("psycopg")
+if TYPE_CHECKING or PSYCOPG_SPEC is not None:
+    import psycopg
 
 
 class PostgresConfig(BaseDbConfig):
@@ -17,14 +35,64 @@ class PostgresConfig(BaseDbConfig):
     """
 
     def __init__(
-        self, db_name: str, db_user: str, db_password: str, db_host: str, db_port: int
+        self,
+        db_name: str,
+        db_user: str,
+        db_password: str,
+        db_host: str,
+        db_port: int,
+        inspection_workers: int = 1,
+        inspection_chunk_size: int = 100,
+        diff_workers: int = 1,
+        execution_batch_size: int = 100,
+        schema: str = "public",
+        include_tables: Iterable[TablePattern] = (),
+        exclude_tables: Iterable[TablePattern] = (),
+        rename_detector: RenameDetector | None = None,
+        pool_size: int = 5,
+        pool_warm_up: int = 1,
+        pool_max_age: float | None = None,
+        pool_health_check_interval: float = 30.0,
+        pool_timeout: float = 30.0,
+        lock_timeout: float = 5.0,
+        lock_max_wait: float = 30.0,
+        lock_backoff: float = 0.05,
     ):
         self.__db_name = db_name
         self.__db_user = db_user
         self.__db_password = db_password
         self.__db_host = db_host
         self.__db_port = db_port
-        self.__connection = self.__create_connection()
+        self.__inspection_workers = inspection_workers
+        self.__inspection_chunk_size = inspection_chunk_size
+        self.__diff_workers = diff_workers
+        self.__execution_batch_size = execution_batch_size
+        self.__schema = schema
+        self.__table_filter = TableFilter(tuple(include_tables), tuple(exclude_tables))
+        self.__rename_detector = rename_detector or RenameDetector()
+        self.__connection_pool = ConnectionPool[Connection](
+            self.create_connection,
+            PostgresConfig.is_connection_healthy,
+            size=pool_size,
+            warm_up=pool_warm_up,
+            max_age=pool_max_age,
+            health_check_interval=pool_health_check_interval,
+            timeout=pool_timeout,
+        )
+        self.__async_connection_pool = AsyncConnectionPool[Any](
+            self.create_async_connection,
+            PostgresConfig.is_async_connection_healthy,
+            size=pool_size,
+            max_age=pool_max_age,
+            health_check_interval=pool_health_check_interval,
+            timeout=pool_timeout,
+        )
+        self.__lock_retry = LockRetry(
+            PostgresConfig.is_lock_error,
+            lock_timeout=lock_timeout,
+            max_wait=lock_max_wait,
+            backoff=lock_backoff,
+        )
 
     @property
     def db_name(self) -> str:
@@ -46,20 +114,149 @@ class PostgresConfig(BaseDbConfig):
     def db_port(self) -> int:
         return self.__db_port
 
+    @property
+    def inspection_workers(self) -> int:
+        """Number of threads (and connections) used to inspect the database"""
+        return self.__inspection_workers
+
+    @property
+    def inspection_chunk_size(self) -> int:
+        """Number of tables inspected at once by a single inspection worker"""
+        return self.__inspection_chunk_size
+
+    @property
+    def diff_workers(self) -> int:
+        """Number of processes comparing the database tables with the schema tables"""
+        return self.__diff_workers
+
+    @property
+    def execution_batch_size(self) -> int:
+        """Number of migration statements sent to the database in a single round trip"""
+        return self.__execution_batch_size
+
+    @property
+    def schema(self) -> str:
+        """Name of the schema whose tables are managed by the ORM"""
+        return self.__schema
+
+    @property
+    def table_filter(self) -> TableFilter:
+        return self.__table_filter
+
+    @property
+    def rename_detector(self) -> RenameDetector:
+        return self.__rename_detector
+
+    @property
+    def connection_pool(self) -> ConnectionPool[Connection]:
+        """Pool of the connections used by all of the components"""
+        return self.__connection_pool
+
+    @property
+    def async_connection_pool(self) -> AsyncConnectionPool[Any]:
+        """Pool of the asynchronous connections used by the studio server"""
+        return self.__async_connection_pool
+
+    @property
+    def lock_retry(self) -> LockRetry:
+        """Limits on how long migrations wait for locks held by other connections"""
+        return self.__lock_retry
+
     @property
     def connection(self) -> Connection:
-        return self.__connection
+        """Connection taken from the pool by the current thread for itself"""
+        return self.__connection_pool.thread_connection()
+
+    @contextmanager
+    def cursor(self) -> Iterator[Cursor]:
+        """Cursor of a connection taken from the pool for the duration of the block"""
+        with self.__connection_pool.connection() as connection:
+            with connection.cursor() as cursor:
+                yield cursor
+
+    @asynccontextmanager
+    async def async_cursor(self) -> AsyncIterator[Any]:
+        """
+        Cursor of an asynchronous connection taken from the pool
+        for the duration of the block, requires psycopg (3)
+        """
+        async with self.__async_connection_pool.connection() as connection:
+            async with connection.cursor() as cursor:
+                yield cursor
+
+    @property
+    def connection_options(self) -> str:
+        """
+        Command-line options of the server sessions, setting their search path to the
+        configured schema, so that unqualified names (of the migrated tables, the revision
+        table, the data queries) resolve in it just like in the inspection queries.
+        """
+        schema = '"' + self.schema.replace('"', '""') + '"'
+        return "-c search_path=" + schema.replace("\\", "\\\\").replace(" ", "\\ ")
 
-    def __create_connection(self) -> Connection:
+    def create_connection(self) -> Connection:
+        """Open a new connection to the database"""
         try:
             connection = psycopg2.connect(
+                dbname=self.db_name,
                 user=self.db_user,
                 password=self.db_password,
                 host=self.db_host,
                 port=self.db_port,
-                database=self.db_name,
+                options=self.connection_options,
             )
         except psycopg2.OperationalError as e:
             raise DbConnectionError(e)
 
         return connection
+
+    @staticmethod
+    def is_connection_healthy(connection: Connection) -> bool:
+        if connection.closed:
+            return False
+        try:
+            with connection.cursor() as cursor:
+                cursor.execute("SELECT 1;")
+            connection.rollback()
+        except psycopg2.Error:
+            return False
+        return True
+
+    @staticmethod
+    def is_lock_error(error: Exception) -> bool:
+        """Whether the error was caused by a lock held by another connection"""
+        return isinstance(
+            error, (psycopg2.errors.LockNotAvailable, psycopg2.errors.DeadlockDetected)
+        )
+
+    @property
+    def supports_async_connections(self) -> bool:
+        """Whether the optional psycopg (3) driver for asynchronous connections is installed"""
+        return PSYCOPG_SPEC is not None
+
+    async def create_async_connection(self) -> Any:
+        """Open a new asynchronous connection to the database, requires psycopg (3)"""
+        if PSYCOPG_SPEC is None:
+            raise ImportError("Asynchronous connections require the psycopg package")
+        try:
+            return await psycopg.AsyncConnection.connect(
+                user=self.db_user,
+                password=self.db_password,
+                host=self.db_host,
+                port=self.db_port,
+                dbname=self.db_name,
+                options=self.connection_options,
+                autocommit=True,
+            )
+        except psycopg.OperationalError as e:
+            raise DbConnectionError(e)
+
+    @staticmethod
+    async def is_async_connection_healthy(connection: Any) -> bool:
+        if connection.closed:
+            return False
+        try:
+            await connection.execute("SELECT 1;")
+        except psycopg.Error:
+            return False
+        return True
@@ -1,8 +1,18 @@
 from skibidi_orm.migration_engine.adapters.providers import DatabaseProvider
+from skibidi_orm.migration_engine.db_config.connection_pool import ConnectionPool
+from skibidi_orm.migration_engine.db_config.lock_retry import LockRetry
+from skibidi_orm.migration_engine.db_config.sqlite3_profile import SQLite3Profile
 from skibidi_orm.migration_engine.db_config.base_config import (
     BaseDbConfig,
 )
+from skibidi_orm.migration_engine.db_config.table_filter import (
+    TableFilter,
+    TablePattern,
+)
+from skibidi_orm.migration_engine.state_manager.rename_detector import RenameDetector
+from typing import Iterable
 import os
+import sqlite3
 
 
 # TODO: make a dataclass out of config classes
@@ -14,9 +24,106 @@ class SQLite3Config(BaseDbConfig):
 
     database_provider = DatabaseProvider.SQLITE3
 
-    def __init__(self, db_path: str):
+    def __init__(
+        self,
+        db_path: str,
+        include_tables: Iterable[TablePattern] = (),
+        exclude_tables: Iterable[TablePattern] = (),
+        rename_detector: RenameDetector | None = None,
+        inspection_chunk_size: int = 100,
+        pool_size: int = 5,
+        pool_warm_up: int = 0,
+        pool_max_age: float | None = None,
+        pool_health_check_interval: float = 30.0,
+        pool_timeout: float = 30.0,
+        lock_timeout: float = 5.0,
+        lock_max_wait: float = 30.0,
+        lock_backoff: float = 0.05,
+        profile: SQLite3Profile | str = "default",
+        migration_profile: SQLite3Profile | str = "bulk_migration",
+    ):
         self.__db_path = os.path.abspath(db_path)
+        self.__table_filter = TableFilter(tuple(include_tables), tuple(exclude_tables))
+        self.__rename_detector = rename_detector or RenameDetector()
+        self.__inspection_chunk_size = inspection_chunk_size
+        self.__profile = SQLite3Profile.named(profile)
+        self.__migration_profile = SQLite3Profile.named(migration_profile)
+        self.__connection_pool = ConnectionPool[sqlite3.Connection](
+            self.create_connection,
+            SQLite3Config.is_connection_healthy,
+            size=pool_size,
+            warm_up=pool_warm_up,
+            max_age=pool_max_age,
+            health_check_interval=pool_health_check_interval,
+            timeout=pool_timeout,
+        )
+        self.__lock_retry = LockRetry(
+            SQLite3Config.is_lock_error,
+            lock_timeout=lock_timeout,
+            max_wait=lock_max_wait,
+            backoff=lock_backoff,
+        )
 
     @property
     def db_path(self) -> str:
         return self.__db_path
+
+    @property
+    def table_filter(self) -> TableFilter:
+        return self.__table_filter
+
+    @property
+    def rename_detector(self) -> RenameDetector:
+        return self.__rename_detector
+
+    @property
+    def inspection_chunk_size(self) -> int:
+        """Number of tables inspected at once when the tables are streamed"""
+        return self.__inspection_chunk_size
+
+    @property
+    def profile(self) -> SQLite3Profile:
+        """Performance settings applied to every pooled connection"""
+        return self.__profile
+
+    @property
+    def migration_profile(self) -> SQLite3Profile:
+        """Performance settings switched on for the duration of migrations"""
+        return self.__migration_profile
+
+    @property
+    def connection_pool(self) -> ConnectionPool[sqlite3.Connection]:
+        """Pool of the connections used by all of the components"""
+        return self.__connection_pool
+
+    @property
+    def lock_retry(self) -> LockRetry:
+        """Limits on how long migrations wait for locks held by other connections"""
+        return self.__lock_retry
+
+    def create_connection(self) -> sqlite3.Connection:
+        """
+        Open a new connection to the database, applying the profile and registering
+        the REGEXP function used by the table filter. Pooled connections are handed
+        out to one thread at a time, but not always the same one.
+        """
+        conn = sqlite3.connect(self.db_path, check_same_thread=False)
+        conn.create_function("regexp", 2, TableFilter.regexp, deterministic=True)
+        self.profile.apply(conn)
+        return conn
+
+    @staticmethod
+    def is_connection_healthy(conn: sqlite3.Connection) -> bool:
+        try:
+            conn.execute("SELECT 1;")
+        except sqlite3.Error:
+            return False
+        return True
+
+    @staticmethod
+    def is_lock_error(error: Exception) -> bool:
+        """Whether the error was caused by a lock held by another connection"""
+        return isinstance(error, sqlite3.OperationalError) and (
+            (getattr(error, "sqlite_errorcode", 0) & 0xFF)
+            in (sqlite3.SQLITE_BUSY, sqlite3.SQLITE_LOCKED)
+        )
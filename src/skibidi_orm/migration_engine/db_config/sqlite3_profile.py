@@ -0,0 +1,123 @@
+from __future__ import annotations
+from contextlib import contextmanager
+from dataclasses import dataclass, fields, replace
+from typing import Any, Iterator
+import sqlite3
+
+
+@dataclass(frozen=True)
+class SQLite3Profile:
+    """
+    Performance settings applied to SQLite3 connections with PRAGMA statements.
+    Settings left as None keep whatever the connection uses.
+
+    Attributes:
+        journal_mode (str | None): e.g. WAL, letting readers work alongside a writer.
+
+        synchronous (str | None): OFF, NORMAL, FULL or EXTRA - how often the file is synced.
+
+        cache_size (int | None): Pages, or KiB when negative.
+
+        mmap_size (int | None): Bytes of the file accessed through memory mapping.
+
+        temp_store (str | None): DEFAULT, FILE or MEMORY - where temporary tables live.
+
+        busy_timeout (int | None): Milliseconds waited for a lock held by another connection.
+
+        foreign_keys (bool | None): Whether foreign keys are enforced.
+
+        locking_mode (str | None): NORMAL or EXCLUSIVE - whether locks are kept between transactions.
+    """
+
+    journal_mode: str | None = None
+    synchronous: str | None = None
+    cache_size: int | None = None
+    mmap_size: int | None = None
+    temp_store: str | None = None
+    busy_timeout: int | None = None
+    foreign_keys: bool | None = None
+    locking_mode: str | None = None
+
+    @staticmethod
+    def named(profile: SQLite3Profile | str) -> SQLite3Profile:
+        """The given profile, or the profile with the given name"""
+        if isinstance(profile, SQLite3Profile):
+            return profile
+        try:
+            return SQLITE3_PROFILES[profile]
+        except KeyError:
+            raise ValueError(
+                f"Unknown SQLite3 profile {profile!r}, use one of: {', '.join(SQLITE3_PROFILES)}"
+            )
+
+    def settings(self) -> dict[str, Any]:
+        """The settings of the profile which are not None"""
+        return {
+            field.name: getattr(self, field.name)
+            for field in fields(self)
+            if getattr(self, field.name) is not None
+        }
+
+    def apply(self, conn: sqlite3.Connection) -> None:
+        """Apply the settings to the connection, must not be called within a transaction"""
+        for pragma, value in self.settings().items():
+            conn.execute(
+                f"PRAGMA {pragma} = {int(value) if isinstance(value, bool) else value};"
+            )
+
+    def read(self, conn: sqlite3.Connection) -> SQLite3Profile:
+        """The current values of the settings of this profile on the connection"""
+        return SQLite3Profile(
+            **{
+                pragma: conn.execute(f"PRAGMA {pragma};").fetchone()[0]
+                for pragma in self.settings()
+            }
+        )
+
+    @contextmanager
+    def applied(self, conn: sqlite3.Connection) -> Iterator[None]:
+        """
+        Apply the settings for the duration of the block, restoring the previous ones
+        afterwards. The block must not leave a transaction open.
+        The locking mode of a database in WAL mode is left as it is, as a database
+        entering WAL mode in the exclusive locking mode cannot leave it.
+        """
+        profile = self
+        if (
+            self.locking_mode is not None
+            and conn.execute("PRAGMA journal_mode;").fetchone()[0] == "wal"
+        ):
+            profile = replace(self, locking_mode=None)
+
+        previous = profile.read(conn)
+        profile.apply(conn)
+        try:
+            yield
+        finally:
+            previous.apply(conn)
+            if profile.locking_mode is not None:
+                # the exclusive lock is released when the file is accessed next
+                conn.execute("SELECT 1 FROM sqlite_master LIMIT 1;").fetchall()
+
+
+SQLITE3_PROFILES = {
+    # the settings of SQLite3 itself
+    "default": SQLite3Profile(),
+    # concurrent reads alongside writes, fewer syncs, more memory for caching
+    "performance": SQLite3Profile(
+        journal_mode="WAL",
+        synchronous="NORMAL",
+        cache_size=-65536,
+        mmap_size=268435456,
+        temp_store="MEMORY",
+        busy_timeout=5000,
+    ),
+    # used for the duration of migrations: a single lock held throughout and no syncs,
+    # so a crash of the operating system (not of the process) may corrupt the file
+    "bulk_migration": SQLite3Profile(
+        synchronous="OFF",
+        cache_size=-262144,
+        temp_store="MEMORY",
+        locking_mode="EXCLUSIVE",
+    ),
+}
@@ -0,0 +1,120 @@
+from __future__ import annotations
+from dataclasses import dataclass, field
+from typing import Callable
+from fnmatch import fnmatchcase
+import re
+
+type TablePattern = str | re.Pattern[str]
+
+
+@dataclass(frozen=True)
+class TableFilter:
+    """
+    Decides which tables of the database are managed by the ORM.
+    Patterns given as strings are globs (e.g. "app_*"), compiled regular
+    expressions are matched with search semantics. A table is managed when it
+    matches any include pattern (or there are none) and no exclude pattern.
+    Unmanaged tables are never inspected, diffed or dropped.
+    """
+
+    include: tuple[TablePattern, ...] = field(default_factory=tuple)
+    exclude: tuple[TablePattern, ...] = field(default_factory=tuple)
+
+    @property
+    def is_empty(self) -> bool:
+        return not self.include and not self.exclude
+
+    def matches(self, table_name: str) -> bool:
+        """Check whether the table with the given name is managed"""
+        if self.include and not any(
+            TableFilter._pattern_matches(pattern, table_name)
+            for pattern in self.include
+        ):
+            return False
+        return not any(
+            TableFilter._pattern_matches(pattern, table_name)
+            for pattern in self.exclude
+        )
+
+    def to_sqlite3_condition(self, column: str) -> tuple[str, dict[str, str]]:
+        """Build a SQLite3 condition selecting the managed tables by the given column.
+        Uses named parameters, regular expressions require a REGEXP function
+        registered on the connection (see regexp)."""
+        return self._to_condition(
+            column,
+            lambda name: f":{name}",
+            lambda pattern: ("GLOB", pattern),
+            lambda pattern: ("REGEXP", pattern.pattern),
+        )
+
+    def to_postgres_condition(self, column: str) -> tuple[str, dict[str, str]]:
+        """Build a Postgres condition selecting the managed tables by the given column.
+        Uses pyformat parameters, globs are translated to POSIX regular expressions."""
+        return self._to_condition(
+            column,
+            lambda name: f"%({name})s",
+            lambda pattern: ("~", TableFilter.glob_to_posix_regex(pattern)),
+            lambda pattern: ("~", pattern.pattern),
+        )
+
+    def _to_condition(
+        self,
+        column: str,
+        placeholder: Callable[[str], str],
+        glob_operator: Callable[[str], tuple[str, str]],
+        regex_operator: Callable[[re.Pattern[str]], tuple[str, str]],
+    ) -> tuple[str, dict[str, str]]:
+        """Build a condition for the given dialect"""
+        params: dict[str, str] = {}
+
+        def alternatives(kind: str, patterns: tuple[TablePattern, ...]) -> str:
+            conditions: list[str] = []
+            for i, pattern in enumerate(patterns):
+                name = f"table_filter_{kind}_{i}"
+                operator, params[name] = (
+                    glob_operator(pattern)
+                    if isinstance(pattern, str)
+                    else regex_operator(pattern)
+                )
+                conditions.append(f"{column} {operator} {placeholder(name)}")
+            return "(" + " OR ".join(conditions) + ")"
+
+        conditions = ["1 = 1"]
+        if self.include:
+            conditions.append(alternatives("include", self.include))
+        if self.exclude:
+            conditions.append(f"NOT {alternatives('exclude', self.exclude)}")
+        return " AND ".join(conditions), params
+
+    @staticmethod
+    def regexp(pattern: str, value: str | None) -> bool:
+        """Implementation of the SQLite3 REGEXP function"""
+        return value is not None and re.search(pattern, value) is not None
+
+    @staticmethod
+    def glob_to_posix_regex(pattern: str) -> str:
+        """Translate a glob into an anchored POSIX regular expression"""
+        regex = ""
+        i = 0
+        while i < len(pattern):
+            char = pattern[i]
+            if char == "*":
+                regex += ".*"
+            elif char == "?":
+                regex += "."
+            elif char == "[" and (end := pattern.find("]", i + 2)) != -1:
+                content = pattern[i + 1 : end]
+                if content.startswith("!"):
+                    content = "^" + content[1:]
+                regex += f"[{content}]"
+                i = end
+            else:
+                regex += re.escape(char)
+            i += 1
+        return f"^{regex}$"
+
+    @staticmethod
+    def _pattern_matches(pattern: TablePattern, table_name: str) -> bool:
+        if isinstance(pattern, str):
+            return fnmatchcase(table_name, pattern)
+        return pattern.search(table_name) is not None
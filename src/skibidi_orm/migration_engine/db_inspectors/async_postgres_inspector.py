@@ -0,0 +1,88 @@
+from typing import Any
+
+from skibidi_orm.migration_engine.adapters.postgres_typing import PostgresTyping
+from skibidi_orm.migration_engine.db_inspectors.base_async_inspector import (
+    BaseAsyncDbInspector,
+)
+from skibidi_orm.migration_engine.db_inspectors.inspection_cache import InspectionCache
+from skibidi_orm.migration_engine.db_inspectors.postgres_inspector import (
+    COLUMNS_QUERY,
+    FOREIGN_KEYS_QUERY,
+    KEY_CONSTRAINTS_QUERY,
+    SCHEMA_FINGERPRINT_QUERY,
+    CatalogRows,
+    PostgresInspector,
+)
+
+
+class AsyncPostgresInspector(BaseAsyncDbInspector):
+    """
+    Used to get data from live Postgres database without blocking the event loop.
+    Runs the same bulk pg_catalog queries as PostgresInspector over asynchronous
+    psycopg (3) connections taken from the pool of the config.
+    """
+
+    def __init__(self) -> None:
+        self.inspector = PostgresInspector()
+        self.config = self.inspector.config
+
+    async def get_tables(self) -> list[PostgresTyping.Table]:
+        """
+        Get all tables from the database, served from the inspection cache
+        when the schema did not change.
+        """
+        return await InspectionCache(self.config).get_tables_async(
+            self.get_schema_fingerprint, lambda: self._get_tables_snapshot(None)
+        )
+
+    async def get_schema_fingerprint(self) -> str:
+        """
+        Fingerprint the schema the same way as PostgresInspector.
+        """
+        (rows,) = await self._fetch_all(
+            [(SCHEMA_FINGERPRINT_QUERY, {"schema": self.inspector.schema})]
+        )
+        return self.inspector.schema_fingerprint(rows[0][0] if rows else "")
+
+    async def get_tables_names(self) -> list[str]:
+        """
+        Get all tables names from the database.
+        """
+        rows = await self._fetch_all([self.inspector.tables_names_query()])
+        return [row[0] for row in rows[0]]
+
+    async def get_table_columns(self, table_name: str) -> list[PostgresTyping.Column]:
+        """
+        Get all columns from the table.
+        """
+        tables = await self._get_tables_snapshot([table_name])
+        return tables[0].columns if tables else []
+
+    async def _get_tables_snapshot(
+        self, tables_names: list[str] | None
+    ) -> list[PostgresTyping.Table]:
+        """
+        Load the given tables (all tables of the schema if None) over a single
+        pooled asynchronous connection.
+        """
+        rows = await self._fetch_all(
+            [self.inspector.tables_names_query(tables_names)]
+            + [
+                self.inspector.catalog_query(query, tables_names)
+                for query in (COLUMNS_QUERY, KEY_CONSTRAINTS_QUERY, FOREIGN_KEYS_QUERY)
+            ]
+        )
+        return PostgresInspector.tables_from_catalog_rows(*rows)
+
+    async def _fetch_all(
+        self, queries: list[tuple[str, dict[str, Any]]]
+    ) -> list[CatalogRows]:
+        """
+        Execute the queries one by one over a pooled connection, returns their rows.
+        """
+        results: list[CatalogRows] = []
+        async with self.config.async_cursor() as cursor:
+            for query, params in queries:
+                await cursor.execute(query, params)
+                results.append(await cursor.fetchall())
+        return results
@@ -0,0 +1,72 @@
+from abc import ABC, abstractmethod
+import asyncio
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Callable
+
+from skibidi_orm.migration_engine.adapters.base_adapter import (
+    BaseColumn,
+    BaseTable,
+)
+from skibidi_orm.migration_engine.db_inspectors.base_inspector import BaseDbInspector
+from skibidi_orm.migration_engine.db_inspectors.inspection_cache import InspectionCache
+
+
+class BaseAsyncDbInspector(ABC):
+    """
+    Non-blocking counterpart of BaseDbInspector, used by the studio server.
+    """
+
+    @abstractmethod
+    async def get_tables(self) -> list[BaseTable[BaseColumn[Any]]]:
+        """
+        Get all tables from the database.
+        """
+        pass
+
+    @abstractmethod
+    async def get_tables_names(self) -> list[str]:
+        """
+        Get all tables names from the database.
+        """
+        pass
+
+    @abstractmethod
+    async def get_table_columns(self, table_name: str) -> list[BaseColumn[Any]]:
+        """
+        Get all columns from a table.
+        """
+        pass
+
+
+class ExecutorBackedDbInspector(BaseAsyncDbInspector):
+    """
+    Runs the calls of a blocking inspector in a thread pool, so that
+    awaiting them never blocks the event loop.
+    """
+
+    def __init__(
+        self, inspector: BaseDbInspector, executor: ThreadPoolExecutor | None = None
+    ) -> None:
+        self.inspector = inspector
+        self.executor = executor or ThreadPoolExecutor(
+            thread_name_prefix="skibidi-async-inspector"
+        )
+
+    async def get_tables(self) -> list[BaseTable[BaseColumn[Any]]]:
+        """
+        Get all tables from the database, served from the inspection cache
+        when the schema did not change.
+        """
+        return await self._run(InspectionCache().get_tables, self.inspector)
+
+    async def get_tables_names(self) -> list[str]:
+        return await self._run(self.inspector.get_tables_names)
+
+    async def get_table_columns(self, table_name: str) -> list[BaseColumn[Any]]:
+        return await self._run(self.inspector.get_table_columns, table_name)
+
+    async def _run[T](self, function: Callable[..., T], *args: Any) -> T:
+        """Run the blocking function in the executor"""
+        return await asyncio.get_running_loop().run_in_executor(
+            self.executor, function, *args
+        )
@@ -1,5 +1,5 @@
 from abc import ABC, abstractmethod
-from typing import Any
+from typing import Any, Iterator
 
 from skibidi_orm.migration_engine.adapters.base_adapter import (
     BaseColumn,
@@ -15,6 +15,13 @@ class BaseDbInspector(ABC):
         """
         pass
 
+    def iter_tables(self) -> Iterator[BaseTable[BaseColumn[Any]]]:
+        """
+        Yield all tables from the database as they are inspected. Inspectors able to
+        inspect the tables in chunks yield the first tables before the later ones are read.
+        """
+        yield from self.get_tables()
+
     @abstractmethod
     def get_tables_names(self) -> list[str]:
         """
@@ -28,3 +35,24 @@ class BaseDbInspector(ABC):
         Get all columns from a table.
         """
         pass
+
+    @abstractmethod
+    def get_schema_fingerprint(self) -> str:
+        """
+        Get a cheap fingerprint of the database schema. It changes whenever
+        the schema of the database changes.
+        """
+        pass
+
+    def get_inspection_state(self) -> Any:
+        """
+        Get the state needed to continue inspecting incrementally, e.g. in another
+        process. Inspectors without incremental inspection return None.
+        """
+        return None
+
+    def restore_inspection_state(self, state: Any) -> None:
+        """
+        Restore the state returned by get_inspection_state.
+        """
+        pass
@@ -0,0 +1,165 @@
+"""Persisted cache of inspected database schemas. Inspection results are stored
+together with a cheap fingerprint of the database schema and reused as long as
+the fingerprint does not change."""
+
+from __future__ import annotations
+from dataclasses import dataclass
+from typing import Any, Awaitable, Callable
+import asyncio
+import hashlib
+import os
+import pickle
+
+from dotenv import load_dotenv
+
+from skibidi_orm.migration_engine.adapters.base_adapter import BaseColumn, BaseTable
+from skibidi_orm.migration_engine.db_config.base_config import BaseDbConfig
+from skibidi_orm.migration_engine.db_config.postgres_config import PostgresConfig
+from skibidi_orm.migration_engine.db_config.sqlite3_config import SQLite3Config
+from skibidi_orm.migration_engine.db_inspectors.base_inspector import BaseDbInspector
+
+INSPECTION_CACHE_VERSION = 2
+DEFAULT_INSPECTION_CACHE_DIR = os.path.join(
+    os.path.expanduser("~"), ".cache", "skibidi_orm", "inspection"
+)
+
+
+def get_inspection_cache_dir() -> str:
+    """Get the directory in which inspection results are persisted.
+    If no directory is set via an environment variable, the default one is used."""
+    load_dotenv()
+    return os.environ.get(
+        "__SKIBIDI_INSPECTION_CACHE_DIR", DEFAULT_INSPECTION_CACHE_DIR
+    )
+
+
+@dataclass(frozen=True)
+class InspectionCacheEntry:
+    """Inspected tables along with the fingerprint of the schema they were read from
+    and the state that lets the inspector continue incrementally once it changes"""
+
+    version: int
+    fingerprint: str
+    tables: list[BaseTable[BaseColumn[Any]]]
+    inspection_state: Any = None
+
+
+class InspectionCache:
+    """
+    Cache of the tables returned by BaseDbInspector.get_tables, persisted on disk
+    and keyed by the database the config points to. A cached entry is only used
+    when the schema fingerprint of the database still matches.
+    """
+
+    def __init__(self, config: BaseDbConfig | None = None) -> None:
+        self.config = config if config is not None else BaseDbConfig.get_instance()
+        self.path = os.path.join(
+            get_inspection_cache_dir(),
+            f"{InspectionCache._get_database_key(self.config)}.pickle",
+        )
+        self.stale_path = f"{self.path}.stale"
+
+    def get_tables(self, inspector: BaseDbInspector) -> list[BaseTable[Any]]:
+        """Return the tables of the database, inspecting it only if its schema
+        changed since the cached entry was saved. Inspectors supporting incremental
+        inspection continue from the state stored in the outdated entry."""
+        fingerprint = inspector.get_schema_fingerprint()
+        entry = self._load(self.path)
+        if entry is not None and entry.fingerprint == fingerprint:
+            return entry.tables
+
+        outdated_entry = entry if entry is not None else self._load(self.stale_path)
+        if outdated_entry is not None:
+            inspector.restore_inspection_state(outdated_entry.inspection_state)
+
+        tables = inspector.get_tables()
+        self._save(
+            InspectionCacheEntry(
+                INSPECTION_CACHE_VERSION,
+                fingerprint,
+                tables,
+                inspector.get_inspection_state(),
+            )
+        )
+        return tables
+
+    async def get_tables_async(
+        self,
+        get_schema_fingerprint: Callable[[], Awaitable[str]],
+        get_tables: Callable[[], Awaitable[list[BaseTable[Any]]]],
+    ) -> list[BaseTable[Any]]:
+        """Asynchronous counterpart of get_tables, taking the coroutine functions
+        of an asynchronous inspector. Such inspectors do not inspect incrementally,
+        so the entries they save have no inspection state."""
+        fingerprint = await get_schema_fingerprint()
+        entry = await asyncio.to_thread(self._load, self.path)
+        if entry is not None and entry.fingerprint == fingerprint:
+            return entry.tables
+
+        tables = await get_tables()
+        await asyncio.to_thread(
+            self._save,
+            InspectionCacheEntry(INSPECTION_CACHE_VERSION, fingerprint, tables),
+        )
+        return tables
+
+    def invalidate(self) -> None:
+        """Mark the cached entry of the database as stale. A stale entry is never
+        returned, but its inspection state is still used to inspect incrementally."""
+        try:
+            os.replace(self.path, self.stale_path)
+        except FileNotFoundError:
+            pass
+
+    def _load(self, path: str) -> InspectionCacheEntry | None:
+        """Load a persisted entry. Missing, unreadable or outdated entries
+        are treated as a cache miss."""
+        try:
+            with open(path, "rb") as file:
+                entry = pickle.load(file)
+        except (OSError, pickle.UnpicklingError, EOFError, AttributeError, ImportError):
+            return None
+        if (
+            not isinstance(entry, InspectionCacheEntry)
+            or entry.version != INSPECTION_CACHE_VERSION
+        ):
+            return None
+        return entry
+
+    def _save(self, entry: InspectionCacheEntry) -> None:
+        """Persist the entry. The file is replaced atomically so that concurrent
+        readers never see a partially written entry."""
+        os.makedirs(os.path.dirname(self.path), exist_ok=True)
+        tmp_path = f"{self.path}.{os.getpid()}.tmp"
+        with open(tmp_path, "wb") as file:
+            pickle.dump(entry, file)
+        os.replace(tmp_path, self.path)
+        try:
+            os.remove(self.stale_path)
+        except FileNotFoundError:
+            pass
+
+    @staticmethod
+    def _get_database_key(config: BaseDbConfig) -> str:
+        """Get a file-name-safe key identifying the database the config points to"""
+        if isinstance(config, SQLite3Config):
+            identity = config.db_path
+        elif isinstance(config, PostgresConfig):
+            identity = (
+                f"{config.db_user}@{config.db_host}:{config.db_port}/{config.db_name}"
+            )
+        else:
+            raise NotImplementedError()
+        return hashlib.sha1(
+            f"{config.database_provider.value}:{identity}".encode()
+        ).hexdigest()
+
+
+def invalidate_inspection_cache() -> None:
+    """Invalidation hook, called by the executors after they modify the schema
+    of the database. Does nothing if no database is configured."""
+    try:
+        config = BaseDbConfig.get_instance()
+    except ReferenceError:
+        return
+    InspectionCache(config).invalidate()
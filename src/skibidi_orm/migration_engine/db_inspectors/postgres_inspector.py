@@ -1,11 +1,127 @@
 from __future__ import annotations
 
-from typing import Any, cast
+from collections import defaultdict
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Iterator, cast
 
 import skibidi_orm.migration_engine.adapters.database_objects.constraints as c
 from skibidi_orm.migration_engine.adapters.postgres_typing import PostgresTyping
 from skibidi_orm.migration_engine.db_config.postgres_config import PostgresConfig
 from skibidi_orm.migration_engine.db_inspectors.base_inspector import BaseDbInspector
+from skibidi_orm.migration_engine.revisions.constants import (
+    get_backfill_table_name,
+    get_revision_table_name,
+)
+from psycopg2.extensions import cursor as Cursor
+
+# Bulk pg_catalog queries used to load a whole schema at once. All of them take the
+# schema name and an optional list of table names (NULL meaning every table).
+# {table_filter} is replaced with the condition selecting the tables managed by the ORM.
+RELKINDS = "('r', 'p', 'v', 'f')"  # same relations as information_schema.tables
+
+COLUMNS_QUERY = f"""
+    SELECT
+        c.relname,
+        a.attname,
+        CASE WHEN t.typtype = 'd' THEN
+            CASE
+                WHEN bt.typelem <> 0 AND bt.typlen = -1 THEN 'ARRAY'
+                WHEN nbt.nspname = 'pg_catalog' THEN format_type(t.typbasetype, NULL)
+                ELSE 'USER-DEFINED'
+            END
+        ELSE
+            CASE
+                WHEN t.typelem <> 0 AND t.typlen = -1 THEN 'ARRAY'
+                WHEN nt.nspname = 'pg_catalog' THEN format_type(a.atttypid, NULL)
+                ELSE 'USER-DEFINED'
+            END
+        END AS data_type,
+        a.attnotnull OR (t.typtype = 'd' AND t.typnotnull) AS not_null,
+        CASE WHEN a.attgenerated = '' THEN pg_get_expr(d.adbin, d.adrelid) END
+    FROM pg_catalog.pg_attribute AS a
+    JOIN pg_catalog.pg_class AS c ON c.oid = a.attrelid
+    JOIN pg_catalog.pg_namespace AS n ON n.oid = c.relnamespace
+    JOIN pg_catalog.pg_type AS t ON t.oid = a.atttypid
+    JOIN pg_catalog.pg_namespace AS nt ON nt.oid = t.typnamespace
+    LEFT JOIN pg_catalog.pg_type AS bt ON t.typtype = 'd' AND bt.oid = t.typbasetype
+    LEFT JOIN pg_catalog.pg_namespace AS nbt ON nbt.oid = bt.typnamespace
+    LEFT JOIN pg_catalog.pg_attrdef AS d
+        ON d.adrelid = a.attrelid AND d.adnum = a.attnum
+    WHERE
+        n.nspname = %(schema)s
+        AND c.relkind IN {RELKINDS}
+        AND (%(tables)s::name[] IS NULL OR c.relname = ANY(%(tables)s::name[]))
+        AND {{table_filter}}
+        AND a.attnum > 0
+        AND NOT a.attisdropped
+    ORDER BY c.relname, a.attnum;
+"""
+
+KEY_CONSTRAINTS_QUERY = """
+    SELECT c.relname, a.attname, con.contype
+    FROM pg_catalog.pg_constraint AS con
+    JOIN pg_catalog.pg_class AS c ON c.oid = con.conrelid
+    JOIN pg_catalog.pg_namespace AS n ON n.oid = c.relnamespace
+    JOIN pg_catalog.pg_attribute AS a
+        ON a.attrelid = con.conrelid AND a.attnum = ANY(con.conkey)
+    WHERE
+        n.nspname = %(schema)s
+        AND (%(tables)s::name[] IS NULL OR c.relname = ANY(%(tables)s::name[]))
+        AND {table_filter}
+        AND con.contype IN ('p', 'u')
+    ORDER BY c.relname, a.attnum, con.contype, con.conname;
+"""
+
+FOREIGN_KEYS_QUERY = """
+    SELECT c.relname, con.conname, rc.relname, a.attname, ra.attname
+    FROM pg_catalog.pg_constraint AS con
+    JOIN pg_catalog.pg_class AS c ON c.oid = con.conrelid
+    JOIN pg_catalog.pg_namespace AS n ON n.oid = c.relnamespace
+    JOIN pg_catalog.pg_class AS rc ON rc.oid = con.confrelid
+    CROSS JOIN LATERAL unnest(con.conkey, con.confkey)
+        WITH ORDINALITY AS k(attnum, refattnum, ord)
+    JOIN pg_catalog.pg_attribute AS a
+        ON a.attrelid = con.conrelid AND a.attnum = k.attnum
+    JOIN pg_catalog.pg_attribute AS ra
+        ON ra.attrelid = con.confrelid AND ra.attnum = k.refattnum
+    WHERE
+        n.nspname = %(schema)s
+        AND (%(tables)s::name[] IS NULL OR c.relname = ANY(%(tables)s::name[]))
+        AND {table_filter}
+        AND con.contype = 'f'
+    ORDER BY c.relname, con.conname, k.ord;
+"""
+
+# Hash over the transaction ids which last modified the catalog rows describing
+# the schema. Any DDL statement rewrites at least one of them.
+SCHEMA_FINGERPRINT_QUERY = """
+    SELECT md5(coalesce(string_agg(entry, ',' ORDER BY entry), ''))
+    FROM (
+        SELECT 'c' || c.oid || ':' || c.xmin::text AS entry
+        FROM pg_catalog.pg_class AS c
+        JOIN pg_catalog.pg_namespace AS n ON n.oid = c.relnamespace
+        WHERE n.nspname = %(schema)s
+        UNION ALL
+        SELECT 'a' || a.attrelid || '.' || a.attnum || ':' || a.xmin::text
+        FROM pg_catalog.pg_attribute AS a
+        JOIN pg_catalog.pg_class AS c ON c.oid = a.attrelid
+        JOIN pg_catalog.pg_namespace AS n ON n.oid = c.relnamespace
+        WHERE n.nspname = %(schema)s AND a.attnum > 0
+        UNION ALL
+        SELECT 'k' || con.oid || ':' || con.xmin::text
+        FROM pg_catalog.pg_constraint AS con
+        JOIN pg_catalog.pg_namespace AS n ON n.oid = con.connamespace
+        WHERE n.nspname = %(schema)s
+        UNION ALL
+        SELECT 'd' || d.oid || ':' || d.xmin::text
+        FROM pg_catalog.pg_attrdef AS d
+        JOIN pg_catalog.pg_class AS c ON c.oid = d.adrelid
+        JOIN pg_catalog.pg_namespace AS n ON n.oid = c.relnamespace
+        WHERE n.nspname = %(schema)s
+    ) AS entries;
+"""
+
+type CatalogRows = list[tuple[Any, ...]]
 
 
 class PostgresInspector(BaseDbInspector):
@@ -17,106 +133,311 @@ class PostgresInspector(BaseDbInspector):
     def __init__(self) -> None:
         self.config = PostgresConfig.get_instance()
 
+    @property
+    def schema(self) -> str:
+        """Name of the inspected schema"""
+        return self.config.schema
+
     def get_tables_names(self) -> list[str]:
         """
         Get all tables names from the database.
         """
 
-        with self.config.connection.cursor() as cursor:
-            cursor.execute(
-                """
-                SELECT table_name
-                FROM information_schema.tables
-                WHERE table_schema = 'public'
-                """
-            )
+        with self.config.cursor() as cursor:
+            cursor.execute(*self.tables_names_query())
 
             tables = cursor.fetchall()
 
         return [table[0] for table in tables]
 
+    def get_schema_fingerprint(self) -> str:
+        """
+        Fingerprint the schema with a hash over the xmin values of its
+        pg_class, pg_attribute, pg_constraint and pg_attrdef rows,
+        along with the filter deciding which of its tables are inspected.
+        """
+
+        with self.config.cursor() as cursor:
+            cursor.execute(SCHEMA_FINGERPRINT_QUERY, {"schema": self.schema})
+            row = cursor.fetchone()
+
+        return self.schema_fingerprint(row[0] if row else "")
+
+    def schema_fingerprint(self, catalog_hash: str) -> str:
+        """
+        Combine the hash returned by the schema fingerprint query with the schema
+        name and the filter deciding which of its tables are inspected.
+        """
+
+        return f"{self.schema}:{catalog_hash}:{self.config.table_filter!r}"
+
     def get_tables(self) -> list[PostgresTyping.Table]:
         """
         Get all tables from the database.
+        All columns, constraints, defaults and foreign keys of the schema are loaded
+        in a few pg_catalog queries and the tables are assembled in memory.
         """
 
+        if self.config.inspection_workers > 1:
+            return self.get_tables_parallel()
+
+        with self.config.cursor() as cursor:
+            return self.get_tables_snapshot(cursor)
+
+    def get_tables_parallel(self) -> list[PostgresTyping.Table]:
+        """
+        Get all tables from the database, inspecting chunks of tables concurrently.
+        Every worker thread runs the bulk pg_catalog queries for its chunk over its
+        own pooled connection. Tables are returned sorted by name, regardless of
+        the order in which the chunks finish.
+        """
+
+        tables_names = sorted(self.get_tables_names())
+        chunk_size = max(1, self.config.inspection_chunk_size)
+        chunks = [
+            tables_names[i : i + chunk_size]
+            for i in range(0, len(tables_names), chunk_size)
+        ]
+
+        with ThreadPoolExecutor(
+            max_workers=self.config.inspection_workers,
+            thread_name_prefix="skibidi-inspector",
+        ) as executor:
+            inspected_chunks = list(executor.map(self._inspect_chunk, chunks))
+
+        return sorted(
+            (table for chunk in inspected_chunks for table in chunk),
+            key=lambda table: table.name,
+        )
+
+    def iter_tables(self) -> Iterator[PostgresTyping.Table]:
+        """
+        Yield all tables from the database sorted by name, running the bulk pg_catalog
+        queries for config.inspection_chunk_size tables at a time.
+        """
+
+        tables_names = sorted(self.get_tables_names())
+        chunk_size = max(1, self.config.inspection_chunk_size)
+        for i in range(0, len(tables_names), chunk_size):
+            with self.config.cursor() as cursor:
+                tables = self.get_tables_snapshot(
+                    cursor, tables_names[i : i + chunk_size]
+                )
+            yield from sorted(tables, key=lambda table: table.name)
+
+    def _inspect_chunk(self, tables_names: list[str]) -> list[PostgresTyping.Table]:
+        """
+        Inspect the given tables over a connection taken from the pool of the config.
+        """
+
+        with self.config.cursor() as cursor:
+            return self.get_tables_snapshot(cursor, tables_names)
+
+    def get_tables_snapshot(
+        self, cursor: Cursor, tables_names: list[str] | None = None
+    ) -> list[PostgresTyping.Table]:
+        """
+        Load the given tables (all tables of the schema by default) using the bulk
+        pg_catalog queries. The number of round trips does not depend on the number
+        of tables, columns or constraints.
+        """
+
+        cursor.execute(*self.tables_names_query(tables_names))
+        tables_names_rows = cursor.fetchall()
+        cursor.execute(*self.catalog_query(COLUMNS_QUERY, tables_names))
+        columns_rows = cursor.fetchall()
+        cursor.execute(*self.catalog_query(KEY_CONSTRAINTS_QUERY, tables_names))
+        key_constraints_rows = cursor.fetchall()
+        cursor.execute(*self.catalog_query(FOREIGN_KEYS_QUERY, tables_names))
+        foreign_keys_rows = cursor.fetchall()
+
+        return PostgresInspector.tables_from_catalog_rows(
+            tables_names_rows, columns_rows, key_constraints_rows, foreign_keys_rows
+        )
+
+    @staticmethod
+    def tables_from_catalog_rows(
+        tables_names_rows: CatalogRows,
+        columns_rows: CatalogRows,
+        key_constraints_rows: CatalogRows,
+        foreign_keys_rows: CatalogRows,
+    ) -> list[PostgresTyping.Table]:
+        """
+        Assemble the table objects from the rows returned by the table names query
+        and the bulk pg_catalog queries. Tables are returned in the order of the table
+        names rows, including the tables without columns.
+        """
+
+        key_constraints: dict[tuple[str, str], list[str]] = defaultdict(list)
+        for table_name, column_name, constraint_type in key_constraints_rows:
+            key_constraints[(table_name, column_name)].append(constraint_type)
+
+        foreign_keys = PostgresInspector._foreign_keys_from_catalog_rows(
+            foreign_keys_rows
+        )
+        columns = PostgresInspector._group_rows(columns_rows)
+
         return [
             PostgresTyping.Table(
                 name=table_name,
-                columns=self.get_table_columns(table_name),
+                columns=[
+                    PostgresTyping.Column(
+                        name=column_name,
+                        data_type=cast(PostgresTyping.DataTypes, data_type.upper()),
+                        column_constraints=PostgresInspector._column_constraints_from_catalog(
+                            table_name,
+                            column_name,
+                            key_constraints[(table_name, column_name)],
+                            not_null,
+                            column_default,
+                        ),
+                    )
+                    for column_name, data_type, not_null, column_default in columns.get(
+                        table_name, []
+                    )
+                ],
                 table_constraints=cast(
-                    set[c.TableWideConstraint], self._get_foreign_keys(table_name)
+                    set[c.TableWideConstraint], foreign_keys[table_name]
                 ),
             )
-            for table_name in self.get_tables_names()
+            for (table_name,) in tables_names_rows
         ]
 
+    @staticmethod
+    def _foreign_keys_from_catalog_rows(
+        foreign_keys_rows: CatalogRows,
+    ) -> dict[str, set[c.ForeignKeyConstraint]]:
+        """
+        Create the foreign keys of every table from the rows of the foreign keys query.
+        Composite foreign keys are merged into a single constraint.
+        """
+
+        column_mappings: dict[tuple[str, str, str], dict[str, str]] = defaultdict(dict)
+        for (
+            table_name,
+            constraint_name,
+            referenced_table,
+            column_name,
+            referenced_column,
+        ) in foreign_keys_rows:
+            column_mappings[(table_name, constraint_name, referenced_table)][
+                column_name
+            ] = referenced_column
+
+        foreign_keys: dict[str, set[c.ForeignKeyConstraint]] = defaultdict(set)
+        for (
+            table_name,
+            _,
+            referenced_table,
+        ), column_mapping in column_mappings.items():
+            foreign_keys[table_name].add(
+                c.ForeignKeyConstraint(
+                    table_name=table_name,
+                    referenced_table=referenced_table,
+                    column_mapping=column_mapping,
+                )
+            )
+        return foreign_keys
+
     def get_table_columns(self, table_name: str) -> list[PostgresTyping.Column]:
         """
         Get all columns from the table.
         """
 
-        return [
-            PostgresTyping.Column(
-                name=column_name,
-                data_type=self._get_column_data_type(table_name, column_name),
-                column_constraints=self._get_column_constraints(
-                    table_name, column_name
-                ),
-            )
-            for column_name in self._get_table_columns_names(table_name)
-        ]
+        with self.config.cursor() as cursor:
+            tables = self.get_tables_snapshot(cursor, [table_name])
+
+        return tables[0].columns if tables else []
 
     def _get_foreign_keys(self, table_name: str) -> set[c.ForeignKeyConstraint]:
         """
         Get all foreign keys from the table.
         """
 
-        with self.config.connection.cursor() as cursor:
-            cursor.execute(
-                f"""
-                SELECT
-                    tc.constraint_name,
-                    tc.table_name,
-                    kcu.column_name,
-                    ccu.table_name AS foreign_table_name,
-                    ccu.column_name AS foreign_column_name
-                FROM
-                    information_schema.table_constraints AS tc
-                JOIN
-                    information_schema.key_column_usage AS kcu
-                    ON tc.constraint_name = kcu.constraint_name
-                JOIN
-                    information_schema.constraint_column_usage AS ccu
-                    ON tc.constraint_name = ccu.constraint_name
-                WHERE
-                    tc.constraint_type = 'FOREIGN KEY'
-                    AND tc.table_name = '{table_name}';
-                """
-            )
-
+        with self.config.cursor() as cursor:
+            cursor.execute(*self.catalog_query(FOREIGN_KEYS_QUERY, [table_name]))
             rows = cursor.fetchall()
 
-        res: set[c.ForeignKeyConstraint] = set()
-        for row in rows:
-            (
-                _,
-                table_name,
-                column_name,
-                foreign_table_name,
-                foreign_column_name,
-            ) = row
-
-            res.add(
-                c.ForeignKeyConstraint(
-                    table_name=table_name,
-                    referenced_table=foreign_table_name,
-                    column_mapping={column_name: foreign_column_name},
-                )
-            )
+        return PostgresInspector._foreign_keys_from_catalog_rows(rows)[table_name]
+
+    def tables_names_query(
+        self, tables_names: list[str] | None = None
+    ) -> tuple[str, dict[str, Any]]:
+        """
+        Prepare the query listing the names of the tables managed by the ORM,
+        sorted, out of the given tables (all tables of the schema by default).
+        """
 
+        condition, params = self.config.table_filter.to_postgres_condition(
+            "table_name"
+        )
+        query = f"""
+            SELECT table_name
+            FROM information_schema.tables
+            WHERE table_schema = %(schema)s AND table_name NOT IN (%(revisions)s, %(backfills)s) AND {condition}
+                AND (%(tables)s::name[] IS NULL OR table_name = ANY(%(tables)s::name[]))
+            ORDER BY table_name
+        """
+        return query, {
+            "schema": self.schema,
+            "tables": tables_names,
+            "revisions": get_revision_table_name(),
+            "backfills": get_backfill_table_name(),
+            **params,
+        }
+
+    def catalog_query(
+        self, query: str, tables_names: list[str] | None
+    ) -> tuple[str, dict[str, Any]]:
+        """
+        Prepare one of the bulk pg_catalog queries for the given tables,
+        restricted to the tables managed by the ORM.
+        """
+
+        condition, params = self.config.table_filter.to_postgres_condition(
+            "c.relname"
+        )
+        return query.format(table_filter=condition), {
+            "schema": self.schema,
+            "tables": tables_names,
+            **params,
+        }
+
+    @staticmethod
+    def _column_constraints_from_catalog(
+        table_name: str,
+        column_name: str,
+        key_constraint_types: list[str],
+        not_null: bool,
+        column_default: str | None,
+    ) -> list[c.ColumnWideConstraint]:
+        """
+        Create the constraints of a single column from its catalog data.
+        """
+
+        res: list[c.ColumnWideConstraint] = []
+        for constraint_type in key_constraint_types:
+            if constraint_type == "p":
+                res.append(c.PrimaryKeyConstraint(table_name, column_name))
+            if constraint_type == "u":
+                res.append(c.UniqueConstraint(table_name, column_name))
+        if not_null:
+            res.append(c.NotNullConstraint(table_name, column_name))
+        if column_default:
+            res.append(c.DefaultConstraint(table_name, column_name, column_default))
         return res
 
+    @staticmethod
+    def _group_rows(rows: CatalogRows) -> dict[str, list[tuple[Any, ...]]]:
+        """
+        Group catalog rows by their first value (the table name), preserving order.
+        """
+
+        grouped: dict[str, list[tuple[Any, ...]]] = {}
+        for table_name, *rest in rows:
+            grouped.setdefault(table_name, []).append(tuple(rest))
+        return grouped
+
     def _get_column_constraints(
         self, table_name: str, column_name: str
     ) -> list[c.ColumnWideConstraint]:
@@ -124,7 +445,7 @@ class PostgresInspector(BaseDbInspector):
         Get all column constraints from the table.
         """
 
-        with self.config.connection.cursor() as cursor:
+        with self.config.cursor() as cursor:
             cursor.execute(
                 f"""
                 SELECT
@@ -164,6 +485,7 @@ class PostgresInspector(BaseDbInspector):
                     f"Column '{column_name}' does not exist in table '{table_name}'"
                 )
 
+        is_nullable = self._is_column_nullable(table_name, column_name)
         res: list[c.ColumnWideConstraint] = []
         for row in rows:  # loop because we can have many constraints for one column
             _, _, constraint_type, _, _, column_default = row
@@ -172,9 +494,7 @@ class PostgresInspector(BaseDbInspector):
                 res.append(c.PrimaryKeyConstraint(table_name, column_name))
             if constraint_type == "UNIQUE":
                 res.append(c.UniqueConstraint(table_name, column_name))
-            if not self._is_column_nullable(
-                table_name, column_name
-            ) and not self.__holds_instance(res, c.NotNullConstraint):
+            if not is_nullable and not self.__holds_instance(res, c.NotNullConstraint):
                 res.append(c.NotNullConstraint(table_name, column_name))
             if column_default and not self.__holds_instance(res, c.DefaultConstraint):
                 res.append(c.DefaultConstraint(table_name, column_name, column_default))
@@ -186,7 +506,7 @@ class PostgresInspector(BaseDbInspector):
         Get all columns names from the table.
         """
 
-        with self.config.connection.cursor() as cursor:
+        with self.config.cursor() as cursor:
             cursor.execute(
                 f"""
                 SELECT column_name
@@ -205,7 +525,7 @@ class PostgresInspector(BaseDbInspector):
         """
         Get the data type of the column.
         """
-        with self.config.connection.cursor() as cursor:
+        with self.config.cursor() as cursor:
             cursor.execute(
                 f"""
                 SELECT data_type
@@ -229,7 +549,7 @@ class PostgresInspector(BaseDbInspector):
         Check if the column is nullable.
         """
 
-        with self.config.connection.cursor() as cursor:
+        with self.config.cursor() as cursor:
             cursor.execute(
                 f"""
                 SELECT is_nullable
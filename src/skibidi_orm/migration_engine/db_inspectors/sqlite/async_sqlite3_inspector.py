@@ -0,0 +1,17 @@
+from skibidi_orm.migration_engine.db_inspectors.base_async_inspector import (
+    ExecutorBackedDbInspector,
+)
+from skibidi_orm.migration_engine.db_inspectors.sqlite.sqlite3_inspector import (
+    SQLite3Inspector,
+)
+
+
+class AsyncSQLite3Inspector(ExecutorBackedDbInspector):
+    """
+    Used to get data from live SQLite3 database without blocking the event loop.
+    The sqlite3 module has no asynchronous interface, so every call opens its
+    connection in a worker thread of the executor.
+    """
+
+    def __init__(self) -> None:
+        super().__init__(SQLite3Inspector())
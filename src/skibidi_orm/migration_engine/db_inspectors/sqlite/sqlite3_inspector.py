@@ -1,23 +1,82 @@
-from typing import cast
+from collections import defaultdict
+from dataclasses import replace
+from typing import Any, Iterator, cast
 from skibidi_orm.migration_engine.db_inspectors.sqlite.supporting_objects import (
     PragmaIndexInfoEntry,
     PragmaIndexListEntry,
     PragmaTableInfoEntry,
     PragmaForeignKeyListEntry,
+    TableSnapshotEntry,
 )
+import hashlib
+import json
 import sqlite3
 import re
 
 from skibidi_orm.migration_engine.db_config.sqlite3_config import SQLite3Config
+from skibidi_orm.migration_engine.db_config.table_filter import TableFilter
 from skibidi_orm.migration_engine.db_inspectors.base_inspector import BaseDbInspector
 from skibidi_orm.migration_engine.adapters.sqlite3_typing import (
     SQLite3Typing,
 )
 import skibidi_orm.migration_engine.adapters.database_objects.constraints as c
-from skibidi_orm.migration_engine.revisions.constants import get_revision_table_name
+from skibidi_orm.migration_engine.revisions.constants import (
+    get_backfill_table_name,
+    get_revision_table_name,
+)
 
 type SQLite3PragmaForeignKeyList = list[PragmaForeignKeyListEntry]
 
+# Set-based catalog queries used to read the whole schema at once. Each of them joins
+# sqlite_master with one of the table-valued pragma functions, so a single statement
+# covers every table instead of one PRAGMA call per table (or per column).
+# {table_filter} is replaced with the condition selecting the tables managed by the ORM.
+TABLES_QUERY = """
+    SELECT m.name, m.sql
+    FROM sqlite_master AS m
+    WHERE m.type = 'table' AND m.name NOT IN (:revisions, :backfills) AND {table_filter};
+"""
+
+# restricts the inspected tables to the JSON list bound to :tables (all if NULL)
+TABLES_FILTER = "(:tables IS NULL OR m.name IN (SELECT value FROM json_each(:tables)))"
+
+TABLE_INFO_QUERY = f"""
+    SELECT m.name, p.cid, p.name, p.type, p."notnull", p.dflt_value, p.pk
+    FROM sqlite_master AS m
+    JOIN pragma_table_info(m.name) AS p
+    WHERE m.type = 'table' AND m.name NOT IN (:revisions, :backfills) AND {TABLES_FILTER}
+        AND {{table_filter}}
+    ORDER BY m.name, p.cid;
+"""
+
+UNIQUE_INDEX_INFO_QUERY = f"""
+    SELECT m.name, ii.name
+    FROM sqlite_master AS m
+    JOIN pragma_index_list(m.name) AS il
+    JOIN pragma_index_info(il.name) AS ii
+    WHERE m.type = 'table' AND m.name NOT IN (:revisions, :backfills) AND {TABLES_FILTER}
+        AND {{table_filter}}
+        AND il.origin = 'u'
+    GROUP BY m.name, il.name
+    HAVING COUNT(*) = 1
+    ORDER BY m.name, il.seq;
+"""
+
+FOREIGN_KEY_LIST_QUERY = f"""
+    SELECT m.name, fk.id, fk.seq, fk."table", fk."from", fk."to",
+        fk.on_update, fk.on_delete, fk."match"
+    FROM sqlite_master AS m
+    JOIN pragma_foreign_key_list(m.name) AS fk
+    WHERE m.type = 'table' AND m.name NOT IN (:revisions, :backfills) AND {TABLES_FILTER}
+        AND {{table_filter}}
+    ORDER BY m.name, fk.id, fk.seq;
+"""
+
+# definitions of every object of the schema, hashed to fingerprint it
+SCHEMA_DEFINITIONS_QUERY = """
+    SELECT type, name, tbl_name, sql FROM sqlite_master ORDER BY type, name;
+"""
+
 
 class SQLite3Inspector(BaseDbInspector):
     """
@@ -27,41 +86,188 @@ class SQLite3Inspector(BaseDbInspector):
 
     def __init__(self) -> None:
         self.config = SQLite3Config.get_instance()
+        self.snapshot: dict[str, TableSnapshotEntry] = {}
 
     def get_tables(
         self,
     ) -> list[SQLite3Typing.Table]:
         """
         Retrieve all tables from the database.
+        The catalog is read in a snapshot - a handful of set-based queries executed
+        over a single connection. Only the tables whose CREATE statement changed since
+        the previous call are inspected, the rest is reused from the last snapshot.
+        The returned tables are copies, so changing them does not change the snapshot.
         """
 
-        tables: list[SQLite3Typing.Table] = []
-        tables_names = self.get_tables_names()
-        foreign_keys = self.get_foreign_key_constraints()
-        for table_name in tables_names:
-            table_columns = self.get_table_columns(table_name)
-            related_fks = {fk for fk in foreign_keys if fk.table_name == table_name}
-            tables.append(
-                SQLite3Typing.Table(
-                    name=table_name,
-                    columns=table_columns,
-                    table_constraints=cast(set[c.TableWideConstraint], related_fks),
+        with self.config.connection_pool.connection() as conn:
+            query, params = self._filter_tables(TABLES_QUERY)
+            sql_hashes = {
+                name: hashlib.sha1((sql or "").encode()).hexdigest()
+                for name, sql in conn.execute(
+                    query,
+                    {
+                        "revisions": get_revision_table_name(),
+                        "backfills": get_backfill_table_name(),
+                        **params,
+                    },
+                )
+            }
+            changed_tables = [
+                name
+                for name, sql_hash in sql_hashes.items()
+                if (entry := self.snapshot.get(name)) is None
+                or entry.sql_hash != sql_hash
+            ]
+            inspected_tables = {
+                table.name: table
+                for table in self.get_tables_snapshot(
+                    conn,
+                    None if len(changed_tables) == len(sql_hashes) else changed_tables,
                 )
+            }
+
+        self.snapshot = {
+            name: (
+                TableSnapshotEntry(sql_hash, inspected_tables[name])
+                if name in inspected_tables
+                else self.snapshot[name]
+            )
+            for name, sql_hash in sql_hashes.items()
+        }
+        return [
+            SQLite3Inspector.copy_table(entry.table) for entry in self.snapshot.values()
+        ]
+
+    def iter_tables(self) -> Iterator[SQLite3Typing.Table]:
+        """
+        Yield all tables from the database, inspecting them in chunks
+        of config.inspection_chunk_size tables, each over a pooled connection.
+        The connection is released before the tables of the chunk are yielded,
+        so the tables can be altered while the rest is being inspected.
+        """
+
+        tables_names = self.get_tables_names()
+        chunk_size = max(1, self.config.inspection_chunk_size)
+        for i in range(0, len(tables_names), chunk_size):
+            with self.config.connection_pool.connection() as conn:
+                tables = self.get_tables_snapshot(conn, tables_names[i : i + chunk_size])
+            yield from tables
+
+    @staticmethod
+    def copy_table(table: SQLite3Typing.Table) -> SQLite3Typing.Table:
+        """Copy of the table which can be changed without changing the original one"""
+        return replace(
+            table,
+            columns=[
+                replace(column, column_constraints=list(column.column_constraints))
+                for column in table.columns
+            ],
+            table_constraints=set(table.table_constraints),
+        )
+
+    def get_inspection_state(self) -> dict[str, TableSnapshotEntry]:
+        """The last snapshot - inspected tables along with hashes of their SQL"""
+        return self.snapshot
+
+    def restore_inspection_state(self, state: Any) -> None:
+        """Continue incremental inspection from a previously saved snapshot"""
+        if isinstance(state, dict):
+            self.snapshot = cast(dict[str, TableSnapshotEntry], state)
+
+    def get_tables_snapshot(
+        self, conn: sqlite3.Connection, tables_names: list[str] | None = None
+    ) -> list[SQLite3Typing.Table]:
+        """
+        Build the given tables (all tables by default) using the given connection.
+        Produces the same objects as assembling them table by table with
+        get_table_columns and get_foreign_key_constraints, but the number of queries
+        does not depend on the size of the schema.
+        """
+
+        conn.create_function("regexp", 2, TableFilter.regexp, deterministic=True)
+        tables_query, params = self._filter_tables(TABLES_QUERY)
+        table_info_query, _ = self._filter_tables(TABLE_INFO_QUERY)
+        unique_index_info_query, _ = self._filter_tables(UNIQUE_INDEX_INFO_QUERY)
+        foreign_key_list_query, _ = self._filter_tables(FOREIGN_KEY_LIST_QUERY)
+        params |= {
+            "revisions": get_revision_table_name(),
+            "backfills": get_backfill_table_name(),
+            "tables": None if tables_names is None else json.dumps(tables_names),
+        }
+        if tables_names is None:
+            tables_names = [row[0] for row in conn.execute(tables_query, params)]
+
+        pragma_table_info: dict[str, list[PragmaTableInfoEntry]] = defaultdict(list)
+        for table_name, *entry in conn.execute(table_info_query, params):
+            pragma_table_info[table_name].append(
+                PragmaTableInfoEntry.from_tuple(tuple(entry))  # type: ignore
             )
 
-        return tables
+        unique_constraints: dict[str, list[c.UniqueConstraint]] = defaultdict(list)
+        for table_name, column_name in conn.execute(unique_index_info_query, params):
+            unique_constraints[table_name].append(
+                c.UniqueConstraint(table_name, column_name)
+            )
+
+        pragma_foreign_keys: dict[str, list[PragmaForeignKeyListEntry]] = (
+            defaultdict(list)
+        )
+        for table_name, *entry in conn.execute(foreign_key_list_query, params):
+            pragma_foreign_keys[table_name].append(
+                PragmaForeignKeyListEntry.from_tuple(tuple(entry))  # type: ignore
+            )
+
+        foreign_keys: dict[str, set[c.TableWideConstraint]] = defaultdict(set)
+        for fk in SQLite3Inspector.foreign_keys_from_pragma_entries(
+            pragma_foreign_keys
+        ):
+            foreign_keys[fk.table_name].add(fk)
+
+        return [
+            SQLite3Typing.Table(
+                name=table_name,
+                columns=[
+                    SQLite3Typing.Column(
+                        name=entry.name,
+                        data_type=cast(SQLite3Typing.DataTypes, entry.data_type),
+                        column_constraints=SQLite3Inspector.constraints_from_pragma_entry(
+                            table_name, entry, unique_constraints[table_name]
+                        ),
+                    )
+                    for entry in pragma_table_info[table_name]
+                ],
+                table_constraints=foreign_keys[table_name],
+            )
+            for table_name in tables_names
+        ]
+
+    def get_schema_fingerprint(self) -> str:
+        """
+        Fingerprint the schema with a hash over the definitions of all of its objects,
+        along with the filter deciding which of its tables are inspected. The identity
+        of the database file and PRAGMA schema_version are not enough - both repeat
+        when the database is deleted and created again.
+        """
+
+        definitions = self._sqlite_execute(SCHEMA_DEFINITIONS_QUERY)
+        schema_hash = hashlib.sha1(json.dumps(definitions).encode()).hexdigest()
+        return f"{schema_hash}:{get_revision_table_name()}:{self.config.table_filter!r}"
 
     def get_tables_names(self) -> list[str]:
         """
         Retrieve just tables names from the database.
         """
 
+        query, params = self._filter_tables(TABLES_QUERY)
         tables = self._sqlite_execute(
-            "SELECT name FROM sqlite_master WHERE type='table';"
+            query,
+            {
+                "revisions": get_revision_table_name(),
+                "backfills": get_backfill_table_name(),
+                **params,
+            },
         )
-        return [
-            name for table in tables if (name := table[0]) != get_revision_table_name()
-        ]
+        return [table[0] for table in tables]
 
     @staticmethod
     def foreign_keys_from_pragma_entries(
@@ -212,6 +418,18 @@ class SQLite3Inspector(BaseDbInspector):
     ) -> list[c.ColumnWideConstraint]:
         """Get all constraints for a column determined by the pragma table info entry.
         and a name of the table."""
+        return SQLite3Inspector.constraints_from_pragma_entry(
+            table_name, entry, self.get_all_unique_constraints(table_name)
+        )
+
+    @staticmethod
+    def constraints_from_pragma_entry(
+        table_name: str,
+        entry: PragmaTableInfoEntry,
+        unique_constraints_for_table: list[c.UniqueConstraint],
+    ) -> list[c.ColumnWideConstraint]:
+        """Creates the constraints of a column based on its pragma table info entry
+        and the unique constraints already found in its table."""
         constraints: list[c.ColumnWideConstraint] = []
         column_name = entry.name
         if entry.pk:
@@ -230,7 +448,6 @@ class SQLite3Inspector(BaseDbInspector):
                     value=entry.dflt_value,
                 )
             )
-        unique_constraints_for_table = self.get_all_unique_constraints(table_name)
         constraints.extend(
             [c for c in unique_constraints_for_table if c.column_name == column_name]
         )
@@ -256,15 +473,23 @@ class SQLite3Inspector(BaseDbInspector):
             for entry in pragma_entries
         ]
 
-    def _sqlite_execute(self, query: str):
+    def _filter_tables(self, query: str) -> tuple[str, dict[str, str]]:
+        """
+        Restrict a catalog query to the tables managed by the ORM,
+        returns the query along with the parameters of the filter.
+        """
+
+        condition, params = self.config.table_filter.to_sqlite3_condition("m.name")
+        return query.format(table_filter=condition), params
+
+    def _sqlite_execute(self, query: str, params: dict[str, Any] | None = None):
         """
         Execute a query in the SQLite3 database, returns its result.
         """
 
-        db_path = self.config.db_path
-        with sqlite3.connect(db_path) as conn:
+        with self.config.connection_pool.connection() as conn:
             cursor = conn.cursor()
-            cursor.execute(query)
+            cursor.execute(query, params or {})
             conn.commit()
             data = cursor.fetchall()
             cursor.close()
@@ -2,6 +2,8 @@ from __future__ import annotations
 from dataclasses import dataclass
 from typing import Literal, Any
 
+from skibidi_orm.migration_engine.adapters.sqlite3_typing import SQLite3Typing
+
 
 @dataclass(frozen=True)
 class PragmaTableInfoEntry:
@@ -96,3 +98,12 @@ class PragmaIndexInfoEntry:
     ) -> PragmaIndexInfoEntry:
         column_rank_within_index, column_rank_wihtin_table, column_name = values
         return cls(column_rank_within_index, column_rank_wihtin_table, column_name)
+
+
+@dataclass(frozen=True)
+class TableSnapshotEntry:
+    """An inspected table along with the hash of the CREATE statement
+    stored for it in sqlite_master at the time of the inspection."""
+
+    sql_hash: str
+    table: SQLite3Typing.Table
@@ -0,0 +1,132 @@
+"""Persisted migration plans. preview-migration can save the operations it computed
+along with a fingerprint of the database schema and a hash of the schema file, so that
+migrate executes them without inspecting and diffing the database again, as long as
+neither of them changed in the meantime."""
+
+from __future__ import annotations
+from dataclasses import dataclass
+from typing import Any
+import hashlib
+import os
+import pickle
+
+from skibidi_orm.exceptions.migration_plan_exceptions import (
+    InvalidMigrationPlanError,
+    StaleMigrationPlanError,
+)
+from skibidi_orm.migration_engine.adapters.base_adapter import BaseColumn, BaseTable
+from skibidi_orm.migration_engine.adapters.providers import DatabaseProvider
+from skibidi_orm.migration_engine.db_config.base_config import BaseDbConfig
+from skibidi_orm.migration_engine.db_inspectors.base_inspector import BaseDbInspector
+from skibidi_orm.migration_engine.db_inspectors.postgres_inspector import (
+    PostgresInspector,
+)
+from skibidi_orm.migration_engine.db_inspectors.sqlite.sqlite3_inspector import (
+    SQLite3Inspector,
+)
+from skibidi_orm.migration_engine.operations.column_operations import ColumnOperation
+from skibidi_orm.migration_engine.operations.table_operations import TableOperation
+from skibidi_orm.migration_engine.sql_executor.postgres_executor import PostgresExecutor
+from skibidi_orm.migration_engine.sql_executor.sqlite3_executor import SQLite3Executor
+
+MIGRATION_PLAN_VERSION = 1
+
+
+def get_database_inspector() -> BaseDbInspector:
+    """Get an inspector of the configured database"""
+    database_provider = BaseDbConfig.get_instance().database_provider
+    if database_provider == DatabaseProvider.SQLITE3:
+        return SQLite3Inspector()
+    if database_provider == DatabaseProvider.POSTGRESQL:
+        return PostgresInspector()
+    raise NotImplementedError()
+
+
+def hash_schema_file(path: str) -> str:
+    """Hash of the contents of the schema file under the given path"""
+    with open(path, "rb") as file:
+        return hashlib.sha256(file.read()).hexdigest()
+
+
+@dataclass(frozen=True)
+class MigrationPlan:
+    """Operations transforming the database schema into the class hierarchy schema,
+    along with the fingerprint of the database schema and the hash of the schema file
+    they were computed from. The schema tables are kept for the revision saved after
+    the plan is executed."""
+
+    version: int
+    fingerprint: str
+    schema_hash: str
+    operations: list[TableOperation | ColumnOperation]
+    tables: list[BaseTable[BaseColumn[Any]]]
+
+    @staticmethod
+    def create(
+        fingerprint: str,
+        schema_path: str,
+        operations: list[TableOperation | ColumnOperation],
+        tables: list[BaseTable[BaseColumn[Any]]],
+    ) -> MigrationPlan:
+        """Create a plan of the given operations. The fingerprint should be taken
+        before the database is inspected, so that any change made during the
+        inspection makes the plan stale."""
+        return MigrationPlan(
+            MIGRATION_PLAN_VERSION,
+            fingerprint,
+            hash_schema_file(schema_path),
+            operations,
+            tables,
+        )
+
+    def save(self, path: str) -> None:
+        """Persist the plan. The file is replaced atomically, so a concurrent
+        migrate never reads a partially written plan."""
+        directory = os.path.dirname(os.path.abspath(path))
+        os.makedirs(directory, exist_ok=True)
+        tmp_path = f"{path}.{os.getpid()}.tmp"
+        with open(tmp_path, "wb") as file:
+            pickle.dump(self, file)
+        os.replace(tmp_path, path)
+
+    @staticmethod
+    def load(path: str) -> MigrationPlan:
+        """Load a persisted plan. Raises InvalidMigrationPlanError if the file
+        cannot be read or was written by another version of the ORM."""
+        try:
+            with open(path, "rb") as file:
+                plan = pickle.load(file)
+        except (OSError, pickle.UnpicklingError, EOFError, AttributeError, ImportError):
+            raise InvalidMigrationPlanError(f"Could not read migration plan {path}.")
+        if (
+            not isinstance(plan, MigrationPlan)
+            or plan.version != MIGRATION_PLAN_VERSION
+        ):
+            raise InvalidMigrationPlanError(
+                f"{path} is not a migration plan of this version of the ORM."
+            )
+        return plan
+
+    def check(self, fingerprint: str, schema_path: str) -> None:
+        """Raise StaleMigrationPlanError if the database schema or the schema file
+        changed since the plan was created"""
+        if fingerprint != self.fingerprint:
+            raise StaleMigrationPlanError(
+                "The database changed since the migration plan was created."
+            )
+        if hash_schema_file(schema_path) != self.schema_hash:
+            raise StaleMigrationPlanError(
+                "The schema file changed since the migration plan was created."
+            )
+
+    def execute(self, schema_path: str) -> None:
+        """Execute the operations of the plan, after checking that it is still valid"""
+        self.check(get_database_inspector().get_schema_fingerprint(), schema_path)
+
+        database_provider = BaseDbConfig.get_instance().database_provider
+        if database_provider == DatabaseProvider.SQLITE3:
+            SQLite3Executor.execute_operations(self.operations)
+        elif database_provider == DatabaseProvider.POSTGRESQL:
+            PostgresExecutor.execute_operations(self.operations)
+        else:
+            raise NotImplementedError()
@@ -5,11 +5,14 @@ from skibidi_orm.migration_engine.adapters.database_objects.constraints import (
     Constraint,
     ForeignKeyConstraint,
     CheckConstraint,
+    DefaultConstraint,
+    NotNullConstraint,
+    PrimaryKeyConstraint,
 )
 from skibidi_orm.exceptions.operations import IrreversibleOperationError
 from skibidi_orm.migration_engine.adapters.base_adapter import BaseTable, BaseColumn
 from typing import Any
-from dataclasses import dataclass, field
+from dataclasses import dataclass, field, replace
 from typing import Optional
 
 
@@ -44,6 +47,29 @@ class ColumnOperation(ABC):
         return f"{self.__class__.__name__}(table={self.table}, is_reversible={self.is_reversible})"
 
 
+@dataclass(frozen=True)
+class Backfill:
+    """
+    Backfill stage of an add column operation. The column is added as nullable,
+    populated in chunks of rows ranged by the primary key, each chunk updated
+    in a transaction of its own, and only then given its NOT NULL and DEFAULT constraints.
+    The last key of each chunk is checkpointed in the database along with the chunk,
+    so an interrupted backfill resumes after the last populated chunk.
+
+    Attributes:
+        value (str): SQL expression computing the value of the column for a row,
+            it can refer to the other columns of the row.
+
+        chunk_size (int): Number of rows populated in a single transaction.
+
+        throttle (float): Seconds waited between the chunks, letting other writers in.
+    """
+
+    value: str
+    chunk_size: int = 1000
+    throttle: float = 0.0
+
+
 @dataclass(frozen=True)
 class AddColumnOperation(ColumnOperation):
     """Class for adding a column"""
@@ -55,10 +81,60 @@ class AddColumnOperation(ColumnOperation):
     # adding the column after creating it. they can only reference the column to be added!
     related_foreign_key: Optional[ForeignKeyConstraint] = field(default=None)
     related_check_constraint: Optional[CheckConstraint] = field(default=None)
+    backfill: Optional[Backfill] = field(default=None)
 
     def reverse(self) -> ColumnOperation:
         return DeleteColumnOperation(table=self.table, column=self.column)
 
+    def deferred_constraints(self) -> list[NotNullConstraint | DefaultConstraint]:
+        """The constraints of the column applied only after its backfill"""
+        return [
+            c
+            for c in self.column.column_constraints
+            if isinstance(c, (NotNullConstraint, DefaultConstraint))
+        ]
+
+    def without_deferred_constraints(self) -> AddColumnOperation:
+        """The operation adding the column as nullable and without a default value,
+        which the backfill then populates"""
+        deferred = self.deferred_constraints()
+        return replace(
+            self,
+            column=replace(
+                self.column,
+                column_constraints=[
+                    c for c in self.column.column_constraints if c not in deferred
+                ],
+            ),
+            backfill=None,
+        )
+
+    def deferred_constraint_operations(self) -> list[AddConstraintOperation]:
+        """The operations applying the deferred constraints to the backfilled column,
+        each of them given the table as it is after the previous ones"""
+        column = self.without_deferred_constraints().column
+        table = replace(self.table, columns=self.table.columns + [column])
+        operations: list[AddConstraintOperation] = []
+        for constraint in self.deferred_constraints():
+            operations.append(AddConstraintOperation(table, column, constraint))
+            column = replace(
+                column, column_constraints=column.column_constraints + [constraint]
+            )
+            table = replace(
+                table,
+                columns=[column if c.name == column.name else c for c in table.columns],
+            )
+        return operations
+
+    def primary_key(self) -> Optional[str]:
+        """The name of the single-column primary key of the table, if it has one"""
+        keys = [
+            c.name
+            for c in self.table.columns
+            if any(isinstance(k, PrimaryKeyConstraint) for k in c.column_constraints)
+        ]
+        return keys[0] if len(keys) == 1 else None
+
     def __post_init__(self):
         self.validate_related_foreign_key()
 
@@ -13,3 +13,13 @@ def get_revision_table_name() -> str:
     If no name is set via an environment variable, the default name is used."""
     load_dotenv()
     return os.environ.get("__CHUMPY_REVISION_TABLE_NAME", DEFAULT_REVISION_TABLE_NAME)  # type: ignore
+
+
+DEFAULT_BACKFILL_TABLE_NAME = "__backfills"
+
+
+def get_backfill_table_name() -> str:
+    """Get the name of the table used to checkpoint the progress of column backfills.
+    If no name is set via an environment variable, the default name is used."""
+    load_dotenv()
+    return os.environ.get("__CHUMPY_BACKFILL_TABLE_NAME", DEFAULT_BACKFILL_TABLE_NAME)  # type: ignore
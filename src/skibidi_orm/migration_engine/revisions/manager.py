@@ -1,9 +1,12 @@
 from skibidi_orm.migration_engine.adapters.providers import DatabaseProvider
+from skibidi_orm.migration_engine.converters.postgres.all import PostgresConverter
 from skibidi_orm.migration_engine.converters.sqlite3.all import SQLite3Converter
 from skibidi_orm.migration_engine.db_config.base_config import BaseDbConfig
 from skibidi_orm.migration_engine.revisions.revision import Revision
+from skibidi_orm.migration_engine.sql_executor.postgres_executor import PostgresExecutor
 from skibidi_orm.migration_engine.sql_executor.sqlite3_executor import SQLite3Executor
 import sqlite3
+import psycopg2
 
 from skibidi_orm.migration_engine.state_manager.state_manager import StateManager
 
@@ -22,6 +25,9 @@ class RevisionManager:
         if database_provider == DatabaseProvider.SQLITE3:
             self.converter = SQLite3Converter
             self.executor = SQLite3Executor
+        elif database_provider == DatabaseProvider.POSTGRESQL:
+            self.converter = PostgresConverter
+            self.executor = PostgresExecutor
         else:
             raise NotImplementedError()
 
@@ -41,7 +47,8 @@ class RevisionManager:
             self.executor.execute_sql(revision_data_query)
             return True
         except (
-            sqlite3.OperationalError  # more exceptions can be added here for each provider
+            sqlite3.OperationalError,  # more exceptions can be added here for each provider
+            psycopg2.ProgrammingError,
         ):
             return False
 
@@ -37,7 +37,11 @@ class Revision:
         """This method is used to serialize the object before inserting it into the database.
         Every database provider has to take care of adapting and converting it."""
         if protocol is sqlite3.PrepareProtocol:
-            return pickle.dumps(self)
+            return self.serialize()
+
+    def serialize(self) -> bytes:
+        """Serializes the object, to be stored in the revision table."""
+        return pickle.dumps(self)
 
     @staticmethod
     def deserialize(data: bytes):
@@ -1,8 +1,14 @@
 from abc import ABC, abstractmethod
-from typing import Any
+from typing import Any, Callable, ContextManager, Iterator
+import time
 
+from skibidi_orm.migration_engine.converters.base.interfaces import SQLQueryConverter
+from skibidi_orm.migration_engine.db_config.lock_retry import LockRetry
 from skibidi_orm.migration_engine.operations.table_operations import TableOperation
-from skibidi_orm.migration_engine.operations.column_operations import ColumnOperation
+from skibidi_orm.migration_engine.operations.column_operations import (
+    AddColumnOperation,
+    ColumnOperation,
+)
 from skibidi_orm.migration_engine.revisions.revision import Revision
 
 
@@ -34,3 +40,74 @@ class BaseSQLExecutor(ABC):
     def get_all_revisions() -> list[tuple[int, Revision]]:
         """Get all the revisions from the database
         returns a list of tuples (id, revision)"""
+
+    @staticmethod
+    def split_backfills(
+        operations: list[TableOperation | ColumnOperation],
+    ) -> Iterator[list[TableOperation | ColumnOperation] | AddColumnOperation]:
+        """
+        Splits the operations at the add column operations with a backfill stage.
+        Yields the lists of operations run between the backfills, each within a transaction,
+        and the backfilled operations themselves, which apply their deferred constraints.
+        """
+        stage: list[TableOperation | ColumnOperation] = []
+        for operation in operations:
+            if isinstance(operation, AddColumnOperation) and operation.backfill:
+                if stage:
+                    yield stage
+                yield operation
+                stage = []
+            else:
+                stage.append(operation)
+        if stage:
+            yield stage
+
+    @staticmethod
+    def populate_backfill(
+        operation: AddColumnOperation,
+        key: str,
+        last_key: Any,
+        transaction: Callable[[float], ContextManager[Any]],
+        queries: type[SQLQueryConverter],
+        lock_retry: LockRetry,
+    ) -> None:
+        """
+        Populates the backfilled column in chunks of rows ranged by the given key,
+        starting after the last populated key (None if no chunk was populated yet).
+        Each chunk is updated along with its checkpoint in a transaction of its own,
+        given the lock timeout and yielding a cursor, and retried when it fails to get
+        a lock. The backfill throttle is waited between the chunks.
+        """
+        backfill = operation.backfill
+        assert backfill is not None
+        table_name = operation.table.name
+        column_name = operation.column.name
+
+        def populate_chunk(lock_timeout: float) -> Any:
+            resumed = last_key is not None
+            with transaction(lock_timeout) as cursor:
+                cursor.execute(
+                    queries.get_backfill_chunk_end_query(table_name, key, resumed),
+                    (
+                        (last_key, backfill.chunk_size)
+                        if resumed
+                        else (backfill.chunk_size,)
+                    ),
+                )
+                chunk_end = cursor.fetchone()[0]
+                if chunk_end is not None:
+                    cursor.execute(
+                        queries.get_backfill_chunk_query(
+                            table_name, column_name, key, backfill.value, resumed
+                        ),
+                        (last_key, chunk_end) if resumed else (chunk_end,),
+                    )
+                    cursor.execute(
+                        queries.get_backfill_checkpoint_query(),
+                        (chunk_end, table_name, column_name),
+                    )
+            return chunk_end
+
+        while (chunk_end := lock_retry.run(populate_chunk)) is not None:
+            last_key = chunk_end
+            time.sleep(backfill.throttle)
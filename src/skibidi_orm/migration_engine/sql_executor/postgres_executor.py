@@ -0,0 +1,244 @@
+from contextlib import contextmanager
+from typing import Any, Iterable, Iterator
+import pickle
+import psycopg2
+from psycopg2.extensions import cursor as Cursor
+from skibidi_orm.migration_engine.db_config.postgres_config import PostgresConfig
+from skibidi_orm.migration_engine.revisions.revision import Revision
+from skibidi_orm.migration_engine.sql_executor.base_sql_executor import BaseSQLExecutor
+from skibidi_orm.migration_engine.operations.column_operations import (
+    AddColumnOperation,
+    ColumnOperation,
+)
+from skibidi_orm.exceptions.operations import UnsupportedOperationError
+from skibidi_orm.migration_engine.operations.table_operations import TableOperation
+from skibidi_orm.migration_engine.converters.postgres.all import PostgresConverter
+from skibidi_orm.migration_engine.converters.postgres.queries import (
+    PostgresQueryConverter,
+)
+from skibidi_orm.migration_engine.db_inspectors.inspection_cache import (
+    invalidate_inspection_cache,
+)
+from skibidi_orm.migration_engine.sql_executor.sql_splitter import (
+    split_sql_statements,
+)
+
+
+class PostgresExecutor(BaseSQLExecutor):
+    """
+    Executes SQL statements and operations on a Postgres database.
+
+    All of the methods use connections from the pool of the Postgres config, so no
+    connection is opened per call. Postgres supports transactional DDL, so a whole migration
+    runs within a single transaction. Its statements are sent in batches, each batch
+    as one multi-statement query taking a single round trip to the server.
+
+    Methods:
+        execute_sql: Executes a SQL script within a single transaction.
+        execute_operations: Executes a list of table or column operations in a single transaction.
+        execute_statements: Executes statements within a single transaction, in batches.
+        backfill: Adds a column and populates it in chunks, then applies its constraints.
+        resume_backfills: Finishes the backfills which were interrupted.
+        batch_statements: Joins statements into batches sent to the database at once.
+        transaction: Runs a single transaction on a pooled connection, with a lock timeout.
+
+    """
+
+    @staticmethod
+    def execute_sql(sql: str):
+        """
+        Executes a SQL script within a single transaction, sending its statements in batches.
+
+        Args:
+            sql (str): The SQL statements to be executed.
+
+        Returns:
+            None
+
+        """
+        PostgresExecutor.execute_statements(split_sql_statements(sql))
+
+    @staticmethod
+    def execute_sql_query(sql: str) -> list[Any]:
+        with PostgresExecutor.transaction() as cursor:
+            cursor.execute(sql)
+            return cursor.fetchall()
+
+    @staticmethod
+    def save_revision(revision: Revision):
+        query = PostgresConverter.get_revision_insertion_query()
+
+        def attempt(lock_timeout: float):
+            with PostgresExecutor.transaction(lock_timeout) as cursor:
+                cursor.execute(query, (psycopg2.Binary(revision.serialize()),))
+
+        PostgresConfig.get_instance().lock_retry.run(attempt)
+
+    @staticmethod
+    def get_all_revisions() -> list[tuple[int, Revision]]:
+        query = PostgresConverter.get_revision_data_query()
+        with PostgresExecutor.transaction() as cursor:
+            cursor.execute(query)
+            return [(id, Revision.deserialize(rev)) for id, rev in cursor.fetchall()]
+
+    @staticmethod
+    def execute_operations(operations: list[TableOperation | ColumnOperation]):
+        """
+        Executes a list of table or column operations.
+        The whole list runs within a single transaction, so if any of the operations
+        fails, none of them is applied. The statements of the operations are sent in
+        batches of the size set in the config, one round trip per batch.
+        Add column operations with a backfill stage are run outside of the transaction,
+        which then ends before each of them and starts anew after it. Backfills
+        interrupted before are finished first. A transaction failing to get a lock held
+        by another connection is retried within the limits set in the config.
+
+        Args:
+            operations (list[TableOperation | ColumnOperation]): The list of table or column operations to be executed.
+
+        Returns:
+            None
+
+        """
+        PostgresExecutor.resume_backfills()
+        for stage in PostgresExecutor.split_backfills(operations):
+            if isinstance(stage, AddColumnOperation):
+                PostgresExecutor.backfill(stage)
+            else:
+                PostgresExecutor.execute_statements(
+                    statement
+                    for operation in stage
+                    for statement in split_sql_statements(
+                        PostgresConverter.convert_operation_to_SQL(operation)
+                    )
+                )
+
+    @staticmethod
+    def backfill(operation: AddColumnOperation, last_key: Any = None):
+        """
+        Runs an add column operation with a backfill stage. The column is added as nullable
+        (and recorded as backfilled) in one transaction, populated in chunks ranged by
+        the primary key of the table and finally given its NOT NULL and DEFAULT constraints.
+        A backfill recorded before, which was interrupted, is resumed after the given
+        last populated key instead.
+        """
+        queries = PostgresQueryConverter
+        key = operation.primary_key()
+        if key is None:
+            raise UnsupportedOperationError(
+                f"Backfilling column {operation.column.name} requires table {operation.table.name} to have a single-column primary key."
+            )
+        lock_retry = PostgresConfig.get_instance().lock_retry
+
+        def start(lock_timeout: float):
+            with PostgresExecutor.transaction(lock_timeout) as cursor:
+                cursor.execute(queries.get_backfill_table_creation_query())
+                cursor.execute(queries.get_backfill_data_query())
+                pending = {
+                    (table_name, column_name)
+                    for table_name, column_name, *_ in cursor.fetchall()
+                }
+                if (operation.table.name, operation.column.name) not in pending:
+                    cursor.execute(
+                        PostgresConverter.convert_operation_to_SQL(
+                            operation.without_deferred_constraints()
+                        )
+                    )
+                    cursor.execute(
+                        queries.get_backfill_insertion_query(),
+                        (
+                            operation.table.name,
+                            operation.column.name,
+                            psycopg2.Binary(pickle.dumps(operation)),
+                        ),
+                    )
+
+        def finish(lock_timeout: float):
+            with PostgresExecutor.transaction(lock_timeout) as cursor:
+                for constraint_operation in operation.deferred_constraint_operations():
+                    cursor.execute(
+                        PostgresConverter.convert_operation_to_SQL(constraint_operation)
+                    )
+                cursor.execute(
+                    queries.get_backfill_deletion_query(),
+                    (operation.table.name, operation.column.name),
+                )
+
+        lock_retry.run(start)
+        PostgresExecutor.populate_backfill(
+            operation, key, last_key, PostgresExecutor.transaction, queries, lock_retry
+        )
+        lock_retry.run(finish)
+        invalidate_inspection_cache()
+
+    @staticmethod
+    def resume_backfills():
+        """
+        Finishes the backfills which were interrupted, each from its last checkpoint.
+        """
+        query = PostgresQueryConverter.get_backfill_data_query()
+        try:
+            pending = PostgresExecutor.execute_sql_query(query)
+        except psycopg2.errors.UndefinedTable:
+            return  # no backfill was ever run
+        for _, _, operation, last_key in pending:
+            PostgresExecutor.backfill(pickle.loads(operation), last_key)
+
+    @staticmethod
+    def execute_statements(statements: Iterable[str]):
+        """
+        Executes the statements within a single transaction, in batches.
+        The transaction is retried when it fails to get a lock.
+        """
+        postgres_config = PostgresConfig.get_instance()
+        batches = list(
+            PostgresExecutor.batch_statements(
+                statements, postgres_config.execution_batch_size
+            )
+        )
+
+        def attempt(lock_timeout: float):
+            with PostgresExecutor.transaction(lock_timeout) as cursor:
+                for batch in batches:
+                    cursor.execute(batch)
+
+        postgres_config.lock_retry.run(attempt)
+        invalidate_inspection_cache()
+
+    @staticmethod
+    def batch_statements(statements: Iterable[str], batch_size: int) -> Iterator[str]:
+        """
+        Joins the statements into multi-statement queries of at most batch_size statements.
+        The server runs such a query statement by statement, stopping at the first error.
+        """
+        batch: list[str] = []
+        for statement in statements:
+            batch.append(f"{statement};")
+            if len(batch) >= batch_size:
+                yield "\n".join(batch)
+                batch = []
+        if batch:
+            yield "\n".join(batch)
+
+    @staticmethod
+    @contextmanager
+    def transaction(lock_timeout: float | None = None) -> Iterator[Cursor]:
+        """
+        Runs a single transaction on a pooled connection, committed when
+        the block completes and rolled back when it raises. Yields its cursor.
+        Each statement of the transaction waits for locks held by other connections
+        for at most lock_timeout seconds if given, so that the queries queued behind
+        the statement are not held up for longer.
+        """
+        with PostgresConfig.get_instance().connection_pool.connection() as connection:
+            try:
+                with connection.cursor() as cursor:
+                    if lock_timeout is not None:
+                        cursor.execute(
+                            f"SET LOCAL lock_timeout = '{max(1, int(lock_timeout * 1000))}ms';"
+                        )
+                    yield cursor
+            except BaseException:
+                connection.rollback()
+                raise
+            connection.commit()
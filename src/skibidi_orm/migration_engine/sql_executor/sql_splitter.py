@@ -0,0 +1,153 @@
+"""Splitting of SQL scripts into statements. The script is scanned token by token, so
+semicolons inside string literals, quoted identifiers, dollar-quoted Postgres bodies,
+comments and the BEGIN ... END bodies of SQLite triggers do not end a statement.
+Scripts are usually split more than once (the same migration SQL, the same studio
+query), so the statements of recently split scripts are cached. The same scanning finds
+the CHECK constraints of table definitions."""
+
+from __future__ import annotations
+from functools import lru_cache
+import re
+
+SQL_SPLITTER_CACHE_SIZE = 256
+
+# characters closing each kind of quote; a doubled closing character is an escaped one
+QUOTES = {"'": "'", '"': '"', "`": "`", "[": "]"}
+
+# opening tag of a Postgres dollar-quoted string, e.g. $$ or $body$
+DOLLAR_QUOTE = re.compile(r"\$(?:[A-Za-z_][A-Za-z0-9_]*)?\$")
+
+
+def split_sql_statements(script: str) -> list[str]:
+    """
+    Split the script into its statements, stripped of surrounding whitespace and
+    of the terminating semicolons. Statements consisting only of comments are left out.
+    """
+    return list(_split_sql_statements(script))
+
+
+@lru_cache(maxsize=SQL_SPLITTER_CACHE_SIZE)
+def _split_sql_statements(script: str) -> tuple[str, ...]:
+    """
+    Split the script, caching the statements of the recently split scripts.
+    """
+    statements: list[str] = []
+    start = 0
+    has_tokens = False
+    # first words of the current statement, telling whether it creates a trigger
+    statement_words: list[str] = []
+    # nesting of BEGIN ... END (and CASE ... END) blocks of a trigger body
+    depth = 0
+
+    i = 0
+    n = len(script)
+    while i < n:
+        char = script[i]
+        if char in QUOTES:
+            i = _skip_quoted(script, i, QUOTES[char])
+            has_tokens = True
+        elif char == "$" and (dollar_quote := DOLLAR_QUOTE.match(script, i)):
+            end = script.find(dollar_quote.group(), dollar_quote.end())
+            i = n if end == -1 else end + len(dollar_quote.group())
+            has_tokens = True
+        elif script.startswith("--", i):
+            newline = script.find("\n", i)
+            i = n if newline == -1 else newline + 1
+        elif script.startswith("/*", i):
+            end = script.find("*/", i + 2)
+            i = n if end == -1 else end + 2
+        elif char.isalpha() or char == "_":
+            j = i + 1
+            while j < n and (script[j].isalnum() or script[j] in "_$"):
+                j += 1
+            word = script[i:j].upper()
+            if word == "BEGIN" and (depth or "TRIGGER" in statement_words):
+                depth += 1
+            elif word == "CASE" and depth:
+                depth += 1
+            elif word == "END" and depth:
+                depth -= 1
+            elif len(statement_words) < 3:
+                statement_words.append(word)
+            has_tokens = True
+            i = j
+        elif char == ";" and not depth:
+            if has_tokens:
+                statements.append(script[start:i].strip())
+            start = i + 1
+            has_tokens = False
+            statement_words = []
+            i += 1
+        else:
+            has_tokens = has_tokens or not char.isspace()
+            i += 1
+
+    if has_tokens:
+        statements.append(script[start:].strip())
+    return tuple(statements)
+
+
+def find_check_conditions(definition: str) -> list[str]:
+    """
+    Find the conditions of all CHECK constraints, column and table ones,
+    in the given CREATE TABLE statement.
+    """
+    conditions: list[str] = []
+    i = 0
+    n = len(definition)
+    while i < n:
+        char = definition[i]
+        if char in QUOTES:
+            i = _skip_quoted(definition, i, QUOTES[char])
+        elif definition.startswith("--", i):
+            newline = definition.find("\n", i)
+            i = n if newline == -1 else newline + 1
+        elif definition.startswith("/*", i):
+            end = definition.find("*/", i + 2)
+            i = n if end == -1 else end + 2
+        elif char.isalpha() or char == "_":
+            j = i + 1
+            while j < n and (definition[j].isalnum() or definition[j] in "_$"):
+                j += 1
+            if definition[i:j].upper() == "CHECK":
+                opening = definition.find("(", j)
+                if opening != -1 and not definition[j:opening].strip():
+                    j = _skip_parenthesized(definition, opening)
+                    conditions.append(definition[opening + 1 : j - 1].strip())
+            i = j
+        else:
+            i += 1
+    return conditions
+
+
+def _skip_parenthesized(script: str, start: int) -> int:
+    """Index right after the parenthesized group starting at the given index"""
+    depth = 0
+    i = start
+    n = len(script)
+    while i < n:
+        char = script[i]
+        if char in QUOTES:
+            i = _skip_quoted(script, i, QUOTES[char])
+            continue
+        if char == "(":
+            depth += 1
+        elif char == ")":
+            depth -= 1
+            if not depth:
+                return i + 1
+        i += 1
+    return n
+
+
+def _skip_quoted(script: str, start: int, closing: str) -> int:
+    """Index right after the quoted token starting at the given index"""
+    i = start + 1
+    while True:
+        end = script.find(closing, i)
+        if end == -1:
+            return len(script)
+        if closing != "]" and script.startswith(closing * 2, end):
+            i = end + 2
+            continue
+        return end + 1
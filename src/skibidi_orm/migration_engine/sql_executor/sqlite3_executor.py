@@ -1,12 +1,35 @@
+from contextlib import contextmanager
+from dataclasses import replace
+import pickle
 import sqlite3
-from typing import Any
+from typing import Any, Iterator, cast
 from skibidi_orm.migration_engine.db_config.sqlite3_config import SQLite3Config
+from skibidi_orm.migration_engine.db_config.sqlite3_profile import SQLite3Profile
 from skibidi_orm.migration_engine.revisions.revision import Revision
 from skibidi_orm.migration_engine.sql_executor.base_sql_executor import BaseSQLExecutor
-from skibidi_orm.migration_engine.operations.column_operations import ColumnOperation
-from skibidi_orm.migration_engine.operations.table_operations import TableOperation
+from skibidi_orm.migration_engine.operations.column_operations import (
+    AddColumnOperation,
+    ColumnOperation,
+)
+from skibidi_orm.migration_engine.operations.table_operations import (
+    RenameTableOperation,
+    TableOperation,
+)
 
 from skibidi_orm.migration_engine.converters.sqlite3.all import SQLite3Converter
+from skibidi_orm.migration_engine.converters.sqlite3.columns import (
+    SQLite3ColumnOperationConverter,
+)
+from skibidi_orm.migration_engine.converters.sqlite3.queries import (
+    SQLite3QueryConverter,
+)
+from skibidi_orm.migration_engine.db_inspectors.inspection_cache import (
+    invalidate_inspection_cache,
+)
+from skibidi_orm.migration_engine.sql_executor.sql_splitter import (
+    find_check_conditions,
+    split_sql_statements,
+)
 
 
 class SQLite3Executor(BaseSQLExecutor):
@@ -17,66 +40,73 @@ class SQLite3Executor(BaseSQLExecutor):
     It inherits from the BaseSQLExecutor class.
 
     Methods:
-        execute_sql: Executes a single SQL statement.
-        execute_operations: Executes a list of table or column operations.
+        execute_sql: Executes a SQL script, statement by statement.
+        execute_operations: Executes a list of table or column operations in a single transaction.
+        backfill: Adds a column and populates it in chunks, then applies its constraints.
+        resume_backfills: Finishes the backfills which were interrupted.
+        rebuild_table: Rebuilds a table once with all of the given column changes.
+        transaction: Runs a single explicit transaction on a pooled connection.
 
     """
 
     @staticmethod
     def execute_sql(sql: str):
         """
-        Executes a single SQL statement.
+        Executes a SQL script, statement by statement.
 
         Args:
-            sql (str): The SQL statement to be executed.
+            sql (str): The SQL statements to be executed.
 
         Returns:
             None
 
         """
         sqlite_config = SQLite3Config.get_instance()
-        with sqlite3.connect(sqlite_config.db_path) as conn:
+        with sqlite_config.connection_pool.connection() as conn:
             cursor = conn.cursor()
-            commands = sql.split(";")
-            for command in commands:
-                if not command:
-                    continue
-                cursor.execute(command.strip())
+            for statement in split_sql_statements(sql):
+                cursor.execute(statement)
             conn.commit()
+        invalidate_inspection_cache()
 
     @staticmethod
     def execute_sql_query(sql: str) -> list[Any]:
         sqlite_config = SQLite3Config.get_instance()
-        with sqlite3.connect(sqlite_config.db_path) as conn:
+        with sqlite_config.connection_pool.connection() as conn:
             cursor = conn.cursor()
-            result = cursor.execute(sql)
-
-        return result.fetchall()
+            return cursor.execute(sql).fetchall()
 
     @staticmethod
     def save_revision(revision: Revision):
         query = SQLite3Converter.get_revision_insertion_query()
-        with sqlite3.connect(
-            SQLite3Config.get_instance().db_path, detect_types=sqlite3.PARSE_DECLTYPES
-        ) as conn:
-            cursor = conn.cursor()
-            cursor.execute(query, (revision,))
-            conn.commit()
+
+        def attempt(lock_timeout: float):
+            with SQLite3Executor._cursor(lock_timeout) as cursor:
+                cursor.execute(query, (revision,))
+
+        SQLite3Config.get_instance().lock_retry.run(attempt)
 
     @staticmethod
     def get_all_revisions() -> list[tuple[int, Revision]]:
         query = SQLite3Converter.get_revision_data_query()
-        with sqlite3.connect(
-            SQLite3Config.get_instance().db_path, detect_types=sqlite3.PARSE_DECLTYPES
-        ) as conn:
+        with SQLite3Config.get_instance().connection_pool.connection() as conn:
             cursor = conn.cursor()
             result = cursor.execute(query)
-            return result.fetchall()
+            return [(id, Revision.deserialize(rev)) for id, rev in result.fetchall()]
 
     @staticmethod
     def execute_operations(operations: list[TableOperation | ColumnOperation]):
         """
         Executes a list of table or column operations.
+        The whole list runs over one connection within a single transaction, so it is
+        committed (and synced to disk) once. If any of the operations fails, none of them
+        is applied. The migration profile of the config is switched on for its duration.
+        The SQL of the operations is split into statements by a tokenizer,
+        so semicolons in literals, CHECK conditions or trigger bodies are kept.
+        Add column operations with a backfill stage are run outside of the transaction,
+        which then ends before each of them and starts anew after it. Backfills
+        interrupted before are finished first. A transaction failing to get a lock held
+        by another connection is retried within the limits set in the config.
 
         Args:
             operations (list[TableOperation | ColumnOperation]): The list of table or column operations to be executed.
@@ -85,7 +115,270 @@ class SQLite3Executor(BaseSQLExecutor):
             None
 
         """
-        for operation in operations:
-            SQLite3Executor.execute_sql(
-                SQLite3Converter.convert_operation_to_SQL(operation)
+        SQLite3Executor.resume_backfills()
+        for stage in SQLite3Executor.split_backfills(operations):
+            if isinstance(stage, AddColumnOperation):
+                SQLite3Executor.backfill(stage)
+            else:
+                SQLite3Executor._execute_operations(stage)
+        invalidate_inspection_cache()
+
+    @staticmethod
+    def _execute_operations(operations: list[TableOperation | ColumnOperation]):
+        """
+        Executes the operations in a single transaction, retried when it fails
+        to get a lock.
+        """
+        sqlite_config = SQLite3Config.get_instance()
+        rebuilds = SQLite3Executor.group_table_rebuilds(operations)
+
+        def attempt(lock_timeout: float):
+            with SQLite3Executor.transaction(
+                sqlite_config.migration_profile, lock_timeout, bool(rebuilds)
+            ) as conn:
+                for i, operation in enumerate(operations):
+                    if i not in rebuilds:
+                        for statement in split_sql_statements(
+                            SQLite3Converter.convert_operation_to_SQL(operation)
+                        ):
+                            conn.execute(statement)
+                    elif rebuilds[i]:
+                        SQLite3Executor._rebuild_table(
+                            conn,
+                            [cast(ColumnOperation, operations[j]) for j in rebuilds[i]],
+                        )
+
+        sqlite_config.lock_retry.run(attempt)
+
+    @staticmethod
+    def backfill(operation: AddColumnOperation, last_key: Any = None):
+        """
+        Runs an add column operation with a backfill stage. The column is added as nullable
+        (and recorded as backfilled) in one transaction, populated in chunks ranged by
+        the primary key of the table (its rowid if it has none) and finally given
+        its NOT NULL and DEFAULT constraints. As SQLite3 cannot add these constraints
+        to an existing column, the table is rebuilt for them - a single copy of the rows,
+        with no values computed. A backfill recorded before, which was interrupted,
+        is resumed after the given last populated key instead.
+        """
+        sqlite_config = SQLite3Config.get_instance()
+        queries = SQLite3QueryConverter
+        key = operation.primary_key() or "rowid"
+
+        def start(lock_timeout: float):
+            with SQLite3Executor.transaction(lock_timeout=lock_timeout) as conn:
+                conn.execute(queries.get_backfill_table_creation_query())
+                pending = {
+                    (table_name, column_name)
+                    for table_name, column_name, *_ in conn.execute(
+                        queries.get_backfill_data_query()
+                    )
+                }
+                if (operation.table.name, operation.column.name) not in pending:
+                    for statement in split_sql_statements(
+                        SQLite3Converter.convert_operation_to_SQL(
+                            operation.without_deferred_constraints()
+                        )
+                    ):
+                        conn.execute(statement)
+                    conn.execute(
+                        queries.get_backfill_insertion_query(),
+                        (
+                            operation.table.name,
+                            operation.column.name,
+                            pickle.dumps(operation),
+                        ),
+                    )
+
+        constraint_operations = operation.deferred_constraint_operations()
+
+        def finish(lock_timeout: float):
+            with SQLite3Executor.transaction(
+                sqlite_config.migration_profile,
+                lock_timeout,
+                bool(constraint_operations),
+            ) as conn:
+                if constraint_operations:
+                    SQLite3Executor._rebuild_table(
+                        conn, cast(list[ColumnOperation], constraint_operations)
+                    )
+                conn.execute(
+                    queries.get_backfill_deletion_query(),
+                    (operation.table.name, operation.column.name),
+                )
+
+        sqlite_config.lock_retry.run(start)
+        SQLite3Executor.populate_backfill(
+            operation,
+            key,
+            last_key,
+            SQLite3Executor._cursor,
+            queries,
+            sqlite_config.lock_retry,
+        )
+        sqlite_config.lock_retry.run(finish)
+        invalidate_inspection_cache()
+
+    @staticmethod
+    def resume_backfills():
+        """
+        Finishes the backfills which were interrupted, each from its last checkpoint.
+        """
+        query = SQLite3QueryConverter.get_backfill_data_query()
+        try:
+            pending = SQLite3Executor.execute_sql_query(query)
+        except sqlite3.OperationalError:
+            return  # no backfill was ever run
+        for _, _, operation, last_key in pending:
+            SQLite3Executor.backfill(pickle.loads(operation), last_key)
+
+    @staticmethod
+    @contextmanager
+    def _cursor(lock_timeout: float | None = None) -> Iterator[sqlite3.Cursor]:
+        """
+        Runs a transaction in the default mode of a pooled connection, yielding its cursor.
+        The transaction waits for locks for at most the given number of seconds.
+        """
+        with SQLite3Config.get_instance().connection_pool.connection() as conn:
+            with SQLite3Executor.lock_timeout_profile(lock_timeout).applied(conn):
+                yield conn.cursor()
+                conn.commit()
+
+    @staticmethod
+    def lock_timeout_profile(
+        lock_timeout: float | None, profile: SQLite3Profile | None = None
+    ) -> SQLite3Profile:
+        """The given profile, with the busy timeout set to the lock timeout if given"""
+        profile = profile or SQLite3Profile()
+        if lock_timeout is None:
+            return profile
+        return replace(profile, busy_timeout=max(1, int(lock_timeout * 1000)))
+
+    @staticmethod
+    @contextmanager
+    def transaction(
+        profile: SQLite3Profile | None = None,
+        lock_timeout: float | None = None,
+        rebuilds_tables: bool = False,
+    ) -> Iterator[sqlite3.Connection]:
+        """
+        Runs a single explicit transaction on a pooled connection (BEGIN IMMEDIATE, so the
+        write lock is taken up front), committed when the block completes and rolled back
+        when it raises. Yields the connection. Foreign key enforcement, which cannot be
+        changed within a transaction, is turned off for the duration of a transaction
+        rebuilding tables, as table rebuilds require. Whenever the enforcement was on,
+        the foreign keys of the whole database are checked before committing, as in
+        the procedure for making schema changes recommended by SQLite, so a violation
+        caused by any of the statements rolls the transaction back. The given profile
+        is switched on for the duration of the transaction, and the transaction waits
+        for locks held by other connections for at most lock_timeout seconds if given.
+        """
+        sqlite_config = SQLite3Config.get_instance()
+        with sqlite_config.connection_pool.connection() as conn:
+            isolation_level = conn.isolation_level
+            conn.isolation_level = None
+            try:
+                with SQLite3Executor.lock_timeout_profile(
+                    lock_timeout, profile
+                ).applied(conn):
+                    foreign_keys = bool(
+                        conn.execute("PRAGMA foreign_keys;").fetchone()[0]
+                    )
+                    if foreign_keys and rebuilds_tables:
+                        conn.execute("PRAGMA foreign_keys = OFF;")
+                    try:
+                        conn.execute("BEGIN IMMEDIATE;")
+                        try:
+                            yield conn
+                            if (
+                                foreign_keys
+                                and conn.execute("PRAGMA foreign_key_check;").fetchone()
+                            ):
+                                raise sqlite3.IntegrityError(
+                                    "The migration violates foreign key constraints"
+                                )
+                        except BaseException:
+                            conn.execute("ROLLBACK;")
+                            raise
+                        conn.execute("COMMIT;")
+                    finally:
+                        if foreign_keys and rebuilds_tables:
+                            conn.execute("PRAGMA foreign_keys = ON;")
+            finally:
+                conn.isolation_level = isolation_level
+
+    @staticmethod
+    def group_table_rebuilds(
+        operations: list[TableOperation | ColumnOperation],
+    ) -> dict[int, list[int]]:
+        """
+        Groups the operations which need a table rebuild and follow each other on their table.
+        Maps the index of the last operation of each group to the indices of the whole group,
+        and the indices of the other operations in the group to empty lists.
+        """
+        groups: dict[int, list[int]] = {}
+        open_groups: dict[str, list[int]] = {}
+        for i, operation in enumerate(operations):
+            if isinstance(
+                operation, ColumnOperation
+            ) and SQLite3ColumnOperationConverter.is_alter_column_operation(operation):
+                group = open_groups.setdefault(operation.table.name, [])
+                if group:
+                    groups[group[-1]] = []
+                group.append(i)
+                groups[i] = group
+            else:
+                open_groups.pop(operation.table.name, None)
+                if isinstance(operation, RenameTableOperation):
+                    open_groups.pop(operation.new_name, None)
+        return groups
+
+    @staticmethod
+    def rebuild_table(operations: list[ColumnOperation]):
+        """
+        Rebuilds a table once with all of the given changes, following the procedure
+        for making schema changes recommended by SQLite: with foreign key enforcement
+        off and within a transaction, the table is copied into a shadow table with the
+        new definition which then replaces it, its indexes and triggers are recreated,
+        and the foreign keys are checked before committing. The migration profile
+        of the config is switched on for its duration. The transaction is retried
+        when it fails to get a lock.
+        """
+        sqlite_config = SQLite3Config.get_instance()
+
+        def attempt(lock_timeout: float):
+            with SQLite3Executor.transaction(
+                sqlite_config.migration_profile, lock_timeout, rebuilds_tables=True
+            ) as conn:
+                SQLite3Executor._rebuild_table(conn, operations)
+
+        sqlite_config.lock_retry.run(attempt)
+        invalidate_inspection_cache()
+
+    @staticmethod
+    def _rebuild_table(
+        conn: sqlite3.Connection,
+        operations: list[ColumnOperation],
+    ):
+        """
+        Rebuilds a table within the transaction running on the given connection,
+        which has to have foreign key enforcement off.
+        """
+        table_name = operations[0].table.name
+        # the inspected tables have no CHECK constraints, so they are taken from
+        # the current definition of the table
+        (definition,) = conn.execute(
+            SQLite3QueryConverter.get_table_definition_query(), (table_name,)
+        ).fetchone()
+        sql = SQLite3ColumnOperationConverter.convert_alter_column_operations_to_SQL(
+            operations, find_check_conditions(definition)
+        )
+        indexes_and_triggers = [
+            row[0]
+            for row in conn.execute(
+                SQLite3QueryConverter.get_table_indexes_and_triggers_query(),
+                (table_name,),
             )
+        ]
+        for statement in split_sql_statements(sql) + indexes_and_triggers:
+            conn.execute(statement)
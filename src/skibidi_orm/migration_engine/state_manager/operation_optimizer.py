@@ -0,0 +1,275 @@
+from __future__ import annotations
+from collections import defaultdict
+from dataclasses import replace
+from typing import Any
+
+from skibidi_orm.migration_engine.adapters.base_adapter import BaseColumn, BaseTable
+from skibidi_orm.migration_engine.adapters.database_objects.constraints import (
+    ColumnWideConstraint,
+    ForeignKeyConstraint,
+    TableWideConstraint,
+)
+from skibidi_orm.migration_engine.operations.column_operations import (
+    AddColumnOperation,
+    AddConstraintOperation,
+    ChangeDataTypeOperation,
+    ColumnOperation,
+    DeleteColumnOperation,
+    DeleteConstraintOperation,
+    RenameColumnOperation,
+)
+from skibidi_orm.migration_engine.operations.table_operations import (
+    CreateTableOperation,
+    DeleteTableOperation,
+    RenameTableOperation,
+    TableOperation,
+)
+from skibidi_orm.migration_engine.state_manager.state_manager import StateManager
+
+type Operation = TableOperation | ColumnOperation
+
+
+class OperationOptimizer:
+    """
+    Removes redundant work from a list of migration operations before it is converted
+    to SQL. Each operation is combined with the previous operation on the same table,
+    as long as that one is still pending: inverse pairs cancel out, chains of renames
+    and type changes fold into one operation, and changes of a table (column) created
+    by the migration are merged into its definition. Only operations following each
+    other on a table are combined, so every remaining operation still sees the table
+    as it was when the operation was planned.
+    """
+
+    @staticmethod
+    def optimize(operations: list[Operation]) -> list[Operation]:
+        """Return the minimal list of operations with the same effect"""
+        optimized: list[Operation | None] = []
+        # indices of the pending operations on each table, the last one on top
+        table_operations: dict[str, list[int]] = defaultdict(list)
+
+        def remove(index: int) -> None:
+            operation = optimized[index]
+            assert operation is not None
+            optimized[index] = None
+            for table_name in OperationOptimizer.touched_tables(operation):
+                table_operations[table_name].remove(index)
+
+        for operation in operations:
+            current: Operation | None = operation
+            while current is not None:
+                pending = table_operations[current.table.name]
+                if not pending:
+                    break
+                previous_index = pending[-1]
+                previous = optimized[previous_index]
+                assert previous is not None
+                combined = OperationOptimizer.combine(previous, current)
+                if combined is None:
+                    break
+                remove(previous_index)
+                current = combined[0] if combined else None
+
+            if current is not None:
+                optimized.append(current)
+                for table_name in OperationOptimizer.touched_tables(current):
+                    table_operations[table_name].append(len(optimized) - 1)
+
+        return [operation for operation in optimized if operation is not None]
+
+    @staticmethod
+    def touched_tables(operation: Operation) -> list[str]:
+        """Names under which the table of the operation is known before and after it"""
+        if isinstance(operation, RenameTableOperation):
+            return [operation.table.name, operation.new_name]
+        return [operation.table.name]
+
+    @staticmethod
+    def combine(previous: Operation, operation: Operation) -> list[Operation] | None:
+        """
+        Combine two operations on the same table following each other. Returns the operations
+        replacing both of them (none when they cancel out), or None when they cannot be combined.
+        """
+        if isinstance(operation, DeleteTableOperation):
+            if isinstance(previous, CreateTableOperation):
+                return []
+            if isinstance(previous, RenameTableOperation):
+                return [DeleteTableOperation(previous.table)]
+            # changes of a table that is deleted anyway
+            return [operation]
+
+        if isinstance(previous, CreateTableOperation):
+            table = OperationOptimizer.applied_to_table(previous.table, operation)
+            return None if table is None else [CreateTableOperation(table)]
+
+        if isinstance(previous, RenameTableOperation) and isinstance(
+            operation, RenameTableOperation
+        ):
+            if operation.new_name == previous.table.name:
+                return []
+            return [RenameTableOperation(previous.table, operation.new_name)]
+
+        if not isinstance(previous, ColumnOperation) or not isinstance(
+            operation, ColumnOperation
+        ):
+            return None
+        if OperationOptimizer.column_name_after(previous) != operation.column.name:
+            return None
+
+        if isinstance(previous, AddColumnOperation):
+            if isinstance(operation, DeleteColumnOperation):
+                return []
+            column = OperationOptimizer.applied_to_column(previous.column, operation)
+            if column is None:
+                return None
+            return [
+                AddColumnOperation(
+                    previous.table,
+                    column,
+                    related_foreign_key=(
+                        None
+                        if previous.related_foreign_key is None
+                        else replace(
+                            previous.related_foreign_key,
+                            column_mapping={
+                                column.name: referenced_column
+                                for referenced_column in previous.related_foreign_key.column_mapping.values()
+                            },
+                        )
+                    ),
+                    related_check_constraint=previous.related_check_constraint,
+                )
+            ]
+
+        if isinstance(previous, RenameColumnOperation) and isinstance(
+            operation, RenameColumnOperation
+        ):
+            if operation.new_name == previous.column.name:
+                return []
+            return [
+                RenameColumnOperation(
+                    previous.table, previous.column, operation.new_name
+                )
+            ]
+
+        if isinstance(previous, ChangeDataTypeOperation) and isinstance(
+            operation, ChangeDataTypeOperation
+        ):
+            if operation.new_dtype == previous.column.data_type:
+                return []
+            return [
+                ChangeDataTypeOperation(
+                    previous.table, previous.column, operation.new_dtype
+                )
+            ]
+
+        if (
+            isinstance(previous, AddConstraintOperation)
+            and isinstance(operation, DeleteConstraintOperation)
+            or isinstance(previous, DeleteConstraintOperation)
+            and isinstance(operation, AddConstraintOperation)
+        ) and previous.constraint == operation.constraint:
+            return []
+
+        return None
+
+    @staticmethod
+    def column_name_after(operation: ColumnOperation) -> str:
+        """Name of the column of the operation once the operation is done"""
+        if isinstance(operation, RenameColumnOperation):
+            return operation.new_name
+        return operation.column.name
+
+    @staticmethod
+    def applied_to_column(
+        column: BaseColumn[Any], operation: ColumnOperation
+    ) -> BaseColumn[Any] | None:
+        """
+        The column after the given operation on it, or None when the operation
+        does not change the column alone.
+        """
+        if isinstance(operation, RenameColumnOperation):
+            return replace(
+                column,
+                name=operation.new_name,
+                column_constraints=[
+                    replace(c, column_name=operation.new_name)
+                    for c in column.column_constraints
+                ],
+            )
+        if isinstance(operation, ChangeDataTypeOperation):
+            return replace(column, data_type=operation.new_dtype)
+        if isinstance(operation, AddConstraintOperation) and isinstance(
+            operation.constraint, ColumnWideConstraint
+        ):
+            return replace(
+                column,
+                column_constraints=column.column_constraints + [operation.constraint],
+            )
+        if isinstance(operation, DeleteConstraintOperation) and isinstance(
+            operation.constraint, ColumnWideConstraint
+        ):
+            return replace(
+                column,
+                column_constraints=[
+                    c for c in column.column_constraints if c != operation.constraint
+                ],
+            )
+        return None
+
+    @staticmethod
+    def applied_to_table(
+        table: BaseTable[Any], operation: Operation
+    ) -> BaseTable[Any] | None:
+        """
+        The definition of a table after the given operation on it, or None when
+        the operation cannot be merged into the definition.
+        """
+        if isinstance(operation, RenameTableOperation):
+            return StateManager.renamed_table(table, operation.new_name)
+        if isinstance(operation, RenameColumnOperation):
+            return StateManager.renamed_table(
+                table, table.name, {operation.column.name: operation.new_name}
+            )
+        if isinstance(operation, AddColumnOperation):
+            table_constraints: set[TableWideConstraint] = set(table.table_constraints)
+            if operation.related_foreign_key is not None:
+                table_constraints.add(operation.related_foreign_key)
+            if operation.related_check_constraint is not None:
+                table_constraints.add(operation.related_check_constraint)
+            return replace(
+                table,
+                columns=table.columns + [operation.column],
+                table_constraints=table_constraints,
+            )
+        if isinstance(operation, DeleteColumnOperation):
+            return replace(
+                table,
+                columns=[c for c in table.columns if c.name != operation.column.name],
+                table_constraints={
+                    c
+                    for c in table.table_constraints
+                    if not isinstance(c, ForeignKeyConstraint)
+                    or operation.column.name not in c.column_mapping
+                },
+            )
+        if isinstance(operation, (AddConstraintOperation, DeleteConstraintOperation)):
+            if isinstance(operation.constraint, TableWideConstraint):
+                table_constraints = set(table.table_constraints)
+                if isinstance(operation, AddConstraintOperation):
+                    table_constraints.add(operation.constraint)
+                else:
+                    table_constraints.discard(operation.constraint)
+                return replace(table, table_constraints=table_constraints)
+        if isinstance(operation, ColumnOperation):
+            columns = [
+                (
+                    OperationOptimizer.applied_to_column(c, operation)
+                    if c.name == operation.column.name
+                    else c
+                )
+                for c in table.columns
+            ]
+            if None in columns:
+                return None
+            return replace(table, columns=columns)
+        return None
@@ -0,0 +1,177 @@
+from __future__ import annotations
+from collections import defaultdict
+
+from skibidi_orm.migration_engine.adapters.database_objects.constraints import (
+    ForeignKeyConstraint,
+)
+from skibidi_orm.migration_engine.operations.column_operations import (
+    AddColumnOperation,
+    AddConstraintOperation,
+    ColumnOperation,
+    DeleteColumnOperation,
+    DeleteConstraintOperation,
+)
+from skibidi_orm.migration_engine.operations.table_operations import (
+    CreateTableOperation,
+    DeleteTableOperation,
+    RenameTableOperation,
+    TableOperation,
+)
+
+type Operation = TableOperation | ColumnOperation
+
+
+class OperationPlanner:
+    """
+    Orders migration operations so that every table exists (is created or renamed)
+    before a foreign key referencing it is created, and every foreign key referencing
+    a table is gone before that table is deleted. Operations on the same table keep their order.
+    Operations are grouped into waves: the operations of a wave depend only on the
+    operations of the previous waves, so they can be batched or run in parallel.
+    """
+
+    @staticmethod
+    def plan(operations: list[Operation]) -> list[Operation]:
+        """Return the operations in an order satisfying their dependencies"""
+        return [
+            operation
+            for wave in OperationPlanner.plan_waves(operations)
+            for operation in wave
+        ]
+
+    @staticmethod
+    def plan_waves(operations: list[Operation]) -> list[list[Operation]]:
+        """
+        Return the operations grouped into waves, in the order they have to be run in.
+        Within a wave the operations keep their original order. Operations on tables
+        referencing each other in a cycle cannot be ordered; they are put in waves
+        of their own, in their original order.
+        """
+        dependencies = OperationPlanner.dependencies(operations)
+        dependents: dict[int, list[int]] = defaultdict(list)
+        remaining = {i: len(dependencies[i]) for i in range(len(operations))}
+        for i, required in dependencies.items():
+            for j in required:
+                dependents[j].append(i)
+
+        waves: list[list[Operation]] = []
+        ready = sorted(i for i, count in remaining.items() if count == 0)
+        while remaining:
+            if not ready:
+                # everything left is blocked by a cycle, which is broken at its first operation
+                ready = [
+                    next(
+                        i
+                        for i in sorted(remaining)
+                        if OperationPlanner._is_on_cycle(i, dependencies, remaining)
+                    )
+                ]
+            waves.append([operations[i] for i in ready])
+            next_ready: list[int] = []
+            for i in ready:
+                del remaining[i]
+                for j in dependents[i]:
+                    if j in remaining:
+                        remaining[j] -= 1
+                        if remaining[j] == 0:
+                            next_ready.append(j)
+            ready = sorted(next_ready)
+        return waves
+
+    @staticmethod
+    def dependencies(operations: list[Operation]) -> dict[int, set[int]]:
+        """Map the index of each operation to the indices of the operations it depends on"""
+        dependencies: dict[int, set[int]] = {i: set() for i in range(len(operations))}
+        creators: dict[str, int] = {}
+        referrers: dict[str, list[int]] = defaultdict(list)
+        for i, operation in enumerate(operations):
+            if isinstance(operation, CreateTableOperation):
+                creators[operation.table.name] = i
+            elif isinstance(operation, RenameTableOperation):
+                creators[operation.new_name] = i
+            for table_name in OperationPlanner.dereferenced_tables(operation):
+                referrers[table_name].append(i)
+
+        last_on_table: dict[str, int] = {}
+        for i, operation in enumerate(operations):
+            for table_name in OperationPlanner.referenced_tables(operation):
+                if table_name in creators:
+                    dependencies[i].add(creators[table_name])
+
+            for table_name in OperationPlanner.touched_tables(operation):
+                if table_name in last_on_table:
+                    dependencies[i].add(last_on_table[table_name])
+                last_on_table[table_name] = i
+
+            if isinstance(operation, DeleteTableOperation):
+                dependencies[i].update(referrers[operation.table.name])
+
+        for i in dependencies:
+            dependencies[i].discard(i)
+        return dependencies
+
+    @staticmethod
+    def _is_on_cycle(
+        start: int, dependencies: dict[int, set[int]], remaining: dict[int, int]
+    ) -> bool:
+        """Check whether the operation transitively depends on itself"""
+        stack = [j for j in dependencies[start] if j in remaining]
+        seen: set[int] = set()
+        while stack:
+            i = stack.pop()
+            if i == start:
+                return True
+            if i not in seen:
+                seen.add(i)
+                stack.extend(j for j in dependencies[i] if j in remaining)
+        return False
+
+    @staticmethod
+    def touched_tables(operation: Operation) -> list[str]:
+        """Names of the tables the operation changes"""
+        if isinstance(operation, RenameTableOperation):
+            return [operation.table.name, operation.new_name]
+        return [operation.table.name]
+
+    @staticmethod
+    def referenced_tables(operation: Operation) -> set[str]:
+        """Names of other tables the foreign keys created by the operation reference"""
+        foreign_keys: list[ForeignKeyConstraint] = []
+        if isinstance(operation, CreateTableOperation):
+            foreign_keys = [
+                c
+                for c in operation.table.table_constraints
+                if isinstance(c, ForeignKeyConstraint)
+            ]
+        elif isinstance(operation, AddColumnOperation):
+            if operation.related_foreign_key is not None:
+                foreign_keys = [operation.related_foreign_key]
+        elif isinstance(operation, AddConstraintOperation):
+            if isinstance(operation.constraint, ForeignKeyConstraint):
+                foreign_keys = [operation.constraint]
+        return {
+            fk.referenced_table
+            for fk in foreign_keys
+            if fk.referenced_table != operation.table.name
+        }
+
+    @staticmethod
+    def dereferenced_tables(operation: Operation) -> set[str]:
+        """Names of other tables the foreign keys removed by the operation reference"""
+        foreign_keys: list[ForeignKeyConstraint] = []
+        if isinstance(operation, DeleteTableOperation):
+            foreign_keys = [
+                c
+                for c in operation.table.table_constraints
+                if isinstance(c, ForeignKeyConstraint)
+            ]
+        elif isinstance(operation, DeleteColumnOperation):
+            foreign_keys = operation.get_related_foreign_keys()
+        elif isinstance(operation, DeleteConstraintOperation):
+            if isinstance(operation.constraint, ForeignKeyConstraint):
+                foreign_keys = [operation.constraint]
+        return {
+            fk.referenced_table
+            for fk in foreign_keys
+            if fk.referenced_table != operation.table.name
+        }
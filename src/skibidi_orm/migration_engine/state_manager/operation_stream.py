@@ -0,0 +1,105 @@
+from __future__ import annotations
+from typing import Any, Iterable, Iterator
+
+from skibidi_orm.migration_engine.adapters.base_adapter import BaseColumn, BaseTable
+from skibidi_orm.migration_engine.operations.column_operations import ColumnOperation
+from skibidi_orm.migration_engine.operations.table_operations import TableOperation
+from skibidi_orm.migration_engine.state_manager.operation_optimizer import (
+    OperationOptimizer,
+)
+from skibidi_orm.migration_engine.state_manager.operation_planner import (
+    OperationPlanner,
+)
+from skibidi_orm.migration_engine.state_manager.rename_detector import RenameDetector
+from skibidi_orm.migration_engine.state_manager.state_manager import StateManager
+
+type Operation = TableOperation | ColumnOperation
+
+
+class OperationStream:
+    """
+    Computes the same operations as StateManager, but table by table while the database
+    tables are still being inspected, so the first operations can be printed or executed
+    long before the whole schema is diffed.
+
+    A database table having a schema table with the same name is diffed as soon as it
+    is inspected. Its operations are held back while they create foreign keys referencing
+    tables that are not known to exist yet. Table creations, deletions and renames need
+    every inspected table (the rename detector pairs dropped tables with new ones), so they
+    come last, along with the held back operations.
+    """
+
+    @staticmethod
+    def batches[TTable: BaseTable[BaseColumn[Any]]](
+        db_tables: Iterable[TTable],
+        schema_tables: list[TTable],
+        rename_detector: RenameDetector | None = None,
+    ) -> Iterator[list[Operation]]:
+        """
+        Yield the operations transforming the database schema into the class hierarchy
+        schema in batches, each one ready to be run once the previous ones are done.
+        All operations on an existing table come in a single batch.
+        """
+        schema_tables_by_name = {t.name: t for t in schema_tables}
+        dropped_tables: list[TTable] = []
+        # names of the database tables which are kept under the same name
+        kept_tables: set[str] = set()
+        # operations waiting for the tables their foreign keys reference
+        held_back: list[tuple[set[str], list[Operation]]] = []
+
+        for db_table in db_tables:
+            s_table = schema_tables_by_name.get(db_table.name)
+            if s_table is None:
+                dropped_tables.append(db_table)
+                continue
+            kept_tables.add(db_table.name)
+
+            operations = OperationOptimizer.optimize(
+                StateManager[TTable](
+                    [db_table], [s_table], rename_detector
+                ).get_operations_transforming_database_schema_into_class_hierarchy_schema()
+            )
+            if operations:
+                held_back.append(
+                    (OperationStream.referenced_tables(operations), operations)
+                )
+
+            still_held_back: list[tuple[set[str], list[Operation]]] = []
+            for referenced_tables, batch in held_back:
+                if referenced_tables <= kept_tables:
+                    yield batch
+                else:
+                    still_held_back.append((referenced_tables, batch))
+            held_back = still_held_back
+
+        remaining = StateManager[TTable](
+            dropped_tables,
+            [t for t in schema_tables if t.name not in kept_tables],
+            rename_detector,
+        ).get_operations_transforming_database_schema_into_class_hierarchy_schema()
+        last_batch = OperationPlanner.plan(
+            OperationOptimizer.optimize(
+                [operation for _, batch in held_back for operation in batch] + remaining
+            )
+        )
+        if last_batch:
+            yield last_batch
+
+    @staticmethod
+    def operations[TTable: BaseTable[BaseColumn[Any]]](
+        db_tables: Iterable[TTable],
+        schema_tables: list[TTable],
+        rename_detector: RenameDetector | None = None,
+    ) -> Iterator[Operation]:
+        """Yield the operations of all batches one by one"""
+        for batch in OperationStream.batches(db_tables, schema_tables, rename_detector):
+            yield from batch
+
+    @staticmethod
+    def referenced_tables(operations: list[Operation]) -> set[str]:
+        """Names of other tables the foreign keys created by the operations reference"""
+        return {
+            table_name
+            for operation in operations
+            for table_name in OperationPlanner.referenced_tables(operation)
+        }
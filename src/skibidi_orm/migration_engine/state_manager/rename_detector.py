@@ -0,0 +1,156 @@
+from __future__ import annotations
+from collections import defaultdict
+from dataclasses import dataclass
+from typing import Any, Callable
+
+from skibidi_orm.migration_engine.adapters.base_adapter import BaseColumn, BaseTable
+from skibidi_orm.migration_engine.adapters.database_objects.constraints import (
+    CheckConstraint,
+    ForeignKeyConstraint,
+)
+
+
+@dataclass(frozen=True)
+class RenameDetector:
+    """
+    Pairs dropped tables (columns) with new ones that are most likely their renamed
+    versions. Candidates are scored by the Jaccard similarity of their tokens (names,
+    data types and constraints), found through an inverted token index so only
+    candidates sharing at least one token are scored. Pairs are chosen greedily by
+    score, each object being renamed at most once.
+
+    A wrong rename keeps the data of an unrelated object, so by default only tables
+    with the same columns are renamed. Set detect_similar to rename tables and columns
+    scoring at least the thresholds, columns also needing names at least as similar
+    as column_name_threshold.
+    """
+
+    table_threshold: float = 0.6
+    column_threshold: float = 0.5
+    column_name_threshold: float = 0.3
+    detect_similar: bool = False
+
+    def match_tables[TTable: BaseTable[Any]](
+        self, dropped: list[TTable], added: list[TTable]
+    ) -> dict[str, TTable]:
+        """Map names of dropped tables to the added tables they were renamed to"""
+        return RenameDetector._match(
+            {table.name: RenameDetector.table_tokens(table) for table in dropped},
+            {table.name: RenameDetector.table_tokens(table) for table in added},
+            {table.name: table for table in added},
+            self.table_threshold if self.detect_similar else 1.0,
+        )
+
+    def match_columns[TColumn: BaseColumn[Any]](
+        self, dropped: list[TColumn], added: list[TColumn]
+    ) -> dict[str, TColumn]:
+        """Map names of dropped columns to the added columns they were renamed to"""
+        if not self.detect_similar:
+            return {}
+        return RenameDetector._match(
+            {column.name: RenameDetector.column_tokens(column) for column in dropped},
+            {column.name: RenameDetector.column_tokens(column) for column in added},
+            {column.name: column for column in added},
+            self.column_threshold,
+            lambda dropped_name, added_name: RenameDetector.similarity(
+                RenameDetector.name_trigrams(dropped_name),
+                RenameDetector.name_trigrams(added_name),
+            )
+            >= self.column_name_threshold,
+        )
+
+    @staticmethod
+    def table_tokens(table: BaseTable[Any]) -> frozenset[str]:
+        """
+        Tokens describing the columns and table-wide constraints of a table. Besides
+        their names, the columns are described by their data types and constraints alone,
+        so a table keeps most of its score when some of its columns are renamed with it.
+        """
+        tokens: set[str] = set()
+        shapes: dict[str, int] = defaultdict(int)
+        for column in table.columns:
+            tokens.add(f"column:{column.name}")
+            shape = ":".join(
+                [column.data_type]
+                + sorted(c.constraint_type.value for c in column.column_constraints)
+            )
+            # numbered, so tables with more columns of the same shape differ
+            tokens.add(f"shape:{shape}:{shapes[shape]}")
+            shapes[shape] += 1
+        for constraint in table.table_constraints:
+            if isinstance(constraint, ForeignKeyConstraint):
+                tokens.add(
+                    f"fk:{constraint.referenced_table}:{sorted(constraint.column_mapping.items())}"
+                )
+            elif isinstance(constraint, CheckConstraint):
+                tokens.add(f"check:{constraint.condition}")
+        return frozenset(tokens)
+
+    @staticmethod
+    def column_tokens(column: BaseColumn[Any]) -> frozenset[str]:
+        """Tokens describing a column - trigrams of its name, its type and constraints"""
+        tokens = {
+            f"name:{trigram}" for trigram in RenameDetector.name_trigrams(column.name)
+        }
+        tokens.add(f"type:{column.data_type}")
+        tokens.update(
+            f"constraint:{constraint.constraint_type.value}"
+            for constraint in column.column_constraints
+        )
+        return frozenset(tokens)
+
+    @staticmethod
+    def name_trigrams(name: str) -> frozenset[str]:
+        """Trigrams of a name, marked at its start and end"""
+        name = f"^{name.lower()}$"
+        return frozenset(name[i : i + 3] for i in range(len(name) - 2))
+
+    @staticmethod
+    def similarity(first: frozenset[str], second: frozenset[str]) -> float:
+        """Jaccard similarity of two sets of tokens"""
+        if not first and not second:
+            return 1.0
+        return len(first & second) / len(first | second)
+
+    @staticmethod
+    def _match[T](
+        dropped_tokens: dict[str, frozenset[str]],
+        added_tokens: dict[str, frozenset[str]],
+        added_objects: dict[str, T],
+        threshold: float,
+        accept: Callable[[str, str], bool] = lambda dropped_name, added_name: True,
+    ) -> dict[str, T]:
+        """
+        Greedily pair the dropped and added objects with the highest similarity,
+        only considering the pairs of names accepted by the given function
+        """
+        if not dropped_tokens or not added_tokens:
+            return {}
+
+        index: dict[str, list[str]] = defaultdict(list)
+        for name, tokens in added_tokens.items():
+            for token in tokens:
+                index[token].append(name)
+
+        candidates: list[tuple[float, str, str]] = []
+        for dropped_name, tokens in dropped_tokens.items():
+            shared_tokens: dict[str, int] = defaultdict(int)
+            for token in tokens:
+                for added_name in index.get(token, ()):
+                    shared_tokens[added_name] += 1
+            for added_name, shared in shared_tokens.items():
+                score = shared / (len(tokens) + len(added_tokens[added_name]) - shared)
+                if score >= threshold and accept(dropped_name, added_name):
+                    candidates.append((score, dropped_name, added_name))
+
+        # best scores first, ties broken by names to keep the result deterministic
+        candidates.sort(
+            key=lambda candidate: (-candidate[0], candidate[1], candidate[2])
+        )
+        matched: dict[str, T] = {}
+        matched_added: set[str] = set()
+        for _, dropped_name, added_name in candidates:
+            if dropped_name not in matched and added_name not in matched_added:
+                matched[dropped_name] = added_objects[added_name]
+                matched_added.add(added_name)
+        return matched
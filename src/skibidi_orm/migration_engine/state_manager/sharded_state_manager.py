@@ -0,0 +1,129 @@
+from __future__ import annotations
+from concurrent.futures import ProcessPoolExecutor
+from typing import Any
+import zlib
+
+from skibidi_orm.migration_engine.adapters.base_adapter import BaseColumn, BaseTable
+from skibidi_orm.migration_engine.operations.column_operations import ColumnOperation
+from skibidi_orm.migration_engine.operations.table_operations import TableOperation
+from skibidi_orm.migration_engine.state_manager.i_state_manager import IStateManager
+from skibidi_orm.migration_engine.state_manager.rename_detector import RenameDetector
+from skibidi_orm.migration_engine.state_manager.state_manager import StateManager
+
+type Operation = TableOperation | ColumnOperation
+# index of the database table, the database table and its schema table
+type ShardEntry = tuple[int, BaseTable[Any], BaseTable[Any]]
+
+
+class ShardedStateManager[TTable: BaseTable[BaseColumn[Any]]](IStateManager):
+    """
+    StateManager spreading the comparison of tables over worker processes.
+
+    The tables present both in the database and in the schema are partitioned into
+    shards by a hash of their names. Tables which did not change are recognized in the
+    main process and never leave it, so only the changed tables are pickled and diffed
+    by a StateManager in a worker. The operations of the shards are merged in the order
+    of the database tables, so the result does not depend on the number of workers or
+    shards. Table creations, deletions and renames need all of the remaining tables
+    (rename detection) and are computed in the main process.
+    """
+
+    def __init__(
+        self,
+        db_tables: list[TTable],
+        schema_tables: list[TTable],
+        rename_detector: RenameDetector | None = None,
+        workers: int = 1,
+        shards: int | None = None,
+    ) -> None:
+        self.db_tables = db_tables
+        self.schema_tables = schema_tables
+        self.rename_detector = rename_detector or RenameDetector()
+        self.workers = max(1, workers)
+        self.shards = max(1, shards or self.workers)
+
+        self.operations: list[TableOperation | ColumnOperation] = []
+
+        self._analyze_schemas()
+
+    @staticmethod
+    def shard_of(table_name: str, shards: int) -> int:
+        """Shard of the table with the given name, the same in every process"""
+        return zlib.crc32(table_name.encode()) % shards
+
+    def _analyze_schemas(self) -> None:
+        """
+        Diff the tables kept by the migration in shards, the rest in the main process.
+        """
+        schema_tables_by_name = {t.name: t for t in self.schema_tables}
+        shards: list[list[ShardEntry]] = [[] for _ in range(self.shards)]
+        dropped_tables: list[TTable] = []
+        kept_tables: set[str] = set()
+
+        for i, db_table in enumerate(self.db_tables):
+            s_table = schema_tables_by_name.get(db_table.name)
+            if s_table is None:
+                dropped_tables.append(db_table)
+                continue
+            kept_tables.add(db_table.name)
+
+            if db_table != s_table:
+                shards[ShardedStateManager.shard_of(db_table.name, self.shards)].append(
+                    (i, db_table, s_table)
+                )
+
+        self.operations = StateManager[TTable](
+            dropped_tables,
+            [t for t in self.schema_tables if t.name not in kept_tables],
+            self.rename_detector,
+        ).get_operations_transforming_database_schema_into_class_hierarchy_schema()
+
+        shards = [shard for shard in shards if shard]
+        if self.workers == 1 or len(shards) <= 1:
+            diffed_shards = [
+                ShardedStateManager.diff_shard(shard, self.rename_detector)
+                for shard in shards
+            ]
+        else:
+            with ProcessPoolExecutor(
+                max_workers=min(self.workers, len(shards))
+            ) as executor:
+                diffed_shards = list(
+                    executor.map(
+                        ShardedStateManager.diff_shard,
+                        shards,
+                        [self.rename_detector] * len(shards),
+                    )
+                )
+
+        for _, operations in sorted(
+            (entry for shard in diffed_shards for entry in shard),
+            key=lambda entry: entry[0],
+        ):
+            self.operations.extend(operations)
+
+    @staticmethod
+    def diff_shard(
+        shard: list[ShardEntry], rename_detector: RenameDetector
+    ) -> list[tuple[int, list[Operation]]]:
+        """
+        Diff the tables of a shard, returns the operations of each of the tables
+        along with the index of its database table.
+        """
+        return [
+            (
+                i,
+                StateManager[BaseTable[BaseColumn[Any]]](
+                    [db_table], [s_table], rename_detector
+                ).get_operations_transforming_database_schema_into_class_hierarchy_schema(),
+            )
+            for i, db_table, s_table in shard
+        ]
+
+    def get_operations_transforming_database_schema_into_class_hierarchy_schema(
+        self,
+    ) -> list[TableOperation | ColumnOperation]:
+        """
+        Return operations required for transforming the database calculated by the schema analysis.
+        """
+        return self.operations
@@ -2,11 +2,16 @@ from skibidi_orm.migration_engine.adapters.base_adapter import (
     BaseTable,
     BaseColumn,
 )
+from dataclasses import replace
 from typing import Any
 from skibidi_orm.migration_engine.operations.column_operations import (
     ColumnOperation,
     AddColumnOperation,
     DeleteColumnOperation,
+    RenameColumnOperation,
+    ChangeDataTypeOperation,
+    AddConstraintOperation,
+    DeleteConstraintOperation,
 )
 
 from skibidi_orm.migration_engine.operations.table_operations import (
@@ -16,7 +21,14 @@ from skibidi_orm.migration_engine.operations.table_operations import (
     RenameTableOperation,
 )
 
+from skibidi_orm.migration_engine.adapters.database_objects.constraints import (
+    ForeignKeyConstraint,
+)
+from skibidi_orm.migration_engine.adapters.database_objects.frozen_schema import (
+    FrozenTable,
+)
 from skibidi_orm.migration_engine.state_manager.i_state_manager import IStateManager
+from skibidi_orm.migration_engine.state_manager.rename_detector import RenameDetector
 
 
 class StateManager[TTable: BaseTable[BaseColumn[Any]]](IStateManager):
@@ -32,22 +44,41 @@ class StateManager[TTable: BaseTable[BaseColumn[Any]]](IStateManager):
         self,
         db_tables: list[TTable],
         schema_tables: list[TTable],
+        rename_detector: RenameDetector | None = None,
     ) -> None:
         self.db_tables = db_tables
         self.schema_tables = schema_tables
+        self.rename_detector = rename_detector or RenameDetector()
+
+        self.db_tables_by_name = {t.name: t for t in self.db_tables}
+        self.schema_tables_by_name = {t.name: t for t in self.schema_tables}
 
-        self.serviced_tables: list[TTable] = []
+        # structural keys of the tables already handled by a table operation
+        self.serviced_tables: set[FrozenTable] = set()
+
+        # database tables as they are after the renames and column alterations,
+        # mapped to the names of the schema tables they correspond to
+        self.altered_db_tables: dict[str, TTable] = {}
 
         self.operations: list[TableOperation | ColumnOperation] = []
 
         self._analyze_schemas()
 
+    @staticmethod
+    def table_key(table: BaseTable[Any]) -> FrozenTable:
+        """
+        Hashable key of a table, equal for two tables exactly when the tables are equal.
+        """
+        return FrozenTable.from_table(table)
+
     def _analyze_schemas(self):
         """
         Call helper functions to retrieve all operations needed for database transformation.
         """
         self._get_delete_tables_operations()
         self._get_create_tables_operations()
+        self._get_rename_columns_operations()
+        self._get_alter_columns_operations()
         self._get_delete_columns_operations()
         self._get_create_columns_operations()
 
@@ -64,85 +95,241 @@ class StateManager[TTable: BaseTable[BaseColumn[Any]]](IStateManager):
         Get operations concerning the creation of new tables.
         """
 
-        t_db_names = set([t.name for t in self.db_tables])
-
         for s_table in self.schema_tables:
-            if s_table.name not in t_db_names:
-                if s_table not in self.serviced_tables:
+            if s_table.name not in self.db_tables_by_name:
+                s_table_key = StateManager.table_key(s_table)
+                if s_table_key not in self.serviced_tables:
                     self.operations.append(CreateTableOperation(s_table))
-                    self.serviced_tables.append(s_table)
+                    self.serviced_tables.add(s_table_key)
 
     def _get_delete_tables_operations(self) -> None:
         """
         Get operations concerning the deletion of tables.
+        A deleted table is renamed instead when the rename detector pairs it with a new table.
         """
 
-        class TableFound(Exception):
-            pass
-
-        t_schema_names = set([t.name for t in self.schema_tables])
-        for db_table in self.db_tables:
-            try:
-                if db_table.name not in t_schema_names:
-                    for s_table in self.schema_tables:
-                        s_column_names = set([c.name for c in s_table.columns])
-                        db_column_names = set([c.name for c in db_table.columns])
-
-                        if s_column_names == db_column_names:
-                            self.operations.append(
-                                RenameTableOperation(db_table, s_table.name)
-                            )
-                            self.serviced_tables.append(s_table)
-                            raise TableFound
-                    if db_table not in self.serviced_tables:
-                        self.operations.append(DeleteTableOperation(db_table))
-                        self.serviced_tables.append(db_table)
-            except TableFound:
-                pass
+        dropped_tables = [
+            t for t in self.db_tables if t.name not in self.schema_tables_by_name
+        ]
+        renamed_tables = self.rename_detector.match_tables(
+            dropped_tables,
+            [t for t in self.schema_tables if t.name not in self.db_tables_by_name],
+        )
 
-    def _get_create_columns_operations(self):
+        for db_table in dropped_tables:
+            s_table = renamed_tables.get(db_table.name)
+            if s_table is not None:
+                self.operations.append(RenameTableOperation(db_table, s_table.name))
+                self.serviced_tables.add(StateManager.table_key(s_table))
+                self.altered_db_tables[s_table.name] = StateManager.renamed_table(
+                    db_table, s_table.name
+                )
+                continue
+
+            db_table_key = StateManager.table_key(db_table)
+            if db_table_key not in self.serviced_tables:
+                self.operations.append(DeleteTableOperation(db_table))
+                self.serviced_tables.add(db_table_key)
+
+    def _get_rename_columns_operations(self) -> None:
         """
-        Get operations concerning the creation of new columns.
+        Get operations concerning the renaming of columns, in the tables existing both
+        in the database and in the schema.
+        """
+
+        for s_table_name, s_table in self.schema_tables_by_name.items():
+            db_table = self._get_db_table(s_table_name)
+            if db_table is None or db_table.columns == s_table.columns:
+                continue
+
+            db_columns_names = {c.name for c in db_table.columns}
+            s_columns_names = {c.name for c in s_table.columns}
+            renamed_columns = self.rename_detector.match_columns(
+                [c for c in db_table.columns if c.name not in s_columns_names],
+                [c for c in s_table.columns if c.name not in db_columns_names],
+            )
+            if not renamed_columns:
+                continue
+
+            for db_column in db_table.columns:
+                if db_column.name in renamed_columns:
+                    self.operations.append(
+                        RenameColumnOperation(
+                            db_table,
+                            db_column,
+                            renamed_columns[db_column.name].name,
+                        )
+                    )
+            self.altered_db_tables[s_table_name] = StateManager.renamed_table(
+                db_table,
+                db_table.name,
+                {old: column.name for old, column in renamed_columns.items()},
+            )
+
+    def _get_alter_columns_operations(self) -> None:
+        """
+        Get operations concerning the changes of data types and constraints of the columns
+        existing both in the database and in the schema. Each operation is given the table
+        as it is after the previous ones, so that they can be applied one after another.
+        """
+
+        for s_table_name, s_table in self.schema_tables_by_name.items():
+            db_table = self._get_db_table(s_table_name)
+            if db_table is None or db_table.columns == s_table.columns:
+                continue
+
+            s_columns_by_name = {c.name: c for c in s_table.columns}
+            altered_table = db_table
+            for db_column in db_table.columns:
+                s_column = s_columns_by_name.get(db_column.name)
+                if s_column is None or s_column == db_column:
+                    continue
+
+                altered_table = self._alter_column(altered_table, db_column, s_column)
+            self.altered_db_tables[s_table_name] = altered_table
+
+    def _alter_column(self, table: TTable, column: Any, new_column: Any) -> TTable:
+        """
+        Add operations turning the column of the table into the new column with the same name,
+        and return the table after them.
         """
 
-        db_table_dict = {t.name: t for t in self.db_tables}
-        schema_table_dict = {t.name: t for t in self.schema_tables}
+        def with_column(column: Any) -> TTable:
+            return replace(
+                table,
+                columns=[column if c.name == column.name else c for c in table.columns],
+            )
+
+        old_constraints = set(column.column_constraints)
+        new_constraints = set(new_column.column_constraints)
+        for constraint in sorted(old_constraints - new_constraints):
+            self.operations.append(DeleteConstraintOperation(table, column, constraint))
+            column = replace(
+                column,
+                column_constraints=[
+                    c for c in column.column_constraints if c != constraint
+                ],
+            )
+            table = with_column(column)
+
+        if column.data_type != new_column.data_type:
+            self.operations.append(
+                ChangeDataTypeOperation(table, column, new_column.data_type)
+            )
+            column = replace(column, data_type=new_column.data_type)
+            table = with_column(column)
+
+        for constraint in sorted(new_constraints - old_constraints):
+            self.operations.append(AddConstraintOperation(table, column, constraint))
+            column = replace(
+                column, column_constraints=column.column_constraints + [constraint]
+            )
+            table = with_column(column)
 
-        for s_table_name, s_table in schema_table_dict.items():
-            if s_table not in self.serviced_tables:
-                if s_table_name in db_table_dict.keys():
+        return with_column(new_column)
+
+    def _get_create_columns_operations(self):
+        """
+        Get operations concerning the creation of new columns.
+        """
 
-                    table_db_columns = db_table_dict[s_table_name].columns
-                    table_schema_columns = s_table.columns
+        for s_table_name, s_table in self.schema_tables_by_name.items():
+            db_table = self._get_db_table(s_table_name)
+            if db_table is None or db_table.columns == s_table.columns:
+                continue
 
-                    for s_column in table_schema_columns:
-                        if s_column not in table_db_columns:
-                            self.operations.append(
-                                AddColumnOperation(
-                                    db_table_dict[s_table_name], s_column
-                                )
-                            )
+            table_db_columns = set(db_table.columns)
+            for s_column in s_table.columns:
+                if s_column not in table_db_columns:
+                    self.operations.append(AddColumnOperation(db_table, s_column))
 
     def _get_delete_columns_operations(self):
         """
         Get operations concerning the deletion of columns.
         """
 
-        db_table_dict = {t.name: t for t in self.db_tables}
-        schema_table_dict = {t.name: t for t in self.schema_tables}
+        for s_table_name, db_table in self._get_db_tables_with_schema_names():
+            s_table = self.schema_tables_by_name[s_table_name]
+            if db_table.columns == s_table.columns:
+                continue
 
-        for db_table_name, db_table in db_table_dict.items():
-            if db_table not in self.serviced_tables:
-                if db_table_name in schema_table_dict.keys():
+            table_schema_columns = set(s_table.columns)
+            for db_column in db_table.columns:
+                if db_column not in table_schema_columns:
+                    self.operations.append(DeleteColumnOperation(db_table, db_column))
 
-                    table_db_columns = db_table.columns
-                    table_schema_columns = schema_table_dict[db_table_name].columns
+    @staticmethod
+    def renamed_table[T: BaseTable[Any]](
+        table: T, new_name: str, renamed_columns: dict[str, str] | None = None
+    ) -> T:
+        """
+        Copy of the table with the new name and the given columns renamed,
+        along with the constraints referring to them.
+        """
+
+        renamed_columns = renamed_columns or {}
+        columns = [
+            replace(
+                column,
+                name=renamed_columns.get(column.name, column.name),
+                column_constraints=[
+                    replace(
+                        constraint,
+                        table_name=new_name,
+                        column_name=renamed_columns.get(column.name, column.name),
+                    )
+                    for constraint in column.column_constraints
+                ],
+            )
+            for column in table.columns
+        ]
+        table_constraints = {
+            (
+                replace(
+                    constraint,
+                    table_name=new_name,
+                    column_mapping={
+                        renamed_columns.get(column, column): referenced_column
+                        for column, referenced_column in constraint.column_mapping.items()
+                    },
+                )
+                if isinstance(constraint, ForeignKeyConstraint)
+                else replace(constraint, table_name=new_name)
+            )
+            for constraint in table.table_constraints
+        }
+        return replace(
+            table, name=new_name, columns=columns, table_constraints=table_constraints
+        )
+
+    def _get_db_table(self, s_table_name: str) -> TTable | None:
+        """
+        Get the database table corresponding to the schema table with the given name,
+        as it is after the renames.
+        """
+
+        return self.altered_db_tables.get(
+            s_table_name, self.db_tables_by_name.get(s_table_name)
+        )
+
+    def _get_db_tables_with_schema_names(self) -> list[tuple[str, TTable]]:
+        """
+        Get the database tables (after the renames) having a corresponding schema table
+        along with the name of that table, in the order of the database tables.
+        """
 
-                    for db_column in table_db_columns:
-                        if db_column not in table_schema_columns:
-                            self.operations.append(
-                                DeleteColumnOperation(db_table, db_column)
-                            )
+        renamed_from = {
+            operation.table.name: operation.new_name
+            for operation in self.operations
+            if isinstance(operation, RenameTableOperation)
+        }
+        tables: list[tuple[str, TTable]] = []
+        for db_table_name in self.db_tables_by_name:
+            s_table_name = renamed_from.get(db_table_name, db_table_name)
+            db_table = self._get_db_table(s_table_name)
+            if s_table_name in self.schema_tables_by_name and db_table is not None:
+                tables.append((s_table_name, db_table))
+        return tables
 
     # def get_relations_operations(self):
     #     # TODO: implement using foreign keys
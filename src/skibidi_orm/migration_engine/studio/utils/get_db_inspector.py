@@ -1,10 +1,20 @@
 from skibidi_orm.migration_engine.db_config.base_config import BaseDbConfig
 from skibidi_orm.migration_engine.db_config.postgres_config import PostgresConfig
 from skibidi_orm.migration_engine.db_config.sqlite3_config import SQLite3Config
+from skibidi_orm.migration_engine.db_inspectors.async_postgres_inspector import (
+    AsyncPostgresInspector,
+)
+from skibidi_orm.migration_engine.db_inspectors.base_async_inspector import (
+    BaseAsyncDbInspector,
+    ExecutorBackedDbInspector,
+)
 from skibidi_orm.migration_engine.db_inspectors.base_inspector import BaseDbInspector
 from skibidi_orm.migration_engine.db_inspectors.postgres_inspector import (
     PostgresInspector,
 )
+from skibidi_orm.migration_engine.db_inspectors.sqlite.async_sqlite3_inspector import (
+    AsyncSQLite3Inspector,
+)
 from skibidi_orm.migration_engine.db_inspectors.sqlite.sqlite3_inspector import (
     SQLite3Inspector,
 )
@@ -17,3 +27,14 @@ def get_db_inspector(db_config: BaseDbConfig) -> BaseDbInspector:
         return PostgresInspector()
 
     raise NotImplementedError
+
+
+def get_async_db_inspector(db_config: BaseDbConfig) -> BaseAsyncDbInspector:
+    if isinstance(db_config, SQLite3Config):
+        return AsyncSQLite3Inspector()
+    elif isinstance(db_config, PostgresConfig):
+        if db_config.supports_async_connections:
+            return AsyncPostgresInspector()
+        return ExecutorBackedDbInspector(PostgresInspector())
+
+    raise NotImplementedError
@@ -1,3 +1,13 @@
+from skibidi_orm.migration_engine.data_mutator.async_postgres_data_mutator import (
+    AsyncPostgresDataMutator,
+)
+from skibidi_orm.migration_engine.data_mutator.async_sqlite3_data_mutator import (
+    AsyncSQLite3DataMutator,
+)
+from skibidi_orm.migration_engine.data_mutator.base_async_data_mutator import (
+    BaseAsyncDataMutator,
+    ExecutorBackedDataMutator,
+)
 from skibidi_orm.migration_engine.data_mutator.base_data_mutator import BaseDataMutator
 from skibidi_orm.migration_engine.data_mutator.postgres_data_mutator import (
     PostgresDataMutator,
@@ -17,3 +27,14 @@ def get_db_mutator(db_config: BaseDbConfig) -> BaseDataMutator:
         return PostgresDataMutator()
 
     raise NotImplementedError
+
+
+def get_async_db_mutator(db_config: BaseDbConfig) -> BaseAsyncDataMutator:
+    if isinstance(db_config, SQLite3Config):
+        return AsyncSQLite3DataMutator()
+    elif isinstance(db_config, PostgresConfig):
+        if db_config.supports_async_connections:
+            return AsyncPostgresDataMutator()
+        return ExecutorBackedDataMutator(PostgresDataMutator())
+
+    raise NotImplementedError
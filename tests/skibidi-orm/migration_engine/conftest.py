@@ -1,4 +1,5 @@
 from functools import wraps
+from pathlib import Path
 import sqlite3
 from typing import Any, Callable
 from colorama import Style
@@ -19,6 +20,14 @@ def reset_config_singleton(monkeypatch: pytest.MonkeyPatch):
     monkeypatch.setattr(BaseDbConfig, "_BaseDbConfig__instance", None)
 
 
+@pytest.fixture(autouse=True)
+def isolate_inspection_cache(monkeypatch: pytest.MonkeyPatch, tmp_path: Path):
+    """Keep the persisted inspection cache of every test in its temporary directory."""
+    monkeypatch.setenv(
+        "__SKIBIDI_INSPECTION_CACHE_DIR", str(tmp_path.joinpath("inspection_cache"))
+    )
+
+
 @pytest.hookimpl(hookwrapper=True)
 def pytest_runtest_makereport(item: Any) -> Any:
     """Print tests' docstring when running the test."""
@@ -1,16 +1,19 @@
-from pytest import raises
 import pytest
-from skibidi_orm.exceptions.operations import UnsupportedOperationError
 from skibidi_orm.migration_engine.adapters.postgres_typing import PostgresTyping
 from skibidi_orm.migration_engine.converters.postgres.columns import (
     PostgresColumnOperationConverter,
 )
 from skibidi_orm.migration_engine.operations.column_operations import (
     AddColumnOperation,
+    AddConstraintOperation,
     ChangeDataTypeOperation,
     DeleteColumnOperation,
+    DeleteConstraintOperation,
     RenameColumnOperation,
 )
+from skibidi_orm.migration_engine.sql_executor.sql_splitter import (
+    split_sql_statements,
+)
 from skibidi_orm.migration_engine.adapters.database_objects.constraints import (
     CheckConstraint,
     ForeignKeyConstraint,
@@ -148,30 +151,88 @@ def test_convert_column_operation_to_SQL(operation, expected):  # type: ignore
 
 
 @pytest.mark.parametrize(
-    "operation, expected_error",
+    "operation, expected",
     [
         (
                 ChangeDataTypeOperation(
                     empty_users_table, simple_column_no_constraints, "INTEGER"
                 ),
-                UnsupportedOperationError,
+                "ALTER TABLE users ALTER COLUMN name TYPE INTEGER USING name::INTEGER;",
         ),
         (
-                ChangeDataTypeOperation(
-                    empty_users_table, column_primary_key_unique, "TEXT"
+                AddConstraintOperation(
+                    empty_users_table,
+                    simple_column_no_constraints,
+                    NotNullConstraint("users", "name"),
+                ),
+                "ALTER TABLE users ALTER COLUMN name SET NOT NULL;",
+        ),
+        (
+                AddConstraintOperation(
+                    empty_users_table,
+                    simple_column_no_constraints,
+                    UniqueConstraint("users", "name"),
                 ),
-                UnsupportedOperationError,
+                "ALTER TABLE users ADD UNIQUE (name);",
         ),
         (
-                ChangeDataTypeOperation(empty_users_table, column_unique, "TEXT"),
-                UnsupportedOperationError,
+                AddConstraintOperation(
+                    empty_users_table,
+                    column_check_constraint,
+                    CheckConstraint("users", "age > 18"),
+                ),
+                "ALTER TABLE users ADD CHECK (age > 18);",
         ),
         (
-                ChangeDataTypeOperation(empty_users_table, column_check_constraint, "TEXT"),
-                UnsupportedOperationError,
+                DeleteConstraintOperation(
+                    empty_users_table,
+                    column_primary_key_unique,
+                    NotNullConstraint("users", "user_id"),
+                ),
+                "ALTER TABLE users ALTER COLUMN user_id DROP NOT NULL;",
         ),
     ],
 )
-def test_convert_column_operation_to_SQL_errors(operation, expected_error):  # type: ignore
-    with raises(expected_error):  # type: ignore
-        PostgresColumnOperationConverter.convert_column_operation_to_SQL(operation)  # type: ignore
+def test_convert_alter_column_operation_to_SQL(operation, expected):  # type: ignore
+    assert (
+            PostgresColumnOperationConverter.convert_column_operation_to_SQL(operation)  # type: ignore
+            == expected
+    )
+
+
+@pytest.mark.parametrize(
+    "constraint, expected_conditions",
+    [
+        (
+            UniqueConstraint("users", "user_id"),
+            ["con.contype = 'u'", "= ARRAY['user_id']::text[]"],
+        ),
+        (PrimaryKeyConstraint("users", "user_id"), ["con.contype = 'p'"]),
+        (
+            ForeignKeyConstraint("users", "teams", {"user_id": "id"}),
+            [
+                "con.contype = 'f'",
+                "= ARRAY['user_id']::text[]",
+                "con.confrelid = 'teams'::regclass",
+            ],
+        ),
+        (
+            CheckConstraint("users", "name != 'root'"),
+            ["con.contype = 'c'", "regexp_replace('CHECK (name != ''root'')'"],
+        ),
+    ],
+)
+def test_deleted_constraints_are_looked_up_by_what_they_constrain(
+    constraint, expected_conditions  # type: ignore
+):
+    operation = DeleteConstraintOperation(
+        empty_users_table, column_unique, constraint  # type: ignore
+    )
+    sql = PostgresColumnOperationConverter.convert_column_operation_to_SQL(operation)
+    assert "con.conrelid = 'users'::regclass" in sql
+    assert all(condition in sql for condition in expected_conditions)  # type: ignore
+    assert (
+        "EXECUTE 'ALTER TABLE users DROP CONSTRAINT ' || quote_ident(constraint_name);"
+        in sql
+    )
+    assert split_sql_statements(sql) == [sql.strip().rstrip(";")]
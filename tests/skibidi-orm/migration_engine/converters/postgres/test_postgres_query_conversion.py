@@ -0,0 +1,41 @@
+from skibidi_orm.migration_engine.converters.postgres.all import PostgresConverter
+from skibidi_orm.migration_engine.converters.postgres.queries import (
+    PostgresQueryConverter,
+)
+from skibidi_orm.migration_engine.revisions.constants import get_revision_table_name
+
+
+def test_revision_queries_according_to_get_revision_table_name():
+    table_name = get_revision_table_name()
+    assert (
+        PostgresQueryConverter.get_revision_data_query()
+        == f"SELECT id, rev FROM {table_name} ORDER BY id;"
+    )
+    assert (
+        PostgresConverter.get_revision_insertion_query()
+        == f"INSERT INTO {table_name} (rev) VALUES (%s);"
+    )
+    assert (
+        PostgresConverter.get_revision_table_creation_query()
+        == f"CREATE TABLE {table_name} (id SERIAL PRIMARY KEY, rev BYTEA NOT NULL);"
+    )
+
+
+def test_table_clearing_query_keeps_the_revision_table():
+    assert (
+        f"tablename != '{get_revision_table_name()}'"
+        in PostgresQueryConverter.get_table_clearing_query()
+    )
+
+
+def test_backfill_chunk_queries_range_rows_by_key():
+    assert (
+        PostgresQueryConverter.get_backfill_chunk_end_query("users", "id", True)
+        == "SELECT MAX(id) FROM (SELECT id FROM users WHERE id > %s ORDER BY id LIMIT %s) AS chunk;"
+    )
+    assert (
+        PostgresQueryConverter.get_backfill_chunk_query(
+            "users", "months", "id", "age * 12", False
+        )
+        == "UPDATE users SET months = (age * 12) WHERE id <= %s;"
+    )
@@ -86,7 +86,7 @@ complex_table_with_constraints = PostgresTyping.Table(
         ),
         (
             RenameTableOperation(simple_table_no_constraints, "users2"),
-            "DROP TABLE users; CREATE TABLE users2 (name TEXT);",
+            "ALTER TABLE users RENAME TO users2;",
         ),
     ],
 )
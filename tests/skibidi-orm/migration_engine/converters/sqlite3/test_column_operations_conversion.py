@@ -6,8 +6,10 @@ from skibidi_orm.migration_engine.converters.sqlite3.columns import (
 )
 from skibidi_orm.migration_engine.operations.column_operations import (
     AddColumnOperation,
+    AddConstraintOperation,
     ChangeDataTypeOperation,
     DeleteColumnOperation,
+    DeleteConstraintOperation,
     RenameColumnOperation,
 )
 from skibidi_orm.migration_engine.adapters.database_objects.constraints import (
@@ -183,30 +185,48 @@ def test_rename_column_with_check_constraint():
     )
 
 
+users_table = SQLite3Typing.Table(
+    "users", columns=[column_unique, simple_column_no_constraints]
+)
+
+
 def test_change_data_type_simple_column():
     operation = ChangeDataTypeOperation(
-        empty_users_table, simple_column_no_constraints, "INTEGER"
+        users_table, simple_column_no_constraints, "INTEGER"
+    )
+    assert SQLite3ColumnOperationConverter.convert_column_operation_to_SQL(
+        operation
+    ) == (
+        "CREATE TABLE skibidi_rebuild_users (user_id INTEGER UNIQUE, name INTEGER); "
+        "INSERT INTO skibidi_rebuild_users (user_id, name) SELECT user_id, name FROM users; "
+        "DROP TABLE users; "
+        "ALTER TABLE skibidi_rebuild_users RENAME TO users;"
     )
-    with raises(UnsupportedOperationError):
-        SQLite3ColumnOperationConverter.convert_column_operation_to_SQL(operation)
 
 
-def test_change_data_type_primary_key_unique_nn():
-    operation = ChangeDataTypeOperation(
-        empty_users_table, column_primary_key_unique, "TEXT"
+def test_add_constraint_rebuilds_table():
+    operation = AddConstraintOperation(
+        users_table,
+        simple_column_no_constraints,
+        NotNullConstraint("users", "name"),
+    )
+    assert SQLite3ColumnOperationConverter.convert_column_operation_to_SQL(
+        operation
+    ).startswith(
+        "CREATE TABLE skibidi_rebuild_users (user_id INTEGER UNIQUE, name TEXT NOT NULL);"
     )
-    with raises(UnsupportedOperationError):
-        SQLite3ColumnOperationConverter.convert_column_operation_to_SQL(operation)
-
 
-def test_change_data_type_column_with_foreign_key_and_unique():
-    operation = ChangeDataTypeOperation(empty_users_table, column_unique, "TEXT")
 
-    with raises(UnsupportedOperationError):
-        SQLite3ColumnOperationConverter.convert_column_operation_to_SQL(operation)
+def test_delete_constraint_rebuilds_table():
+    operation = DeleteConstraintOperation(
+        users_table, column_unique, UniqueConstraint("users", "user_id")
+    )
+    assert SQLite3ColumnOperationConverter.convert_column_operation_to_SQL(
+        operation
+    ).startswith("CREATE TABLE skibidi_rebuild_users (user_id INTEGER, name TEXT);")
 
 
-def test_change_data_type_column_with_check_constraint():
+def test_change_data_type_column_outside_of_table():
     operation = ChangeDataTypeOperation(empty_users_table, age_column, "TEXT")
     with raises(UnsupportedOperationError):
         SQLite3ColumnOperationConverter.convert_column_operation_to_SQL(operation)
@@ -111,7 +111,7 @@ def test_rename_table_conversion_simple():
     operation = RenameTableOperation(simple_table_no_constraints, "users2")
     assert (
         SQLite3TableOperationConverter.convert_table_operation_to_SQL(operation)
-        == "DROP TABLE users; CREATE TABLE users2 (name TEXT);"
+        == "ALTER TABLE users RENAME TO users2;"
     )
 
 
@@ -0,0 +1,91 @@
+import pickle
+import pytest
+from skibidi_orm.migration_engine.adapters.base_adapter import BaseColumn, BaseTable
+from skibidi_orm.migration_engine.adapters.database_objects import constraints as c
+from skibidi_orm.migration_engine.adapters.database_objects.frozen_schema import (
+    FrozenColumn,
+    FrozenTable,
+    freeze_tables,
+)
+
+
+def make_table(name: str = "users") -> BaseTable[BaseColumn[str]]:
+    return BaseTable(
+        name,
+        columns=[
+            BaseColumn(
+                "id",
+                "INTEGER",
+                [c.PrimaryKeyConstraint(name, "id"), c.NotNullConstraint(name, "id")],
+            ),
+            BaseColumn("name", "TEXT"),
+        ],
+        table_constraints={c.CheckConstraint(name, "id > 0")},
+    )
+
+
+def test_equal_tables_are_interned():
+    table = FrozenTable.from_table(make_table())
+    assert FrozenTable.from_table(make_table()) is table
+    assert table.columns[0] is FrozenColumn(
+        "id", "INTEGER", [c.NotNullConstraint("users", "id"), c.PrimaryKeyConstraint("users", "id")]  # type: ignore
+    )
+
+
+def test_constraints_order_does_not_matter():
+    table = make_table()
+    reordered = make_table()
+    reordered.columns[0].column_constraints.reverse()
+
+    assert table != reordered
+    assert FrozenTable.from_table(table) == FrozenTable.from_table(reordered)
+    assert hash(FrozenTable.from_table(table)) == hash(
+        FrozenTable.from_table(reordered)
+    )
+
+
+def test_different_tables_are_not_equal():
+    table = make_table()
+    changed = make_table()
+    changed.columns[1].column_constraints.append(c.UniqueConstraint("users", "name"))
+
+    assert FrozenTable.from_table(table) != FrozenTable.from_table(changed)
+    assert freeze_tables([table, changed]) != freeze_tables([table, table])
+
+
+def test_frozen_objects_are_immutable():
+    table = FrozenTable.from_table(make_table())
+    with pytest.raises(AttributeError):
+        table.name = "people"  # type: ignore
+    with pytest.raises(AttributeError):
+        table.columns[0].data_type = "TEXT"  # type: ignore
+
+
+def test_round_trip_to_mutable_table():
+    table = make_table()
+    assert FrozenTable.from_table(table).to_table() == BaseTable(
+        "users",
+        columns=[
+            BaseColumn(
+                "id",
+                "INTEGER",
+                [
+                    c.NotNullConstraint("users", "id"),
+                    c.PrimaryKeyConstraint("users", "id"),
+                ],
+            ),
+            BaseColumn("name", "TEXT"),
+        ],
+        table_constraints={c.CheckConstraint("users", "id > 0")},
+    )
+
+
+def test_unpickled_table_is_interned():
+    table = FrozenTable.from_table(make_table())
+    assert pickle.loads(pickle.dumps(table)) is table
+
+
+def test_columns_are_sorted_by_name():
+    table = FrozenTable.from_table(make_table())
+    assert sorted(table.columns) == [table.columns[0], table.columns[1]]
+    assert sorted(freeze_tables([make_table("b"), make_table("a")]))[0].name == "a"
@@ -0,0 +1,146 @@
+import asyncio
+import threading
+import pytest
+
+from skibidi_orm.exceptions.config_exceptions import DbConnectionError
+from skibidi_orm.migration_engine.db_config.connection_pool import (
+    AsyncConnectionPool,
+    ConnectionPool,
+)
+from skibidi_orm.migration_engine.db_config.sqlite3_config import SQLite3Config
+from skibidi_orm.migration_engine.sql_executor.sqlite3_executor import SQLite3Executor
+
+
+class FakeConnection:
+    def __init__(self) -> None:
+        self.closed = False
+        self.healthy = True
+        self.rollbacks = 0
+
+    def rollback(self) -> None:
+        self.rollbacks += 1
+
+    def close(self) -> None:
+        self.closed = True
+
+
+def make_pool(**kwargs) -> tuple[ConnectionPool[FakeConnection], list[FakeConnection]]:  # type: ignore
+    opened: list[FakeConnection] = []
+
+    def connect() -> FakeConnection:
+        opened.append(FakeConnection())
+        return opened[-1]
+
+    return ConnectionPool(connect, lambda c: c.healthy, **kwargs), opened  # type: ignore
+
+
+def test_connections_are_reused():
+    pool, opened = make_pool(warm_up=2)
+    assert len(opened) == 2
+
+    with pool.connection() as first:
+        with pool.connection() as nested:
+            assert nested is first
+    with pool.connection() as second:
+        assert second is first
+
+    assert len(opened) == 2
+    assert first.rollbacks == 3  # every release (the warm-up too) rolls back
+
+
+def test_pool_waits_for_a_released_connection():
+    pool, opened = make_pool(size=1, timeout=0.05)
+    connection = pool.acquire()
+
+    with pytest.raises(DbConnectionError):
+        pool.acquire()
+
+    threading.Timer(0.01, pool.release, [connection]).start()
+    pool.timeout = 5
+    assert pool.acquire() is connection
+    assert len(opened) == 1
+
+
+def test_unhealthy_and_old_connections_are_recycled():
+    pool, opened = make_pool(health_check_interval=0)
+    with pool.connection() as connection:
+        pass
+    connection.healthy = False
+
+    with pool.connection() as healthy:
+        assert healthy is not connection
+    assert connection.closed
+
+    pool.max_age = 0
+    with pool.connection() as fresh:
+        assert fresh is not healthy
+    assert len(opened) == 3
+
+
+def test_thread_connection_is_returned_when_the_thread_ends():
+    pool, opened = make_pool(size=1)
+    held: list[FakeConnection] = []
+    thread = threading.Thread(target=lambda: held.append(pool.thread_connection()))
+    thread.start()
+    thread.join()
+    del thread
+
+    assert pool.acquire() is held[0]
+    assert len(opened) == 1
+
+
+def test_sqlite3_components_share_pooled_connections(make_database: str):
+    config = SQLite3Config(make_database, pool_size=1)
+    SQLite3Executor.execute_sql("CREATE TABLE users (id INTEGER);")
+
+    with SQLite3Executor.transaction() as conn:
+        conn.execute("INSERT INTO users VALUES (1);")
+        assert SQLite3Executor.execute_sql_query("SELECT * FROM users;") == [(1,)]
+
+    assert config.connection_pool.open_connections == 1
+
+
+class FakeAsyncConnection(FakeConnection):
+    async def rollback(self) -> None:  # type: ignore
+        super().rollback()
+
+    async def close(self) -> None:  # type: ignore
+        super().close()
+
+
+def test_async_connections_are_reused_and_waited_for():
+    opened: list[FakeAsyncConnection] = []
+
+    async def connect() -> FakeAsyncConnection:
+        opened.append(FakeAsyncConnection())
+        return opened[-1]
+
+    async def is_healthy(connection: FakeAsyncConnection) -> bool:
+        return connection.healthy
+
+    async def use_pool():
+        pool = AsyncConnectionPool(connect, is_healthy, size=1, timeout=0.05)
+        async with pool.connection() as first:
+            with pytest.raises(DbConnectionError):
+                await pool.acquire()
+        async with pool.connection() as second:
+            assert second is first
+
+        pool.timeout = 5
+        held = await pool.acquire()
+        waiting = asyncio.create_task(pool.acquire())
+        await asyncio.sleep(0.01)
+        assert not waiting.done()
+        await pool.release(held)
+        assert await waiting is held
+
+        await pool.release(held)
+        held.healthy = False
+        pool.health_check_interval = 0
+        async with pool.connection() as healthy:
+            assert healthy is not held
+        assert held.closed
+        assert pool.open_connections == 1
+
+    asyncio.run(use_pool())
+    assert len(opened) == 2
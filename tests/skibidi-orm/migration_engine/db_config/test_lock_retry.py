@@ -0,0 +1,74 @@
+import sqlite3
+import threading
+import time
+import pytest
+
+from skibidi_orm.migration_engine.adapters.sqlite3_typing import SQLite3Typing
+from skibidi_orm.migration_engine.db_config.lock_retry import LockRetry
+from skibidi_orm.migration_engine.db_config.sqlite3_config import SQLite3Config
+from skibidi_orm.migration_engine.db_inspectors.sqlite.sqlite3_inspector import (
+    SQLite3Inspector,
+)
+from skibidi_orm.migration_engine.operations.table_operations import (
+    CreateTableOperation,
+)
+from skibidi_orm.migration_engine.sql_executor.sqlite3_executor import SQLite3Executor
+
+
+class LockError(Exception):
+    pass
+
+
+def test_lock_errors_are_retried_with_growing_jittered_waits(
+    monkeypatch: pytest.MonkeyPatch,
+):
+    sleeps: list[float] = []
+    monkeypatch.setattr("time.sleep", sleeps.append)
+    retry = LockRetry(
+        lambda e: isinstance(e, LockError), lock_timeout=1.0, max_wait=60.0
+    )
+    lock_timeouts: list[float] = []
+
+    def attempt(lock_timeout: float) -> str:
+        lock_timeouts.append(lock_timeout)
+        if len(lock_timeouts) < 4:
+            raise LockError()
+        return "done"
+
+    assert retry.run(attempt) == "done"
+    assert lock_timeouts == [1.0] * 4
+    assert len(sleeps) == 3
+    assert all(0 <= sleep <= retry.backoff * 2**i for i, sleep in enumerate(sleeps))
+
+
+def test_other_errors_are_not_retried():
+    retry = LockRetry(lambda e: isinstance(e, LockError))
+    attempts: list[float] = []
+
+    def attempt(lock_timeout: float):
+        attempts.append(lock_timeout)
+        raise ValueError()
+
+    with pytest.raises(ValueError):
+        retry.run(attempt)
+    assert len(attempts) == 1
+
+
+def test_locked_sqlite3_migration_gives_up_within_budget(make_database: str):
+    config = SQLite3Config(make_database, lock_timeout=0.05, lock_max_wait=0.3)
+    table = SQLite3Typing.Table("users", [SQLite3Typing.Column("id", "INTEGER")])
+    writer = sqlite3.connect(
+        make_database, isolation_level=None, check_same_thread=False
+    )
+    writer.execute("BEGIN IMMEDIATE;")
+
+    start = time.monotonic()
+    with pytest.raises(sqlite3.OperationalError, match="locked"):
+        SQLite3Executor.execute_operations([CreateTableOperation(table)])  # type: ignore
+    assert time.monotonic() - start < 1.0
+
+    threading.Timer(0.2, writer.rollback).start()
+    config.lock_retry.max_wait = 10.0
+    SQLite3Executor.execute_operations([CreateTableOperation(table)])  # type: ignore
+    assert SQLite3Inspector().get_tables_names() == ["users"]
+    writer.close()
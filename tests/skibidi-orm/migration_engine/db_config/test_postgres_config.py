@@ -1,5 +1,17 @@
+import psycopg2
 import pytest
 from skibidi_orm.exceptions.config_exceptions import DbConnectionError
+from skibidi_orm.migration_engine.adapters.database_objects.constraints import (
+    PrimaryKeyConstraint,
+)
+from skibidi_orm.migration_engine.adapters.database_objects.migration_element import (
+    MigrationElement,
+)
+from skibidi_orm.migration_engine.adapters.postgres_adapter import PostgresAdapter
+from skibidi_orm.migration_engine.adapters.postgres_typing import PostgresTyping
+from skibidi_orm.migration_engine.db_inspectors.postgres_inspector import (
+    PostgresInspector,
+)
 from skibidi_orm.migration_engine.db_config.postgres_config import PostgresConfig
 from psycopg2.extensions import connection as Connection
 
@@ -45,3 +57,54 @@ def test_should_raise_DbConnectionError_on_invalid_connection(
             db_host=db_host,  # type: ignore
             db_port=db_port,  # type: ignore
         )
+
+
+def test_connections_search_the_configured_schema():
+    config = PostgresConfig(
+        db_name="postgres",
+        db_user="admin",
+        db_password="admin",
+        db_host="0.0.0.0",
+        db_port=5432,
+        schema="my app",
+        pool_warm_up=0,
+    )
+    assert config.connection_options == '-c search_path="my\\ app"'
+
+
+def test_migration_in_other_schema_is_not_planned_again():
+    """
+    Should migrate the tables of a schema other than public once.
+    Make sure to have a running Postgres database.
+    """
+    connection = psycopg2.connect(
+        user="admin", password="admin", host="0.0.0.0", port=5432, database="postgres"
+    )
+    with connection.cursor() as cursor:
+        cursor.execute("DROP SCHEMA IF EXISTS app CASCADE; CREATE SCHEMA app;")
+    connection.commit()
+    connection.close()
+    PostgresConfig(
+        db_name="postgres",
+        db_user="admin",
+        db_password="admin",
+        db_host="0.0.0.0",
+        db_port=5432,
+        schema="app",
+    )
+    table = PostgresTyping.Table(
+        "users",
+        columns=[
+            PostgresTyping.Column(
+                "id", "INTEGER", [PrimaryKeyConstraint("users", "id")]
+            )
+        ],
+    )
+
+    for _ in range(2):
+        adapter = PostgresAdapter()
+        adapter.create_table(table)
+        adapter.execute_migration()
+
+    assert MigrationElement.operations == []
+    assert PostgresInspector().get_tables_names() == ["users"]
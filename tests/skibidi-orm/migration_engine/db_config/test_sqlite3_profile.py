@@ -0,0 +1,61 @@
+import sqlite3
+import pytest
+
+from skibidi_orm.migration_engine.adapters.sqlite3_typing import SQLite3Typing
+from skibidi_orm.migration_engine.db_config.sqlite3_config import SQLite3Config
+from skibidi_orm.migration_engine.db_config.sqlite3_profile import (
+    SQLITE3_PROFILES,
+    SQLite3Profile,
+)
+from skibidi_orm.migration_engine.operations.table_operations import (
+    CreateTableOperation,
+)
+from skibidi_orm.migration_engine.sql_executor.sqlite3_executor import SQLite3Executor
+
+
+def test_profiles_are_found_by_name():
+    assert SQLite3Profile.named("performance") == SQLITE3_PROFILES["performance"]
+    assert SQLite3Profile.named(SQLite3Profile(synchronous="OFF")).settings() == {
+        "synchronous": "OFF"
+    }
+    with pytest.raises(ValueError):
+        SQLite3Profile.named("fastest")
+
+
+def test_profile_is_applied_to_pooled_connections(make_database: str):
+    config = SQLite3Config(make_database, profile="performance")
+
+    with config.connection_pool.connection() as conn:
+        assert conn.execute("PRAGMA journal_mode;").fetchone()[0] == "wal"
+        assert conn.execute("PRAGMA synchronous;").fetchone()[0] == 1
+        assert conn.execute("PRAGMA busy_timeout;").fetchone()[0] == 5000
+
+
+def test_migration_profile_is_switched_on_during_migrations(make_database: str):
+    config = SQLite3Config(
+        make_database,
+        migration_profile=SQLite3Profile(synchronous="OFF", locking_mode="EXCLUSIVE"),
+    )
+    statements: list[str] = []
+    with config.connection_pool.connection() as conn:
+        conn.set_trace_callback(statements.append)
+        SQLite3Executor.execute_operations(
+            [
+                CreateTableOperation(
+                    SQLite3Typing.Table(
+                        "users", columns=[SQLite3Typing.Column("id", "INTEGER")]
+                    )
+                )
+            ]
+        )
+        assert conn.execute("PRAGMA synchronous;").fetchone()[0] == 2
+        assert conn.execute("PRAGMA locking_mode;").fetchone()[0] == "normal"
+
+    assert statements.index("PRAGMA synchronous = OFF;") < statements.index(
+        "BEGIN IMMEDIATE;"
+    )
+    # the exclusive lock is released after the migration
+    with sqlite3.connect(make_database, timeout=0) as other:
+        assert other.execute("SELECT name FROM sqlite_master;").fetchall() == [
+            ("users",)
+        ]
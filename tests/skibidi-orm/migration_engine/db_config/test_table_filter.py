@@ -0,0 +1,66 @@
+import re
+import pytest
+from skibidi_orm.migration_engine.db_config.postgres_config import PostgresConfig
+from skibidi_orm.migration_engine.db_config.sqlite3_config import SQLite3Config
+from skibidi_orm.migration_engine.db_config.table_filter import TableFilter
+
+
+@pytest.mark.parametrize(
+    "table_filter, managed, unmanaged",
+    [
+        (TableFilter(), ["users", "etl_users"], []),
+        (TableFilter(include=("app_*",)), ["app_users"], ["users", "xapp_users"]),
+        (TableFilter(exclude=("etl_*", "pg_?")), ["users", "pg_xx"], ["etl_a", "pg_x"]),
+        (
+            TableFilter(include=(re.compile(r"^app_"),), exclude=("*_tmp",)),
+            ["app_users"],
+            ["app_users_tmp", "users"],
+        ),
+        (TableFilter(exclude=(re.compile(r"legacy"),)), ["users"], ["old_legacy_x"]),
+    ],
+)
+def test_table_filter_matches(
+    table_filter: TableFilter, managed: list[str], unmanaged: list[str]
+):
+    assert all(table_filter.matches(name) for name in managed)
+    assert not any(table_filter.matches(name) for name in unmanaged)
+
+
+@pytest.mark.parametrize(
+    "glob, regex",
+    [
+        ("app_*", "^app_.*$"),
+        ("t?.x", r"^t.\.x$"),
+        ("[!a-c]*", "^[^a-c].*$"),
+        ("[a", r"^\[a$"),
+    ],
+)
+def test_glob_to_posix_regex(glob: str, regex: str):
+    assert TableFilter.glob_to_posix_regex(glob) == regex
+
+
+def test_to_postgres_condition():
+    table_filter = TableFilter(include=("app_*",), exclude=(re.compile("_tmp$"),))
+    condition, params = table_filter.to_postgres_condition("c.relname")
+    assert condition == (
+        "1 = 1 AND (c.relname ~ %(table_filter_include_0)s)"
+        " AND NOT (c.relname ~ %(table_filter_exclude_0)s)"
+    )
+    assert params == {
+        "table_filter_include_0": "^app_.*$",
+        "table_filter_exclude_0": "_tmp$",
+    }
+
+
+def test_configs_expose_table_filter():
+    config = SQLite3Config(
+        "db.db", include_tables=["app_*"], exclude_tables=[re.compile("tmp")]
+    )
+    assert config.table_filter == TableFilter(("app_*",), (re.compile("tmp"),))
+
+
+def test_postgres_config_defaults_to_public_schema(monkeypatch: pytest.MonkeyPatch):
+    monkeypatch.setattr(PostgresConfig, "create_connection", lambda self: None)  # type: ignore
+    config = PostgresConfig("db", "user", "password", "localhost", 5432)
+    assert config.schema == "public"
+    assert config.table_filter.is_empty
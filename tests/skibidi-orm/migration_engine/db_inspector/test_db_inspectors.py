@@ -1,4 +1,6 @@
+import asyncio
 import pathlib
+import re
 import pytest
 
 from skibidi_orm.migration_engine.adapters.sqlite3_typing import (
@@ -8,6 +10,9 @@ from skibidi_orm.migration_engine.db_config.sqlite3_config import SQLite3Config
 from skibidi_orm.migration_engine.adapters.database_objects import constraints as c
 import sqlite3
 
+from skibidi_orm.migration_engine.db_inspectors.sqlite.async_sqlite3_inspector import (
+    AsyncSQLite3Inspector,
+)
 from skibidi_orm.migration_engine.db_inspectors.sqlite.sqlite3_inspector import (
     SQLite3Inspector,
 )
@@ -360,3 +365,204 @@ def test_get_all_check_constraints(tmp_database: str):
         )
         in check_constraints
     )
+
+
+@pytest.mark.parametrize(
+    "tmp_database",
+    [
+        SQLite3TablesData.sql_schema_with_fks,
+        sql_table_with_unique_constraint_and_artificial_indices,
+        sql_table_with_multiple_check_constraints,
+    ],
+    indirect=True,
+)
+def test_get_tables_snapshot_matches_per_table_inspection(tmp_database: str):
+    """The batched snapshot should produce the same tables as the per-table pragmas"""
+    SQLite3Config(db_path=tmp_database)
+    inspector = SQLite3Inspector()
+    foreign_keys = inspector.get_foreign_key_constraints()
+    expected_tables = [
+        SQLite3Typing.Table(
+            name=table_name,
+            columns=inspector.get_table_columns(table_name),
+            table_constraints={fk for fk in foreign_keys if fk.table_name == table_name},  # type: ignore
+        )
+        for table_name in inspector.get_tables_names()
+    ]
+    assert inspector.get_tables() == expected_tables
+
+
+@pytest.mark.parametrize(
+    "tmp_database", [SQLite3TablesData.sql_schema_with_fks], indirect=True
+)
+def test_get_tables_uses_single_connection(
+    tmp_database: str, monkeypatch: pytest.MonkeyPatch
+):
+    """Inspecting all of the tables should only open a single connection"""
+    SQLite3Config(db_path=tmp_database)
+    inspector = SQLite3Inspector()
+    connections: list[str] = []
+    original_connect = sqlite3.connect
+
+    def counting_connect(*args, **kwargs):  # type: ignore
+        connections.append(args[0])  # type: ignore
+        return original_connect(*args, **kwargs)  # type: ignore
+
+    monkeypatch.setattr(sqlite3, "connect", counting_connect)
+    tables = inspector.get_tables()
+    assert len(tables) == 3
+    assert len(connections) == 1
+
+
+@pytest.mark.parametrize(
+    "tmp_database", [SQLite3TablesData.sql_schema_with_fks], indirect=True
+)
+def test_iter_tables_inspects_tables_in_chunks(
+    tmp_database: str, monkeypatch: pytest.MonkeyPatch
+):
+    """Streamed tables should be inspected chunk by chunk, giving the same tables"""
+    SQLite3Config(db_path=tmp_database, inspection_chunk_size=2)
+    inspector = SQLite3Inspector()
+    expected_tables = inspector.get_tables()
+    connections: list[str] = []
+    chunks: list[list[str]] = []
+    original_connect = sqlite3.connect
+    original_get_tables_snapshot = SQLite3Inspector.get_tables_snapshot
+
+    def counting_connect(*args, **kwargs):  # type: ignore
+        connections.append(args[0])  # type: ignore
+        return original_connect(*args, **kwargs)  # type: ignore
+
+    def recording_get_tables_snapshot(self, conn, tables_names=None):  # type: ignore
+        chunks.append(tables_names)  # type: ignore
+        return original_get_tables_snapshot(self, conn, tables_names)  # type: ignore
+
+    monkeypatch.setattr(sqlite3, "connect", counting_connect)
+    monkeypatch.setattr(
+        SQLite3Inspector, "get_tables_snapshot", recording_get_tables_snapshot
+    )
+    tables = inspector.iter_tables()
+    assert next(tables) == expected_tables[0]
+    assert len(chunks) == 1
+    assert [expected_tables[0], *tables] == expected_tables
+    assert len(chunks) == 2
+    assert connections == []  # the pooled connection is reused
+
+
+@pytest.fixture
+def snapshot_calls(monkeypatch: pytest.MonkeyPatch) -> list[list[str] | None]:
+    """Records the tables passed to every get_tables_snapshot call"""
+    calls: list[list[str] | None] = []
+    original_get_tables_snapshot = SQLite3Inspector.get_tables_snapshot
+
+    def recording_get_tables_snapshot(self, conn, tables_names=None):  # type: ignore
+        calls.append(tables_names)  # type: ignore
+        return original_get_tables_snapshot(self, conn, tables_names)  # type: ignore
+
+    monkeypatch.setattr(
+        SQLite3Inspector, "get_tables_snapshot", recording_get_tables_snapshot
+    )
+    return calls
+
+
+@pytest.mark.parametrize(
+    "tmp_database", [SQLite3TablesData.sql_schema_with_fks], indirect=True
+)
+def test_get_tables_only_reinspects_changed_tables(
+    tmp_database: str, snapshot_calls: list[list[str] | None]
+):
+    """Only tables with a changed CREATE statement should be inspected again"""
+    SQLite3Config(db_path=tmp_database)
+    inspector = SQLite3Inspector()
+    first_tables = inspector.get_tables()
+    execute_sqlite3_commands(
+        tmp_database, ["ALTER TABLE posts ADD COLUMN rating INTEGER;"]
+    )
+
+    second_tables = inspector.get_tables()
+
+    assert snapshot_calls == [None, ["posts"]]
+    assert second_tables[0] == first_tables[0]
+    assert second_tables[2] == first_tables[2]
+    assert [column.name for column in second_tables[1].columns][-1] == "rating"
+    assert second_tables == SQLite3Inspector().get_tables()
+
+
+@pytest.mark.parametrize(
+    "tmp_database", [SQLite3TablesData.sql_schema_with_fks], indirect=True
+)
+def test_changing_returned_tables_does_not_change_the_snapshot(
+    tmp_database: str, snapshot_calls: list[list[str] | None]
+):
+    """Tables reused from the snapshot should not contain the changes made by callers"""
+    SQLite3Config(db_path=tmp_database)
+    inspector = SQLite3Inspector()
+    tables = inspector.get_tables()
+    tables[0].columns[0].column_constraints.clear()
+    tables[0].columns.append(SQLite3Typing.Column("extra", "TEXT"))
+    tables[0].table_constraints.clear()
+    tables[2].table_constraints.clear()
+
+    assert inspector.get_tables() == SQLite3Inspector().get_tables()
+    assert snapshot_calls == [None, [], None]
+
+
+@pytest.mark.parametrize(
+    "tmp_database", [SQLite3TablesData.sql_schema_with_fks], indirect=True
+)
+def test_get_tables_skips_inspection_of_unchanged_schema(
+    tmp_database: str, snapshot_calls: list[list[str] | None]
+):
+    """Dropping a table should not require inspecting the remaining ones"""
+    SQLite3Config(db_path=tmp_database)
+    inspector = SQLite3Inspector()
+    inspector.get_tables()
+    execute_sqlite3_commands(tmp_database, ["DROP TABLE comments;"])
+
+    tables = inspector.get_tables()
+
+    assert snapshot_calls == [None, []]
+    assert [table.name for table in tables] == ["users", "posts"]
+
+
+@pytest.mark.parametrize(
+    "tmp_database", [SQLite3TablesData.sql_schema_with_fks], indirect=True
+)
+def test_get_tables_skips_excluded_tables(tmp_database: str):
+    """Tables rejected by the table filter should not be inspected at all"""
+    SQLite3Config(
+        db_path=tmp_database,
+        include_tables=["*s"],
+        exclude_tables=[re.compile(r"^comm")],
+    )
+    inspector = SQLite3Inspector()
+
+    tables = inspector.get_tables()
+
+    assert inspector.get_tables_names() == ["users", "posts"]
+    assert [table.name for table in tables] == ["users", "posts"]
+    with sqlite3.connect(tmp_database) as conn:
+        assert tables == inspector.get_tables_snapshot(conn)
+
+
+@pytest.mark.parametrize(
+    "tmp_database", [SQLite3TablesData.sql_schema_with_fks], indirect=True
+)
+def test_async_inspector_matches_sync_inspector(tmp_database: str):
+    """Concurrent calls of the async inspector should not interfere with each other"""
+    SQLite3Config(db_path=tmp_database)
+    async_inspector = AsyncSQLite3Inspector()
+
+    async def inspect_concurrently():
+        return await asyncio.gather(
+            async_inspector.get_tables(),
+            async_inspector.get_tables_names(),
+            async_inspector.get_table_columns("posts"),
+        )
+
+    tables, tables_names, columns = asyncio.run(inspect_concurrently())
+
+    inspector = SQLite3Inspector()
+    assert tables == inspector.get_tables()
+    assert tables_names == inspector.get_tables_names()
+    assert columns == inspector.get_table_columns("posts")
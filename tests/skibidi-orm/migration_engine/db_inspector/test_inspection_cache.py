@@ -0,0 +1,134 @@
+import os
+import sqlite3
+import pytest
+
+from skibidi_orm.migration_engine.db_config.base_config import BaseDbConfig
+from skibidi_orm.migration_engine.db_config.sqlite3_config import SQLite3Config
+from skibidi_orm.migration_engine.db_inspectors.inspection_cache import (
+    InspectionCache,
+    invalidate_inspection_cache,
+)
+from skibidi_orm.migration_engine.db_inspectors.sqlite.sqlite3_inspector import (
+    SQLite3Inspector,
+)
+from skibidi_orm.migration_engine.sql_executor.sqlite3_executor import SQLite3Executor
+
+from ..sql_data import SQLite3TablesData
+
+
+@pytest.fixture
+def inspections(monkeypatch: pytest.MonkeyPatch) -> list[int]:
+    """Counts the full inspections performed by the SQLite3Inspector"""
+    calls: list[int] = []
+    original_get_tables = SQLite3Inspector.get_tables
+
+    def counting_get_tables(self: SQLite3Inspector):
+        calls.append(1)
+        return original_get_tables(self)
+
+    monkeypatch.setattr(SQLite3Inspector, "get_tables", counting_get_tables)
+    return calls
+
+
+@pytest.mark.parametrize(
+    "make_database",
+    [[SQLite3TablesData.sql_table1, SQLite3TablesData.sql_table2]],
+    indirect=True,
+)
+def test_cache_hit_skips_inspection(make_database: str, inspections: list[int]):
+    """Unchanged databases should be served from the persisted cache"""
+    SQLite3Config(db_path=make_database)
+    inspector = SQLite3Inspector()
+
+    first = InspectionCache().get_tables(inspector)
+    second = InspectionCache().get_tables(inspector)
+
+    assert len(inspections) == 1
+    assert first == second == inspector.get_tables()
+    assert os.path.exists(InspectionCache().path)
+
+
+@pytest.mark.parametrize(
+    "make_database", [[SQLite3TablesData.sql_table1]], indirect=True
+)
+def test_cache_miss_after_schema_change(make_database: str, inspections: list[int]):
+    """Changing the schema should change the fingerprint and trigger inspection"""
+    SQLite3Config(db_path=make_database)
+    inspector = SQLite3Inspector()
+    fingerprint = inspector.get_schema_fingerprint()
+
+    InspectionCache().get_tables(inspector)
+    SQLite3Executor.execute_sql(SQLite3TablesData.sql_table2)
+    tables = InspectionCache().get_tables(inspector)
+
+    assert inspector.get_schema_fingerprint() != fingerprint
+    assert len(inspections) == 2
+    assert [table.name for table in tables] == ["table1", "table2"]
+
+
+def test_cache_miss_after_database_is_recreated(
+    make_database: str, monkeypatch: pytest.MonkeyPatch
+):
+    """A recreated database reuses the inode and the schema version of the old one,
+    but its different schema should still trigger inspection"""
+    config = SQLite3Config(db_path=make_database)
+    SQLite3Executor.execute_sql("CREATE TABLE a (id INTEGER);")
+    tables = InspectionCache().get_tables(SQLite3Inspector())
+    assert [table.name for table in tables] == ["a"]
+    config.connection_pool.close()
+
+    os.remove(make_database)
+    with sqlite3.connect(make_database) as conn:
+        conn.execute("CREATE TABLE b (id INTEGER);")
+    conn.close()
+    monkeypatch.setattr(BaseDbConfig, "_BaseDbConfig__instance", None)
+    SQLite3Config(db_path=make_database)
+
+    tables = InspectionCache().get_tables(SQLite3Inspector())
+
+    assert [table.name for table in tables] == ["b"]
+
+
+@pytest.mark.parametrize(
+    "make_database", [[SQLite3TablesData.sql_table1]], indirect=True
+)
+def test_invalidation_hook_marks_entry_stale(make_database: str):
+    """The invalidation hook should mark the persisted entry as stale"""
+    SQLite3Config(db_path=make_database)
+    cache = InspectionCache()
+    cache.get_tables(SQLite3Inspector())
+    assert os.path.exists(cache.path)
+
+    invalidate_inspection_cache()
+
+    assert not os.path.exists(cache.path)
+    assert os.path.exists(cache.stale_path)
+
+
+@pytest.mark.parametrize(
+    "make_database",
+    [[SQLite3TablesData.sql_table1, SQLite3TablesData.sql_table2]],
+    indirect=True,
+)
+def test_outdated_entry_seeds_incremental_inspection(
+    make_database: str, monkeypatch: pytest.MonkeyPatch
+):
+    """A new inspector should only inspect the tables changed since the cached entry"""
+    SQLite3Config(db_path=make_database)
+    InspectionCache().get_tables(SQLite3Inspector())
+    SQLite3Executor.execute_sql("ALTER TABLE table2 ADD COLUMN note TEXT;")
+
+    inspected: list[list[str] | None] = []
+    original_get_tables_snapshot = SQLite3Inspector.get_tables_snapshot
+
+    def recording_get_tables_snapshot(self, conn, tables_names=None):  # type: ignore
+        inspected.append(tables_names)  # type: ignore
+        return original_get_tables_snapshot(self, conn, tables_names)  # type: ignore
+
+    monkeypatch.setattr(
+        SQLite3Inspector, "get_tables_snapshot", recording_get_tables_snapshot
+    )
+    tables = InspectionCache().get_tables(SQLite3Inspector())
+
+    assert inspected == [["table2"]]
+    assert [column.name for column in tables[1].columns] == ["id", "name", "note"]
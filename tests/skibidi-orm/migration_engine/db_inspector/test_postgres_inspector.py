@@ -880,3 +880,164 @@ def test__get_foreign_keys(query, table_name, expected_foreign_keys):  # type: i
         assert foreign_keys == expected_foreign_keys
 
     test_fn()
+
+
+def test_tables_from_catalog_rows():
+    """Tables should be assembled in memory from the bulk pg_catalog rows,
+    including the tables without columns"""
+    columns_rows = [
+        ("departments", "department_id", "integer", True, "nextval('seq'::regclass)"),
+        ("employees", "employee_id", "integer", True, None),
+        ("employees", "department_id", "integer", True, None),
+        ("employees", "region_id", "integer", False, None),
+        ("employees", "email", "character varying", False, None),
+    ]
+    key_constraints_rows = [
+        ("departments", "department_id", "p"),
+        ("employees", "employee_id", "p"),
+        ("employees", "email", "u"),
+    ]
+    foreign_keys_rows = [
+        ("employees", "fk_dep", "departments", "department_id", "department_id"),
+        ("employees", "fk_dep", "departments", "region_id", "region_id"),
+    ]
+
+    tables = PostgresInspector.tables_from_catalog_rows(
+        [("departments",), ("employees",), ("markers",)],
+        columns_rows,
+        key_constraints_rows,
+        foreign_keys_rows,
+    )
+
+    assert tables == [
+        PostgresTyping.Table(
+            name="departments",
+            columns=[
+                PostgresTyping.Column(
+                    name="department_id",
+                    data_type="INTEGER",
+                    column_constraints=[
+                        c.PrimaryKeyConstraint("departments", "department_id"),
+                        c.NotNullConstraint("departments", "department_id"),
+                        c.DefaultConstraint(
+                            "departments", "department_id", "nextval('seq'::regclass)"
+                        ),
+                    ],
+                )
+            ],
+        ),
+        PostgresTyping.Table(
+            name="employees",
+            columns=[
+                PostgresTyping.Column(
+                    name="employee_id",
+                    data_type="INTEGER",
+                    column_constraints=[
+                        c.PrimaryKeyConstraint("employees", "employee_id"),
+                        c.NotNullConstraint("employees", "employee_id"),
+                    ],
+                ),
+                PostgresTyping.Column(
+                    name="department_id",
+                    data_type="INTEGER",
+                    column_constraints=[
+                        c.NotNullConstraint("employees", "department_id"),
+                    ],
+                ),
+                PostgresTyping.Column(name="region_id", data_type="INTEGER"),
+                PostgresTyping.Column(
+                    name="email",
+                    data_type="CHARACTER VARYING",
+                    column_constraints=[c.UniqueConstraint("employees", "email")],
+                ),
+            ],
+            table_constraints={
+                c.ForeignKeyConstraint(
+                    table_name="employees",
+                    referenced_table="departments",
+                    column_mapping={
+                        "department_id": "department_id",
+                        "region_id": "region_id",
+                    },
+                )
+            },
+        ),
+        PostgresTyping.Table(name="markers"),
+    ]
+
+
+def test_get_tables_parallel_merges_chunks_deterministically(
+    monkeypatch: pytest.MonkeyPatch,
+):
+    """Chunks inspected by the worker threads should be merged in table name order"""
+    import threading
+    import time
+    from unittest.mock import MagicMock
+
+    monkeypatch.setattr("psycopg2.connect", MagicMock())
+    PostgresConfig(
+        db_name="postgres",
+        db_user="admin",
+        db_password="admin",
+        db_host="0.0.0.0",
+        db_port=5432,
+        inspection_workers=4,
+        inspection_chunk_size=3,
+    )
+    inspector = PostgresInspector()
+    tables_names = [f"table_{i:02}" for i in range(20)]
+    threads: set[str] = set()
+
+    def fake_get_tables_snapshot(cursor, chunk):  # type: ignore
+        threads.add(threading.current_thread().name)
+        time.sleep(0.01 * (len(chunk) % 2))  # type: ignore
+        return [PostgresTyping.Table(name=name) for name in reversed(chunk)]  # type: ignore
+
+    monkeypatch.setattr(inspector, "get_tables_names", lambda: list(reversed(tables_names)))  # type: ignore
+    monkeypatch.setattr(inspector, "get_tables_snapshot", fake_get_tables_snapshot)
+
+    tables = inspector.get_tables()
+
+    assert [table.name for table in tables] == tables_names
+    assert len(threads) > 1
+    assert all(name.startswith("skibidi-inspector") for name in threads)
+
+
+def test_async_inspector_uses_the_inspection_cache(monkeypatch: pytest.MonkeyPatch):
+    """The async inspector should only inspect the schema when its fingerprint changes"""
+    import asyncio
+    from unittest.mock import MagicMock
+    from skibidi_orm.migration_engine.db_inspectors.async_postgres_inspector import (
+        AsyncPostgresInspector,
+    )
+
+    monkeypatch.setattr("psycopg2.connect", MagicMock())
+    PostgresConfig(
+        db_name="postgres",
+        db_user="admin",
+        db_password="admin",
+        db_host="0.0.0.0",
+        db_port=5432,
+    )
+    inspector = AsyncPostgresInspector()
+    catalog_hash = ["first"]
+    inspections: list[int] = []
+
+    async def fake_fetch_all(queries):  # type: ignore
+        if len(queries) == 1:  # type: ignore
+            return [[(catalog_hash[0],)]]
+        inspections.append(1)
+        return [[("users",)], [], [], []]
+
+    monkeypatch.setattr(inspector, "_fetch_all", fake_fetch_all)
+
+    async def get_tables_three_times():
+        first = await inspector.get_tables()
+        second = await inspector.get_tables()
+        catalog_hash[0] = "second"
+        return first, second, await inspector.get_tables()
+
+    first, second, third = asyncio.run(get_tables_three_times())
+
+    assert first == second == third == [PostgresTyping.Table(name="users")]
+    assert len(inspections) == 2
@@ -281,6 +281,20 @@ def test_raw_query(make_database: str):
     assert data == [(1, "test1"), (2, "test2"), (3, "test3")]
 
 
+@pytest.mark.parametrize(
+    "make_database",
+    [[*SQLite3TablesData.sql_simple_db, *SQLite3InsertData.sql_simple_insert]],
+    indirect=True,
+)
+def test_raw_query_with_many_statements(make_database: str):
+    SQLite3Config(db_path=make_database)
+    db_mutator = SQLite3DataMutator()
+    data = db_mutator.raw_query(
+        "INSERT INTO users VALUES (4, 'a;b'); -- added;\nSELECT * FROM users WHERE user_id > 2;"
+    )
+    assert data == [(3, "test3"), (4, "a;b")]
+
+
 @pytest.mark.parametrize(
     "make_database",
     [[*SQLite3TablesData.sql_simple_db, *SQLite3InsertData.sql_simple_insert]],
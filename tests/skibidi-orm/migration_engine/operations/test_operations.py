@@ -110,6 +110,36 @@ def test_add_column_foreign_key_references_different_table():
         )
 
 
+def test_add_column_backfill_defers_not_null_and_default():
+    not_null = c.NotNullConstraint("table", "column")
+    default = c.DefaultConstraint("table", "column", "0")
+    unique = c.UniqueConstraint("table", "column")
+    table = BaseTable[BaseColumn[DataType]](
+        "table",
+        columns=[
+            BaseColumn[DataType](
+                "id", "INTEGER", [c.PrimaryKeyConstraint("table", "id")]
+            )
+        ],
+    )
+    column = BaseColumn[DataType]("column", "INTEGER", [not_null, unique, default])
+    operation = c_ops.AddColumnOperation(
+        table=table, column=column, backfill=c_ops.Backfill("id * 2")  # type: ignore
+    )
+    assert operation.primary_key() == "id"
+    assert operation.deferred_constraints() == [not_null, default]
+
+    nullable = operation.without_deferred_constraints()
+    assert nullable.column.column_constraints == [unique]
+    assert nullable.backfill is None
+
+    add_not_null, add_default = operation.deferred_constraint_operations()
+    assert add_not_null.constraint == not_null
+    assert add_not_null.table.columns[-1] == nullable.column
+    assert add_default.constraint == default
+    assert add_default.column.column_constraints == [unique, not_null]
+
+
 def test_delete_column_operation_init_reverse():
     operation = c_ops.DeleteColumnOperation(table=mock_table_1, column=mock_column_1)
     assert operation.operation_type == OperationType.DELETE
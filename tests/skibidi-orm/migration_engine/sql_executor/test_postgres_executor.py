@@ -0,0 +1,74 @@
+import psycopg2
+import pytest
+
+from skibidi_orm.migration_engine.adapters.postgres_typing import PostgresTyping
+from skibidi_orm.migration_engine.db_config.postgres_config import PostgresConfig
+from skibidi_orm.migration_engine.db_inspectors.postgres_inspector import (
+    PostgresInspector,
+)
+from skibidi_orm.migration_engine.operations.table_operations import (
+    CreateTableOperation,
+)
+from skibidi_orm.migration_engine.revisions.manager import RevisionManager
+from skibidi_orm.migration_engine.revisions.revision import Revision
+from skibidi_orm.migration_engine.sql_executor.postgres_executor import (
+    PostgresExecutor,
+)
+from ..conftest import postgres_db_fixture
+
+
+def test_statements_are_sent_in_batches():
+    statements = [f"CREATE TABLE t{i} (id INTEGER)" for i in range(5)]
+
+    assert list(PostgresExecutor.batch_statements(statements, 2)) == [
+        "CREATE TABLE t0 (id INTEGER);\nCREATE TABLE t1 (id INTEGER);",
+        "CREATE TABLE t2 (id INTEGER);\nCREATE TABLE t3 (id INTEGER);",
+        "CREATE TABLE t4 (id INTEGER);",
+    ]
+    assert list(PostgresExecutor.batch_statements([], 2)) == []
+
+
+def test_failed_operations_are_rolled_back_together():
+    @postgres_db_fixture(
+        db_name="postgres",
+        db_user="admin",
+        db_password="admin",
+        db_host="0.0.0.0",
+        db_port=5432,
+        queries=["CREATE TABLE posts (id INTEGER);"],
+    )
+    def test_fn(config: PostgresConfig, inspector: PostgresInspector):
+        operations = [
+            CreateTableOperation(
+                PostgresTyping.Table(
+                    name, columns=[PostgresTyping.Column("id", "INTEGER")]
+                )
+            )
+            for name in ["users", "posts"]
+        ]
+        with pytest.raises(psycopg2.Error):
+            PostgresExecutor.execute_operations(operations)  # type: ignore
+
+        assert inspector.get_tables_names() == ["posts"]
+
+    test_fn()
+
+
+def test_revisions_are_saved():
+    @postgres_db_fixture(
+        db_name="postgres",
+        db_user="admin",
+        db_password="admin",
+        db_host="0.0.0.0",
+        db_port=5432,
+        queries=[],
+    )
+    def test_fn(config: PostgresConfig, inspector: PostgresInspector):
+        revision_manager = RevisionManager()
+        revision = Revision("init", "", config.database_provider, [])
+        revision_manager.save_revision(revision)
+
+        assert list(revision_manager.get_all_revisions().values()) == [revision]
+        assert inspector.get_tables_names() == []
+
+    test_fn()
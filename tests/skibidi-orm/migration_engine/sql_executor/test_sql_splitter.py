@@ -0,0 +1,64 @@
+from skibidi_orm.migration_engine.sql_executor.sql_splitter import (
+    _split_sql_statements,  # type: ignore
+    find_check_conditions,
+    split_sql_statements,
+)
+
+
+def test_statements_are_split_on_semicolons():
+    assert split_sql_statements(
+        "CREATE TABLE a (id INTEGER);\n  DROP TABLE b ;;\nSELECT 1"
+    ) == ["CREATE TABLE a (id INTEGER)", "DROP TABLE b", "SELECT 1"]
+
+
+def test_quoted_semicolons_do_not_split():
+    script = """CREATE TABLE "a;b" (x TEXT DEFAULT 'it''s;', y CHECK (y != `;`), [z;] INTEGER);"""
+    assert split_sql_statements(script) == [script[:-1]]
+
+
+def test_comments_do_not_split():
+    assert split_sql_statements(
+        "SELECT 1; -- first; comment\n/* second; */ SELECT 2; -- trailing;"
+    ) == ["SELECT 1", "-- first; comment\n/* second; */ SELECT 2"]
+
+
+def test_trigger_bodies_do_not_split():
+    trigger = """CREATE TRIGGER t AFTER INSERT ON a BEGIN
+        UPDATE a SET x = CASE WHEN new.x = ';' THEN 1 ELSE 2 END;
+        DELETE FROM b;
+    END"""
+    assert split_sql_statements(f"{trigger}; BEGIN; END;") == [trigger, "BEGIN", "END"]
+
+
+def test_dollar_quoted_bodies_do_not_split():
+    function = "CREATE FUNCTION f() RETURNS int AS $body$ BEGIN RETURN 1; END; $body$ LANGUAGE plpgsql"
+    assert split_sql_statements(f"{function}; SELECT $1; SELECT $$;$$") == [
+        function,
+        "SELECT $1",
+        "SELECT $$;$$",
+    ]
+
+
+def test_repeated_scripts_are_not_parsed_again():
+    script = "SELECT 'cached'; SELECT 2;"
+    split_sql_statements(script)
+    hits = _split_sql_statements.cache_info().hits
+
+    statements = split_sql_statements(script)
+    statements.append("SELECT 3")
+
+    assert _split_sql_statements.cache_info().hits == hits + 1
+    assert split_sql_statements(script) == ["SELECT 'cached'", "SELECT 2"]
+
+
+def test_check_conditions_are_found_in_table_definitions():
+    definition = """CREATE TABLE "check" (
+        age INTEGER CHECK (age >= 0) CONSTRAINT adult check(age < 150),
+        name TEXT DEFAULT 'CHECK (x)', -- CHECK (y)
+        CHECK (name != ')' AND (age > 1 OR name IS NULL))
+    )"""
+    assert find_check_conditions(definition) == [
+        "age >= 0",
+        "age < 150",
+        "name != ')' AND (age > 1 OR name IS NULL)",
+    ]
@@ -1,11 +1,31 @@
+import sqlite3
+import pytest
 from skibidi_orm.migration_engine.db_config.sqlite3_config import SQLite3Config
+from skibidi_orm.migration_engine.db_config.sqlite3_profile import SQLite3Profile
 from skibidi_orm.migration_engine.db_inspectors.sqlite.sqlite3_inspector import (
     SQLite3Inspector,
 )
 from skibidi_orm.migration_engine.adapters.database_objects.constraints import (
+    CheckConstraint,
+    NotNullConstraint,
     PrimaryKeyConstraint,
 )
+from skibidi_orm.migration_engine.operations.column_operations import (
+    AddColumnOperation,
+    AddConstraintOperation,
+    Backfill,
+    ChangeDataTypeOperation,
+)
+from skibidi_orm.migration_engine.operations.table_operations import (
+    CreateTableOperation,
+    DeleteTableOperation,
+)
 from skibidi_orm.migration_engine.sql_executor.sqlite3_executor import SQLite3Executor
+from skibidi_orm.migration_engine.converters.sqlite3.columns import (
+    SQLite3ColumnOperationConverter,
+)
+from skibidi_orm.migration_engine.adapters.sqlite3_typing import SQLite3Typing
+from skibidi_orm.migration_engine.revisions.constants import get_backfill_table_name
 
 type TestTableRow = tuple[int, str | None]
 
@@ -41,3 +61,275 @@ def test_execute_query(make_database: str):
     )
 
     assert table_contents == [(1, "test1"), (2, None)]
+
+
+def test_alterations_of_a_table_are_grouped_into_one_rebuild(make_database: str):
+    SQLite3Config(make_database)
+    SQLite3Executor.execute_sql(
+        "CREATE TABLE test_table (id INTEGER PRIMARY KEY, name TEXT, age TEXT);"
+    )
+    table = SQLite3Inspector().get_tables()[0]
+    id_column, name_column, age_column = table.columns
+    change_type = ChangeDataTypeOperation(table, age_column, "INTEGER")
+    add_not_null = AddConstraintOperation(
+        SQLite3ColumnOperationConverter.altered_table(change_type),
+        name_column,
+        NotNullConstraint("test_table", "name"),
+    )
+    other_table = SQLite3Inspector().get_tables()[0]
+    other_table.name = "other_table"
+
+    operations = [
+        change_type,
+        AddColumnOperation(other_table, id_column),
+        add_not_null,
+        AddColumnOperation(table, SQLite3Typing.Column("email", "TEXT")),
+        ChangeDataTypeOperation(table, id_column, "INTEGER"),
+    ]
+    assert SQLite3Executor.group_table_rebuilds(operations) == {  # type: ignore
+        0: [],
+        2: [0, 2],
+        4: [4],
+    }
+
+
+def test_rebuild_keeps_data_indexes_and_triggers(make_database: str):
+    SQLite3Config(make_database)
+    with sqlite3.connect(make_database) as conn:
+        conn.executescript(
+            """
+            CREATE TABLE test_table (id INTEGER PRIMARY KEY, name TEXT, age TEXT);
+            CREATE TABLE log (name TEXT);
+            CREATE INDEX test_table_name ON test_table (name);
+            CREATE TRIGGER test_table_log AFTER INSERT ON test_table
+                BEGIN INSERT INTO log (name) VALUES (new.name); END;
+            INSERT INTO test_table (id, name, age) VALUES (1, 'test1', '20');
+            """
+        )
+    table = next(t for t in SQLite3Inspector().get_tables() if t.name == "test_table")
+    change_type = ChangeDataTypeOperation(table, table.columns[2], "INTEGER")
+    add_not_null = AddConstraintOperation(
+        SQLite3ColumnOperationConverter.altered_table(change_type),
+        table.columns[1],
+        NotNullConstraint("test_table", "name"),
+    )
+
+    SQLite3Executor.execute_operations([change_type, add_not_null])
+
+    table = next(t for t in SQLite3Inspector().get_tables() if t.name == "test_table")
+    assert table.columns[1].column_constraints == [
+        NotNullConstraint("test_table", "name")
+    ]
+    assert table.columns[2].data_type == "INTEGER"
+    assert SQLite3Executor.execute_sql_query("SELECT * FROM test_table;") == [
+        (1, "test1", 20)
+    ]
+    assert SQLite3Executor.execute_sql_query(
+        "SELECT type, name FROM sqlite_master WHERE tbl_name = 'test_table'"
+        " AND type IN ('index', 'trigger') ORDER BY name;"
+    ) == [("trigger", "test_table_log"), ("index", "test_table_name")]
+    assert not SQLite3Executor.execute_sql_query(
+        "SELECT name FROM sqlite_master WHERE name LIKE 'skibidi_rebuild_%';"
+    )
+
+
+def test_rebuild_keeps_column_defaults(make_database: str):
+    SQLite3Config(make_database)
+    SQLite3Executor.execute_sql(
+        "CREATE TABLE t (id INTEGER PRIMARY KEY, a TEXT DEFAULT 'x', b INTEGER, c INTEGER DEFAULT (1+2));"
+    )
+    table = SQLite3Inspector().get_tables()[0]
+    defaults = [
+        table.columns[1].column_constraints,
+        table.columns[3].column_constraints,
+    ]
+
+    SQLite3Executor.execute_operations(
+        [ChangeDataTypeOperation(table, table.columns[2], "TEXT")]
+    )
+    SQLite3Executor.execute_sql("INSERT INTO t (id, b) VALUES (1, 'test1');")
+
+    table = SQLite3Inspector().get_tables()[0]
+    assert table.columns[2].data_type == "TEXT"
+    assert [
+        table.columns[1].column_constraints,
+        table.columns[3].column_constraints,
+    ] == defaults
+    assert SQLite3Executor.execute_sql_query("SELECT * FROM t;") == [
+        (1, "x", "test1", 3)
+    ]
+
+
+def test_failed_operations_are_rolled_back_together(make_database: str):
+    SQLite3Config(make_database)
+    users = SQLite3Typing.Table(
+        "users",
+        columns=[SQLite3Typing.Column("id", "INTEGER")],
+        table_constraints={CheckConstraint("users", "id != ';'")},
+    )
+    posts = SQLite3Typing.Table(
+        "posts", columns=[SQLite3Typing.Column("id", "INTEGER")]
+    )
+    with pytest.raises(sqlite3.OperationalError):
+        SQLite3Executor.execute_operations(
+            [
+                CreateTableOperation(users),
+                CreateTableOperation(posts),
+                CreateTableOperation(posts),
+            ]
+        )
+    assert SQLite3Inspector().get_tables_names() == []
+
+    SQLite3Executor.execute_operations(
+        [CreateTableOperation(users), CreateTableOperation(posts)]
+    )
+    assert sorted(SQLite3Inspector().get_tables_names()) == ["posts", "users"]
+
+
+def make_backfill(make_database: str, chunk_size: int) -> AddColumnOperation:
+    SQLite3Config(make_database)
+    SQLite3Executor.execute_sql(
+        """
+        CREATE TABLE users (id INTEGER PRIMARY KEY, age INTEGER);
+        INSERT INTO users (id, age) VALUES (1, 10), (2, 20), (3, 30), (4, 40), (5, 50);
+        """
+    )
+    table = SQLite3Inspector().get_tables()[0]
+    column = SQLite3Typing.Column(
+        "months",
+        "INTEGER",
+        column_constraints=[NotNullConstraint("users", "months")],
+    )
+    return AddColumnOperation(
+        table, column, backfill=Backfill("age * 12", chunk_size, throttle=0.5)
+    )
+
+
+def test_backfill_populates_column_in_chunks(
+    make_database: str, monkeypatch: pytest.MonkeyPatch
+):
+    operation = make_backfill(make_database, chunk_size=2)
+    sleeps: list[float] = []
+    monkeypatch.setattr("time.sleep", sleeps.append)
+
+    SQLite3Executor.execute_operations([operation])
+
+    assert sleeps == [0.5] * 3
+    assert SQLite3Executor.execute_sql_query("SELECT id, months FROM users;") == [
+        (1, 120),
+        (2, 240),
+        (3, 360),
+        (4, 480),
+        (5, 600),
+    ]
+    table = SQLite3Inspector().get_tables()[0]
+    assert table.columns[2] == operation.column
+    assert SQLite3Inspector().get_tables_names() == ["users"]
+    assert not SQLite3Executor.execute_sql_query(
+        f"SELECT * FROM {get_backfill_table_name()};"
+    )
+
+
+def test_backfilled_constraints_are_applied_once(
+    make_database: str, monkeypatch: pytest.MonkeyPatch
+):
+    operation = make_backfill(make_database, chunk_size=2)
+    monkeypatch.setattr("time.sleep", lambda _: None)  # type: ignore
+    rebuilds: list[str] = []
+    original_convert_table_rebuild_to_SQL = (
+        SQLite3ColumnOperationConverter.convert_table_rebuild_to_SQL
+    )
+
+    def counting_convert_table_rebuild_to_SQL(table, new_table):  # type: ignore
+        rebuilds.append(table.name)  # type: ignore
+        return original_convert_table_rebuild_to_SQL(table, new_table)  # type: ignore
+
+    monkeypatch.setattr(
+        SQLite3ColumnOperationConverter,
+        "convert_table_rebuild_to_SQL",
+        counting_convert_table_rebuild_to_SQL,
+    )
+
+    SQLite3Executor.execute_operations([operation])
+
+    assert rebuilds == ["users"]
+    assert SQLite3Inspector().get_tables()[0].columns[2] == operation.column
+
+
+def test_interrupted_backfill_resumes_after_last_chunk(
+    make_database: str, monkeypatch: pytest.MonkeyPatch
+):
+    operation = make_backfill(make_database, chunk_size=2)
+    interrupted = [False]
+
+    def interrupt(_: float):
+        if not interrupted[0]:
+            interrupted[0] = True
+            raise KeyboardInterrupt
+
+    monkeypatch.setattr("time.sleep", interrupt)
+    with pytest.raises(KeyboardInterrupt):
+        SQLite3Executor.execute_operations([operation])
+    assert SQLite3Executor.execute_sql_query("SELECT id, months FROM users;") == [
+        (1, 120),
+        (2, 240),
+        (3, None),
+        (4, None),
+        (5, None),
+    ]
+
+    # the populated chunk is not populated again
+    SQLite3Executor.execute_sql("UPDATE users SET months = 0 WHERE id = 1;")
+    SQLite3Executor.execute_operations([])
+
+    assert SQLite3Executor.execute_sql_query("SELECT id, months FROM users;") == [
+        (1, 0),
+        (2, 240),
+        (3, 360),
+        (4, 480),
+        (5, 600),
+    ]
+    assert SQLite3Inspector().get_tables()[0].columns[2] == operation.column
+
+
+def test_foreign_keys_of_the_whole_database_are_checked(make_database: str):
+    SQLite3Config(make_database, profile=SQLite3Profile(foreign_keys=True))
+    SQLite3Executor.execute_sql(
+        """
+        CREATE TABLE teams (id INTEGER PRIMARY KEY);
+        CREATE TABLE users (id INTEGER PRIMARY KEY, name TEXT, team_id INTEGER REFERENCES teams (id));
+        INSERT INTO teams (id) VALUES (1);
+        INSERT INTO users (id, name, team_id) VALUES (1, 'test1', 1);
+        """
+    )
+    teams, users = SQLite3Inspector().get_tables()
+    operations = [
+        ChangeDataTypeOperation(users, users.columns[1], "INTEGER"),
+        DeleteTableOperation(teams),
+    ]
+
+    with pytest.raises(sqlite3.IntegrityError):
+        SQLite3Executor.execute_operations(operations)  # type: ignore
+    assert SQLite3Inspector().get_tables_names() == ["teams", "users"]
+    assert SQLite3Executor.execute_sql_query("PRAGMA foreign_keys;") == [(1,)]
+
+
+def test_check_constraints_are_kept_by_rebuilds(make_database: str):
+    SQLite3Config(make_database)
+    SQLite3Executor.execute_sql(
+        "CREATE TABLE users (id INTEGER PRIMARY KEY, name TEXT, age INTEGER CHECK (age >= 0), CHECK (name != ''));"
+    )
+    users = SQLite3Inspector().get_tables()[0]
+    operations = [
+        ChangeDataTypeOperation(users, users.columns[1], "INTEGER"),
+        AddConstraintOperation(
+            users, users.columns[2], CheckConstraint("users", "age < 150")
+        ),
+    ]
+
+    SQLite3Executor.execute_operations(operations)  # type: ignore
+    for values in ["(1, 'test1', -1)", "(1, '', 20)", "(1, 'test1', 150)"]:
+        with pytest.raises(sqlite3.IntegrityError, match="CHECK"):
+            SQLite3Executor.execute_sql(
+                f"INSERT INTO users (id, name, age) VALUES {values};"
+            )
@@ -0,0 +1,107 @@
+from skibidi_orm.migration_engine.adapters.sqlite3_typing import SQLite3Typing
+from skibidi_orm.migration_engine.adapters.database_objects import constraints as c
+from skibidi_orm.migration_engine.operations.column_operations import (
+    AddColumnOperation,
+    AddConstraintOperation,
+    ChangeDataTypeOperation,
+    DeleteColumnOperation,
+    DeleteConstraintOperation,
+    RenameColumnOperation,
+)
+from skibidi_orm.migration_engine.operations.table_operations import (
+    CreateTableOperation,
+    DeleteTableOperation,
+    RenameTableOperation,
+)
+from skibidi_orm.migration_engine.state_manager.operation_optimizer import (
+    OperationOptimizer,
+)
+
+id_column = SQLite3Typing.Column("id", "INTEGER")
+name_column = SQLite3Typing.Column("name", "TEXT")
+users = SQLite3Typing.Table("users", columns=[id_column])
+posts = SQLite3Typing.Table("posts", columns=[id_column])
+
+
+def test_inverse_operations_cancel_out():
+    operations = [
+        AddColumnOperation(users, name_column),
+        AddColumnOperation(posts, name_column),
+        DeleteColumnOperation(users, name_column),
+        AddConstraintOperation(posts, id_column, c.NotNullConstraint("posts", "id")),
+        DeleteConstraintOperation(posts, id_column, c.NotNullConstraint("posts", "id")),
+    ]
+
+    assert OperationOptimizer.optimize(operations) == [operations[1]]  # type: ignore
+
+
+def test_renames_are_folded():
+    operations = [
+        RenameTableOperation(users, "people"),
+        RenameTableOperation(SQLite3Typing.Table("people"), "persons"),
+        RenameColumnOperation(posts, id_column, "post_id"),
+        RenameColumnOperation(posts, SQLite3Typing.Column("post_id", "INTEGER"), "id"),
+    ]
+
+    assert OperationOptimizer.optimize(operations) == [  # type: ignore
+        RenameTableOperation(users, "persons")
+    ]
+
+
+def test_data_type_changes_are_folded():
+    operations = [
+        ChangeDataTypeOperation(users, id_column, "TEXT"),
+        ChangeDataTypeOperation(users, SQLite3Typing.Column("id", "TEXT"), "REAL"),
+    ]
+
+    assert OperationOptimizer.optimize(operations) == [  # type: ignore
+        ChangeDataTypeOperation(users, id_column, "REAL")
+    ]
+
+
+def test_changes_of_created_table_are_merged_into_its_definition():
+    operations = [
+        CreateTableOperation(users),
+        AddColumnOperation(users, name_column),
+        ChangeDataTypeOperation(users, name_column, "BLOB"),
+        AddConstraintOperation(users, id_column, c.UniqueConstraint("users", "id")),
+        RenameTableOperation(users, "people"),
+    ]
+
+    assert OperationOptimizer.optimize(operations) == [  # type: ignore
+        CreateTableOperation(
+            SQLite3Typing.Table(
+                "people",
+                columns=[
+                    SQLite3Typing.Column(
+                        "id", "INTEGER", [c.UniqueConstraint("people", "id")]
+                    ),
+                    SQLite3Typing.Column("name", "BLOB"),
+                ],
+            )
+        )
+    ]
+
+
+def test_changes_of_deleted_table_are_dropped():
+    operations = [
+        AddColumnOperation(users, name_column),
+        RenameTableOperation(users, "people"),
+        DeleteTableOperation(SQLite3Typing.Table("people")),
+        CreateTableOperation(posts),
+        DeleteTableOperation(posts),
+    ]
+
+    assert OperationOptimizer.optimize(operations) == [  # type: ignore
+        DeleteTableOperation(users)
+    ]
+
+
+def test_interleaved_operations_are_not_combined():
+    operations = [
+        AddColumnOperation(users, name_column),
+        ChangeDataTypeOperation(users, id_column, "TEXT"),
+        DeleteColumnOperation(users, name_column),
+    ]
+
+    assert OperationOptimizer.optimize(operations) == operations  # type: ignore
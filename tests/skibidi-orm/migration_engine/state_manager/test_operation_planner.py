@@ -0,0 +1,93 @@
+from skibidi_orm.migration_engine.adapters.sqlite3_typing import SQLite3Typing
+from skibidi_orm.migration_engine.adapters.database_objects import constraints as c
+from skibidi_orm.migration_engine.operations.column_operations import (
+    AddColumnOperation,
+    DeleteColumnOperation,
+)
+from skibidi_orm.migration_engine.operations.table_operations import (
+    CreateTableOperation,
+    DeleteTableOperation,
+    RenameTableOperation,
+)
+from skibidi_orm.migration_engine.state_manager.operation_planner import (
+    OperationPlanner,
+)
+
+
+def make_table(name: str, references: list[str] = []) -> SQLite3Typing.Table:
+    columns = [SQLite3Typing.Column("id", "INTEGER")]
+    columns += [SQLite3Typing.Column(f"{r}_id", "INTEGER") for r in references]
+    return SQLite3Typing.Table(
+        name,
+        columns=columns,
+        table_constraints={
+            c.ForeignKeyConstraint(name, r, {f"{r}_id": "id"}) for r in references
+        },
+    )
+
+
+def test_created_tables_follow_referenced_tables():
+    comment = CreateTableOperation(make_table("comment", ["post", "user"]))
+    post = CreateTableOperation(make_table("post", ["user"]))
+    user = CreateTableOperation(make_table("user"))
+    tag = CreateTableOperation(make_table("tag"))
+
+    assert OperationPlanner.plan_waves([comment, post, user, tag]) == [
+        [user, tag],
+        [post],
+        [comment],
+    ]
+
+
+def test_deleted_tables_follow_referencing_tables():
+    user = DeleteTableOperation(make_table("user"))
+    post = DeleteTableOperation(make_table("post", ["user"]))
+
+    assert OperationPlanner.plan([user, post]) == [post, user]
+
+
+def test_foreign_key_of_added_column_follows_referenced_table():
+    post = make_table("post")
+    add_column = AddColumnOperation(
+        post,
+        SQLite3Typing.Column("user_id", "INTEGER"),
+        related_foreign_key=c.ForeignKeyConstraint("post", "user", {"user_id": "id"}),
+    )
+    rename = RenameTableOperation(make_table("account"), "user")
+
+    assert OperationPlanner.plan_waves([add_column, rename]) == [
+        [rename],
+        [add_column],
+    ]
+
+
+def test_dropped_foreign_key_precedes_deleted_table():
+    post = make_table("post", ["user"])
+    delete_column = DeleteColumnOperation(post, post.columns[1])
+    delete_user = DeleteTableOperation(make_table("user"))
+
+    assert OperationPlanner.plan([delete_user, delete_column]) == [
+        delete_column,
+        delete_user,
+    ]
+
+
+def test_operations_on_the_same_table_keep_their_order():
+    post = make_table("post")
+    add_title = AddColumnOperation(post, SQLite3Typing.Column("title", "TEXT"))
+    delete_id = DeleteColumnOperation(post, post.columns[0])
+    add_body = AddColumnOperation(post, SQLite3Typing.Column("body", "TEXT"))
+
+    assert OperationPlanner.plan_waves([add_title, delete_id, add_body]) == [
+        [add_title],
+        [delete_id],
+        [add_body],
+    ]
+
+
+def test_tables_referencing_each_other_are_planned():
+    a = CreateTableOperation(make_table("a", ["b"]))
+    b = CreateTableOperation(make_table("b", ["a"]))
+    c_ = CreateTableOperation(make_table("c", ["a"]))
+
+    assert OperationPlanner.plan([c_, a, b]) == [a, c_, b]
@@ -0,0 +1,89 @@
+from typing import Iterator
+from skibidi_orm.migration_engine.adapters.sqlite3_typing import SQLite3Typing
+from skibidi_orm.migration_engine.adapters.database_objects import constraints as c
+from skibidi_orm.migration_engine.operations.column_operations import (
+    AddColumnOperation,
+    DeleteColumnOperation,
+)
+from skibidi_orm.migration_engine.operations.table_operations import (
+    CreateTableOperation,
+    DeleteTableOperation,
+    RenameTableOperation,
+)
+from skibidi_orm.migration_engine.state_manager.operation_stream import (
+    OperationStream,
+)
+from skibidi_orm.migration_engine.state_manager.state_manager import StateManager
+
+
+def make_table(
+    name: str, columns: list[str] = ["id"], references: list[str] = []
+) -> SQLite3Typing.Table:
+    return SQLite3Typing.Table(
+        name,
+        columns=[SQLite3Typing.Column(column, "INTEGER") for column in columns]
+        + [SQLite3Typing.Column(f"{r}_id", "INTEGER") for r in references],
+        table_constraints={
+            c.ForeignKeyConstraint(name, r, {f"{r}_id": "id"}) for r in references
+        },
+    )
+
+
+def test_stream_gives_the_same_operations_as_state_manager():
+    db_tables = [
+        make_table("account", ["id", "login", "email"]),
+        make_table("comment"),
+        make_table("post", ["id", "title"]),
+        make_table("tag", ["id", "label"]),
+    ]
+    schema_tables = [
+        make_table("comment", references=["post", "user"]),
+        make_table("post", ["id", "body"]),
+        make_table("user", ["id", "login", "email"]),
+        make_table("category"),
+    ]
+
+    streamed = list(OperationStream.operations(db_tables, schema_tables))
+    expected = StateManager(
+        db_tables, schema_tables
+    ).get_operations_transforming_database_schema_into_class_hierarchy_schema()
+
+    assert len(streamed) == len(expected)
+    assert all(operation in expected for operation in streamed)
+    assert isinstance(streamed[0], AddColumnOperation)  # comment is diffed first
+    assert isinstance(streamed[-1], CreateTableOperation)
+
+
+def test_tables_are_diffed_as_they_are_inspected():
+    inspected: list[str] = []
+
+    def db_tables() -> Iterator[SQLite3Typing.Table]:
+        for table in [make_table("post", ["id", "title"]), make_table("tag")]:
+            inspected.append(table.name)
+            yield table
+
+    batches = OperationStream.batches(
+        db_tables(), [make_table("post"), make_table("tag")]
+    )
+
+    assert next(batches) == [
+        DeleteColumnOperation(
+            make_table("post", ["id", "title"]),
+            SQLite3Typing.Column("title", "INTEGER"),
+        )
+    ]
+    assert inspected == ["post"]
+    assert list(batches) == []
+    assert inspected == ["post", "tag"]
+
+
+def test_renames_and_deletions_come_last():
+    db_tables = [make_table("account", ["id", "login"]), make_table("old")]
+    schema_tables = [make_table("user", ["id", "login"])]
+
+    assert list(OperationStream.batches(db_tables, schema_tables)) == [
+        [
+            RenameTableOperation(make_table("account", ["id", "login"]), "user"),
+            DeleteTableOperation(make_table("old")),
+        ]
+    ]
@@ -0,0 +1,53 @@
+from skibidi_orm.migration_engine.adapters.postgres_typing import PostgresTyping
+from skibidi_orm.migration_engine.adapters.database_objects import constraints as c
+from skibidi_orm.migration_engine.state_manager.sharded_state_manager import (
+    ShardedStateManager,
+)
+from skibidi_orm.migration_engine.state_manager.state_manager import StateManager
+
+
+def make_table(name: str, columns: list[str]) -> PostgresTyping.Table:
+    return PostgresTyping.Table(
+        name,
+        columns=[
+            PostgresTyping.Column(
+                column, "INTEGER", [c.NotNullConstraint(name, column)]
+            )
+            for column in columns
+        ],
+    )
+
+
+db_tables = [
+    make_table(f"table_{i}", ["id", "a", "b"] if i % 3 else ["id", "a"])
+    for i in range(30)
+] + [make_table("account", ["id", "login", "email"]), make_table("old", ["x"])]
+schema_tables = [
+    make_table(f"table_{i}", ["id", "a", "c"] if i % 2 else ["id", "a"])
+    for i in range(30)
+] + [make_table("user", ["id", "login", "email"]), make_table("new", ["y"])]
+
+
+def test_sharded_diff_gives_the_same_operations():
+    expected = StateManager(
+        db_tables, schema_tables
+    ).get_operations_transforming_database_schema_into_class_hierarchy_schema()
+    operations = ShardedStateManager(
+        db_tables, schema_tables, workers=1, shards=4
+    ).get_operations_transforming_database_schema_into_class_hierarchy_schema()
+
+    assert len(operations) == len(expected)
+    assert all(operation in expected for operation in operations)
+
+
+def test_sharded_diff_does_not_depend_on_the_workers():
+    operations = ShardedStateManager(
+        db_tables, schema_tables
+    ).get_operations_transforming_database_schema_into_class_hierarchy_schema()
+
+    assert (
+        ShardedStateManager(
+            db_tables, schema_tables, workers=2, shards=5
+        ).get_operations_transforming_database_schema_into_class_hierarchy_schema()
+        == operations
+    )
@@ -4,11 +4,17 @@ from skibidi_orm.migration_engine.adapters.sqlite3_typing import (
 from skibidi_orm.migration_engine.adapters.sqlite3_adapter import SQLite3Adapter
 from skibidi_orm.migration_engine.db_config.sqlite3_config import SQLite3Config
 from skibidi_orm.migration_engine.sql_executor.sqlite3_executor import SQLite3Executor
+from skibidi_orm.migration_engine.state_manager.state_manager import StateManager
+from skibidi_orm.migration_engine.state_manager.rename_detector import RenameDetector
 
 from skibidi_orm.migration_engine.adapters.database_objects import constraints as c
 from skibidi_orm.migration_engine.operations.column_operations import (
     AddColumnOperation,
     DeleteColumnOperation,
+    RenameColumnOperation,
+    AddConstraintOperation,
+    ChangeDataTypeOperation,
+    DeleteConstraintOperation,
 )
 from skibidi_orm.migration_engine.operations.table_operations import (
     CreateTableOperation,
@@ -22,6 +28,7 @@ from skibidi_orm.migration_engine.adapters.database_objects.migration_element im
 
 
 from pathlib import Path
+from typing import cast
 import pytest
 import sqlite3
 from ..sql_data import SQLite3TablesData
@@ -520,3 +527,183 @@ def test_add_column_and_delete_tabe_operation_needed(
     assert type(MigrationElement.operations[0]) == DeleteTableOperation
 
     assert len(MigrationElement.operations) == 2
+
+
+def make_table(name: str, columns: list[str], *, nullable: bool = True):
+    return SQLite3Typing.Table(
+        name=name,
+        columns=[
+            SQLite3Typing.Column(
+                name=column,
+                data_type="TEXT",
+                column_constraints=(
+                    [] if nullable else [c.NotNullConstraint(name, column)]
+                ),
+            )
+            for column in columns
+        ],
+    )
+
+
+def test_operations_of_large_schemas():
+    """Every kind of change should be found among thousands of unchanged tables"""
+    db_tables = [make_table(f"t{i}", ["a", "b", "c"]) for i in range(5000)]
+    db_tables += [make_table("old", ["x", "y"]), make_table("gone", ["z"])]
+    schema_tables = [make_table(f"t{i}", ["a", "b", "c"]) for i in range(5000)]
+    schema_tables[10] = make_table("t10", ["a", "b", "c", "d"])
+    schema_tables[20] = make_table("t20", ["a", "b"])
+    schema_tables[30] = make_table("t30", ["a", "b", "c"], nullable=False)
+    schema_tables += [make_table("renamed", ["y", "x"]), make_table("new", ["n"])]
+
+    operations = StateManager[SQLite3Typing.Table](
+        db_tables=db_tables, schema_tables=schema_tables
+    ).get_operations_transforming_database_schema_into_class_hierarchy_schema()
+
+    assert [(type(o), o.table.name) for o in operations] == [
+        (RenameTableOperation, "old"),
+        (DeleteTableOperation, "gone"),
+        (CreateTableOperation, "new"),
+        (AddConstraintOperation, "t30"),
+        (AddConstraintOperation, "t30"),
+        (AddConstraintOperation, "t30"),
+        (DeleteColumnOperation, "t20"),
+        (AddColumnOperation, "t10"),
+    ]
+    assert cast(RenameTableOperation, operations[0]).new_name == "renamed"
+
+
+def test_renamed_column_is_detected():
+    """A column replaced by one with a similar name and the same type is renamed"""
+    operations = StateManager[SQLite3Typing.Table](
+        db_tables=[make_table("users", ["id", "user_name"])],
+        schema_tables=[make_table("users", ["id", "username"])],
+        rename_detector=RenameDetector(detect_similar=True),
+    ).get_operations_transforming_database_schema_into_class_hierarchy_schema()
+
+    assert len(operations) == 1
+    operation = cast(RenameColumnOperation, operations[0])
+    assert isinstance(operation, RenameColumnOperation)
+    assert operation.column.name == "user_name"
+    assert operation.new_name == "username"
+
+
+def test_renamed_table_with_changed_columns():
+    """Column changes of a renamed table are made on the table under its new name"""
+    operations = StateManager[SQLite3Typing.Table](
+        db_tables=[make_table("users", ["id", "name", "email", "age"])],
+        schema_tables=[make_table("people", ["id", "name", "email", "phone"])],
+        rename_detector=RenameDetector(detect_similar=True),
+    ).get_operations_transforming_database_schema_into_class_hierarchy_schema()
+
+    assert [(type(o), o.table.name) for o in operations] == [
+        (RenameTableOperation, "users"),
+        (DeleteColumnOperation, "people"),
+        (AddColumnOperation, "people"),
+    ]
+    assert cast(RenameTableOperation, operations[0]).new_name == "people"
+
+
+def test_rename_detection_thresholds():
+    """Renames are not detected when the similarity is below the thresholds"""
+    operations = StateManager[SQLite3Typing.Table](
+        db_tables=[make_table("users", ["id", "user_name"])],
+        schema_tables=[make_table("people", ["id", "username"])],
+        rename_detector=RenameDetector(
+            table_threshold=1.0, column_threshold=1.0, detect_similar=True
+        ),
+    ).get_operations_transforming_database_schema_into_class_hierarchy_schema()
+
+    assert [(type(o), o.table.name) for o in operations] == [
+        (DeleteTableOperation, "users"),
+        (CreateTableOperation, "people"),
+    ]
+
+
+def test_table_renamed_with_its_columns():
+    """A table renamed together with some of its columns keeps its data"""
+    db_table = make_table("users", ["id", "user_name", "email"], nullable=False)
+    s_table = make_table("people", ["id", "username", "email"], nullable=False)
+    operations = StateManager[SQLite3Typing.Table](
+        db_tables=[db_table],
+        schema_tables=[s_table],
+        rename_detector=RenameDetector(detect_similar=True),
+    ).get_operations_transforming_database_schema_into_class_hierarchy_schema()
+
+    assert [type(o) for o in operations] == [
+        RenameTableOperation,
+        RenameColumnOperation,
+    ]
+    assert cast(RenameColumnOperation, operations[1]).new_name == "username"
+
+
+def test_unrelated_columns_are_not_renamed():
+    """Columns of the same type and constraints need similar names to be renamed"""
+    operations = StateManager[SQLite3Typing.Table](
+        db_tables=[make_table("users", ["id", "a"], nullable=False)],
+        schema_tables=[make_table("users", ["id", "b"], nullable=False)],
+        rename_detector=RenameDetector(detect_similar=True),
+    ).get_operations_transforming_database_schema_into_class_hierarchy_schema()
+
+    assert [type(o) for o in operations] == [DeleteColumnOperation, AddColumnOperation]
+
+
+def test_similar_renames_are_opt_in():
+    """By default only tables with the same columns are renamed"""
+    operations = StateManager[SQLite3Typing.Table](
+        db_tables=[make_table("users", ["id", "user_name"]), make_table("a", ["x"])],
+        schema_tables=[
+            make_table("people", ["id", "username"]),
+            make_table("b", ["x"]),
+        ],
+    ).get_operations_transforming_database_schema_into_class_hierarchy_schema()
+
+    assert [(type(o), o.table.name) for o in operations] == [
+        (DeleteTableOperation, "users"),
+        (RenameTableOperation, "a"),
+        (CreateTableOperation, "people"),
+    ]
+
+
+def test_changed_columns_are_altered():
+    """Columns with a changed data type or constraints are altered instead of recreated"""
+    db_table = SQLite3Typing.Table(
+        "users",
+        columns=[
+            SQLite3Typing.Column(
+                "id", "INTEGER", column_constraints=[c.UniqueConstraint("users", "id")]
+            ),
+            SQLite3Typing.Column("age", "TEXT"),
+        ],
+    )
+    schema_table = SQLite3Typing.Table(
+        "users",
+        columns=[
+            SQLite3Typing.Column(
+                "id", "INTEGER", column_constraints=[c.NotNullConstraint("users", "id")]
+            ),
+            SQLite3Typing.Column("age", "INTEGER"),
+        ],
+    )
+
+    operations = StateManager[SQLite3Typing.Table](
+        db_tables=[db_table], schema_tables=[schema_table]
+    ).get_operations_transforming_database_schema_into_class_hierarchy_schema()
+
+    assert [type(o) for o in operations] == [
+        DeleteConstraintOperation,
+        AddConstraintOperation,
+        ChangeDataTypeOperation,
+    ]
+    delete_unique, add_not_null, change_type = cast(
+        tuple[
+            DeleteConstraintOperation, AddConstraintOperation, ChangeDataTypeOperation
+        ],
+        operations,
+    )
+    assert delete_unique.constraint == c.UniqueConstraint("users", "id")
+    assert add_not_null.constraint == c.NotNullConstraint("users", "id")
+    # every operation sees the changes made by the previous ones
+    assert add_not_null.table.columns[0].column_constraints == []
+    assert change_type.column.name == "age"
+    assert change_type.new_dtype == "INTEGER"
+    assert change_type.table.columns[0] == schema_table.columns[0]
@@ -1,9 +1,23 @@
 import pathlib
+import pytest
+from skibidi_orm.migration_engine.db_config.postgres_config import PostgresConfig
 from skibidi_orm.migration_engine.db_config.sqlite3_config import SQLite3Config
+from skibidi_orm.migration_engine.db_inspectors.base_async_inspector import (
+    ExecutorBackedDbInspector,
+)
+from skibidi_orm.migration_engine.db_inspectors.postgres_inspector import (
+    PostgresInspector,
+)
+from skibidi_orm.migration_engine.db_inspectors.sqlite.async_sqlite3_inspector import (
+    AsyncSQLite3Inspector,
+)
 from skibidi_orm.migration_engine.db_inspectors.sqlite.sqlite3_inspector import (
     SQLite3Inspector,
 )
-from skibidi_orm.migration_engine.studio.utils.get_db_inspector import get_db_inspector
+from skibidi_orm.migration_engine.studio.utils.get_db_inspector import (
+    get_async_db_inspector,
+    get_db_inspector,
+)
 import py  # type: ignore
 
 
@@ -22,3 +36,23 @@ SQLite3Config(db_path="some/path/to/db.db")"""
         db_config=SQLite3Config(db_path="some/path/to/db.db")
     )
     assert isinstance(db_inspector, SQLite3Inspector)
+
+
+def test_get_async_db_inspector_sqlite3():
+    db_inspector = get_async_db_inspector(
+        db_config=SQLite3Config(db_path="some/path/to/db.db")
+    )
+    assert isinstance(db_inspector, AsyncSQLite3Inspector)
+
+
+def test_get_async_db_inspector_postgres_without_async_driver(
+    monkeypatch: pytest.MonkeyPatch,
+):
+    monkeypatch.setattr(PostgresConfig, "create_connection", lambda self: None)  # type: ignore
+    monkeypatch.setattr(PostgresConfig, "supports_async_connections", False)
+    db_config = PostgresConfig("db", "user", "password", "localhost", 5432)
+
+    db_inspector = get_async_db_inspector(db_config=db_config)
+
+    assert isinstance(db_inspector, ExecutorBackedDbInspector)
+    assert isinstance(db_inspector.inspector, PostgresInspector)
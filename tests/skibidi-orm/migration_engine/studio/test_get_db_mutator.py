@@ -1,10 +1,16 @@
 import pytest
+from skibidi_orm.migration_engine.data_mutator.async_sqlite3_data_mutator import (
+    AsyncSQLite3DataMutator,
+)
 from skibidi_orm.migration_engine.data_mutator.sqlite3_data_mutatorr import (
     SQLite3DataMutator,
 )
 from skibidi_orm.migration_engine.db_config.base_config import BaseDbConfig
 from skibidi_orm.migration_engine.db_config.sqlite3_config import SQLite3Config
-from skibidi_orm.migration_engine.studio.utils.get_db_seeder import get_db_mutator
+from skibidi_orm.migration_engine.studio.utils.get_db_seeder import (
+    get_async_db_mutator,
+    get_db_mutator,
+)
 
 
 def test_get_db_seeder_sqlite3_error_when_config_not_exists():
@@ -15,3 +21,10 @@ def test_get_db_seeder_sqlite3_error_when_config_not_exists():
 def test_get_db_seeder_sqlite3():
     seeder = get_db_mutator(db_config=SQLite3Config(db_path="some/path/to/db.db"))
     assert isinstance(seeder, SQLite3DataMutator)
+
+
+def test_get_async_db_mutator_sqlite3():
+    mutator = get_async_db_mutator(
+        db_config=SQLite3Config(db_path="some/path/to/db.db")
+    )
+    assert isinstance(mutator, AsyncSQLite3DataMutator)
@@ -2,12 +2,12 @@ import importlib
 
 from fastapi.testclient import TestClient
 import pytest
-from skibidi_orm.migration_engine.data_mutator.sqlite3_data_mutatorr import (
-    SQLite3DataMutator,
+from skibidi_orm.migration_engine.data_mutator.async_sqlite3_data_mutator import (
+    AsyncSQLite3DataMutator,
 )
 from skibidi_orm.migration_engine.db_config.sqlite3_config import SQLite3Config
-from skibidi_orm.migration_engine.db_inspectors.sqlite.sqlite3_inspector import (
-    SQLite3Inspector,
+from skibidi_orm.migration_engine.db_inspectors.sqlite.async_sqlite3_inspector import (
+    AsyncSQLite3Inspector,
 )
 from skibidi_orm.migration_engine.studio.server import app
 import pathlib
@@ -29,7 +29,7 @@ def test_GET_db(
     SQLite3Config(db_path=make_database)
     monkeypatch.setattr(
         "skibidi_orm.migration_engine.studio.server.db_inspector",
-        SQLite3Inspector(),
+        AsyncSQLite3Inspector(),
     )
     response = client.get("/db")
     assert response.status_code == 200
@@ -81,11 +81,11 @@ def test_POST_route_db_table_name_row_correct(
     SQLite3Config(db_path=make_database)
     monkeypatch.setattr(
         "skibidi_orm.migration_engine.studio.server.db_inspector",
-        SQLite3Inspector(),
+        AsyncSQLite3Inspector(),
     )
     monkeypatch.setattr(
         "skibidi_orm.migration_engine.studio.server.db_mutator",
-        SQLite3DataMutator(),
+        AsyncSQLite3DataMutator(),
     )
     response = client.post(
         "/db/users/row",
@@ -0,0 +1,82 @@
+from pathlib import Path
+import pytest
+
+from skibidi_orm.exceptions.migration_plan_exceptions import (
+    InvalidMigrationPlanError,
+    StaleMigrationPlanError,
+)
+from skibidi_orm.migration_engine.adapters.sqlite3_typing import SQLite3Typing
+from skibidi_orm.migration_engine.db_config.sqlite3_config import SQLite3Config
+from skibidi_orm.migration_engine.db_inspectors.sqlite.sqlite3_inspector import (
+    SQLite3Inspector,
+)
+from skibidi_orm.migration_engine.migration_plan import (
+    MigrationPlan,
+    get_database_inspector,
+)
+from skibidi_orm.migration_engine.operations.table_operations import (
+    CreateTableOperation,
+)
+from skibidi_orm.migration_engine.sql_executor.sqlite3_executor import SQLite3Executor
+
+table = SQLite3Typing.Table("users", columns=[SQLite3Typing.Column("id", "INTEGER")])
+
+
+@pytest.fixture
+def schema_file(tmp_path: Path) -> str:
+    path = tmp_path.joinpath("schema.py")
+    path.write_text("# the schema\n")
+    return str(path)
+
+
+def make_plan(schema_file: str) -> MigrationPlan:
+    return MigrationPlan.create(
+        get_database_inspector().get_schema_fingerprint(),
+        schema_file,
+        [CreateTableOperation(table)],  # type: ignore
+        [table],  # type: ignore
+    )
+
+
+def test_saved_plan_is_executed(make_database: str, schema_file: str, tmp_path: Path):
+    SQLite3Config(make_database)
+    plan_path = str(tmp_path.joinpath("migration.plan"))
+    make_plan(schema_file).save(plan_path)
+
+    plan = MigrationPlan.load(plan_path)
+    assert plan.operations == [CreateTableOperation(table)]
+    plan.execute(schema_file)
+
+    assert SQLite3Inspector().get_tables() == [table]
+
+
+def test_plan_refuses_to_run_on_changed_database(make_database: str, schema_file: str):
+    SQLite3Config(make_database)
+    plan = make_plan(schema_file)
+    SQLite3Executor.execute_sql("CREATE TABLE posts (id INTEGER);")
+
+    with pytest.raises(StaleMigrationPlanError):
+        plan.execute(schema_file)
+    assert SQLite3Inspector().get_tables_names() == ["posts"]
+
+
+def test_plan_refuses_to_run_with_changed_schema_file(
+    make_database: str, schema_file: str
+):
+    SQLite3Config(make_database)
+    plan = make_plan(schema_file)
+    with open(schema_file, "a") as file:
+        file.write("# changed\n")
+
+    with pytest.raises(StaleMigrationPlanError):
+        plan.execute(schema_file)
+
+
+def test_invalid_plan_file_is_rejected(tmp_path: Path):
+    path = tmp_path.joinpath("migration.plan")
+    path.write_text("not a plan")
+
+    with pytest.raises(InvalidMigrationPlanError):
+        MigrationPlan.load(str(path))
+    with pytest.raises(InvalidMigrationPlanError):
+        MigrationPlan.load(str(tmp_path.joinpath("missing.plan")))
@@ -1,3 +1,4 @@
+import sqlite3
 from skibidi_orm.migration_engine.adapters.sqlite3_typing import (
     SQLite3Typing,
 )
@@ -502,3 +503,87 @@ def test_add_column_to_database_and_remove_table_from_database(make_database: st
     assert tables[1].columns[2].column_constraints == [
         c.NotNullConstraint("Post", "post_content")
     ]
+
+
+def test_excluded_tables_are_not_dropped(make_database: str):
+    SQLite3Config(make_database, exclude_tables=["Comm*"])
+    SQLite3Executor.execute_sql(SQLite3TablesData.sql_table_user)
+    SQLite3Executor.execute_sql(SQLite3TablesData.sql_table_post)
+    SQLite3Executor.execute_sql(SQLite3TablesData.sql_table_comment)
+
+    class Table(MigrationElement):
+
+        def __init__(self) -> None:
+            self.adapter = SQLite3Adapter()
+
+            models = Table.__subclasses__()
+            if self.__class__ == Table:
+                for cls in models:
+                    self.adapter.create_table(cls.__dict__["table"])
+
+    class User(Table):  # type: ignore
+        columns = [
+            SQLite3Typing.Column(
+                name="user_id",
+                data_type="INTEGER",
+                column_constraints=[c.PrimaryKeyConstraint("User", "user_id")],
+            ),
+            SQLite3Typing.Column(
+                name="user_name",
+                data_type="TEXT",
+                column_constraints=[c.NotNullConstraint("User", "user_name")],
+            ),
+        ]
+
+        table = SQLite3Typing.Table(name="User", columns=columns)
+
+    m = MigrationElement()
+    m.migrate()
+
+    with sqlite3.connect(make_database) as conn:
+        tables_names = {
+            row[0]
+            for row in conn.execute("SELECT name FROM sqlite_master WHERE type='table'")
+        }
+
+    assert {"User", "Comment"} <= tables_names
+    assert "Post" not in tables_names
+
+
+def test_altered_column_keeps_data(make_database: str):
+    SQLite3Config(make_database)
+    SQLite3Executor.execute_sql(SQLite3TablesData.sql_table_user)
+    SQLite3Executor.execute_sql(
+        "INSERT INTO User (user_id, user_name) VALUES (1, 'a');"
+    )
+
+    class Table(MigrationElement):
+
+        def __init__(self) -> None:
+            self.adapter = SQLite3Adapter()
+
+            models = Table.__subclasses__()
+            if self.__class__ == Table:
+                for cls in models:
+                    self.adapter.create_table(cls.__dict__["table"])
+
+    class User(Table):  # type: ignore
+        columns = [
+            SQLite3Typing.Column(
+                name="user_id",
+                data_type="INTEGER",
+                column_constraints=[c.PrimaryKeyConstraint("User", "user_id")],
+            ),
+            SQLite3Typing.Column(name="user_name", data_type="TEXT"),
+        ]
+
+        table = SQLite3Typing.Table(name="User", columns=columns)
+
+    # migrate only the tables of this test, not the ones left behind by the others
+    Table().adapter.execute_migration()
+
+    with sqlite3.connect(make_database) as conn:
+        assert conn.execute("SELECT user_id, user_name FROM User").fetchall() == [
+            (1, "a")
+        ]
+        assert conn.execute("PRAGMA table_info(User)").fetchall()[1][3] == 0